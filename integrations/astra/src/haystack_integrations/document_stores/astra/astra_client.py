@@ -1,10 +1,11 @@
 import json
-from typing import Dict, List, Optional, Union
+from typing import Dict, List, Optional, Set, Union
 from warnings import warn
 
 from astrapy import DataAPIClient as AstraDBClient
 from astrapy.constants import ReturnDocument
 from astrapy.exceptions import CollectionAlreadyExistsException
+from astrapy.operations import ReplaceOne
 from haystack import logging
 from haystack.version import __version__ as integration_version
 from pydantic.dataclasses import dataclass
@@ -277,6 +278,24 @@ class AstraClient:
 
         return formatted_docs
 
+    def find_existing_ids(self, ids: List[str], batch_size: int = 100) -> Set[str]:
+        """
+        Find which of the given ids belong to documents in the Astra index.
+
+        :param ids: a list of document ids
+        :param batch_size: the number of ids looked up in a single `$in` query
+        :returns: the ids of the documents found in the index
+        """
+        existing_ids: Set[str] = set()
+        for i in range(0, len(ids), batch_size):
+            find_cursor = self._astra_db_collection.find(
+                filter={"_id": {"$in": ids[i : i + batch_size]}},
+                projection={"_id": 1},
+            )
+            existing_ids.update(str(result["_id"]) for result in find_cursor)
+
+        return existing_ids
+
     def insert(self, documents: List[Dict]):
         """
         Insert documents into the Astra index.
@@ -289,6 +308,20 @@ class AstraClient:
 
         return inserted_ids
 
+    def upsert(self, documents: List[Dict]) -> int:
+        """
+        Insert documents into the Astra index, replacing the documents with the same ids.
+
+        :param documents: a list of documents to upsert
+        :returns: the number of documents inserted or replaced
+        """
+        bulk_write_result = self._astra_db_collection.bulk_write(
+            [ReplaceOne({"_id": document["_id"]}, document, upsert=True) for document in documents],
+            ordered=False,
+        )
+
+        return bulk_write_result.matched_count + bulk_write_result.upserted_count
+
     def update_document(self, document: Dict, id_key: str):
         """
         Update a document in the Astra index.
@@ -18,6 +18,9 @@ logger = logging.getLogger(__name__)
 
 MAX_BATCH_SIZE = 20
 
+# Maximum number of values the Data API accepts in an `$in` filter
+MAX_IN_FILTER_SIZE = 100
+
 
 def _batches(input_list, batch_size):
     input_length = len(input_list)
@@ -216,62 +219,42 @@ class AstraDocumentStore:
 
         documents_to_write = [_convert_input_document(doc) for doc in documents]
 
-        duplicate_documents = []
-        new_documents: List[Document] = []
-        i = 0
-        while i < len(documents_to_write):
-            doc = documents_to_write[i]
-            # check to see if this ID already exists in our new_documents array
-            exists = [d for d in new_documents if d["_id"] == doc["_id"]]
-            # check to see if this ID is already in the DB
-            response = self.index.find_documents({"filter": {"_id": doc["_id"]}})
-            if response or exists:
+        # keep a single document per ID: the first one, or the last one when overwriting
+        unique_documents: Dict[str, Dict[str, Any]] = {}
+        for doc in documents_to_write:
+            if doc["_id"] in unique_documents:
                 if policy == DuplicatePolicy.FAIL:
                     msg = f"ID '{doc['_id']}' already exists."
                     raise DuplicateDocumentError(msg)
-                duplicate_documents.append(doc)
-            else:
-                new_documents.append(doc)
-            i = i + 1
+                if policy == DuplicatePolicy.SKIP:
+                    continue
+            unique_documents[doc["_id"]] = doc
 
-        insertion_counter = 0
-        if policy == DuplicatePolicy.SKIP:
-            if len(new_documents) > 0:
-                for batch in _batches(new_documents, batch_size):
-                    inserted_ids = self.index.insert(batch)  # type: ignore
-                    insertion_counter += len(inserted_ids)
-                    logger.info(f"write_documents inserted documents with id {inserted_ids}")
-            else:
-                logger.warning("No documents written. Argument policy set to SKIP")
-
-        elif policy == DuplicatePolicy.OVERWRITE:
-            if len(new_documents) > 0:
-                for batch in _batches(new_documents, batch_size):
-                    inserted_ids = self.index.insert(batch)  # type: ignore
-                    insertion_counter += len(inserted_ids)
-                    logger.info(f"write_documents inserted documents with id {inserted_ids}")
-            else:
+        if policy == DuplicatePolicy.OVERWRITE:
+            # replacing with upsert writes new and existing documents alike, without looking them up first
+            if not unique_documents:
                 logger.warning("No documents written. Argument policy set to OVERWRITE")
+                return 0
+            upserted_count = 0
+            for batch in _batches(list(unique_documents.values()), batch_size):
+                upserted_count += self.index.upsert(batch)
+                logger.info(f"write_documents upserted documents with id {[doc['_id'] for doc in batch]}")
+            return upserted_count
+
+        existing_ids = self.index.find_existing_ids(list(unique_documents), batch_size=MAX_IN_FILTER_SIZE)
+        if existing_ids and policy == DuplicatePolicy.FAIL:
+            msg = f"IDs {sorted(existing_ids)} already exist."
+            raise DuplicateDocumentError(msg)
+        new_documents = [doc for doc_id, doc in unique_documents.items() if doc_id not in existing_ids]
 
-            if len(duplicate_documents) > 0:
-                updated_ids = []
-                for duplicate_doc in duplicate_documents:
-                    updated = self.index.update_document(duplicate_doc, "_id")  # type: ignore
-                    if updated:
-                        updated_ids.append(duplicate_doc["_id"])
-                insertion_counter = insertion_counter + len(updated_ids)
-                logger.info(f"write_documents updated documents with id {updated_ids}")
-            else:
-                logger.info("No documents updated. Argument policy set to OVERWRITE")
-
-        elif policy == DuplicatePolicy.FAIL:
-            if len(new_documents) > 0:
-                for batch in _batches(new_documents, batch_size):
-                    inserted_ids = self.index.insert(batch)  # type: ignore
-                    insertion_counter = insertion_counter + len(inserted_ids)
-                    logger.info(f"write_documents inserted documents with id {inserted_ids}")
-            else:
-                logger.warning("No documents written. Argument policy set to FAIL")
+        insertion_counter = 0
+        if len(new_documents) > 0:
+            for batch in _batches(new_documents, batch_size):
+                inserted_ids = self.index.insert(batch)  # type: ignore
+                insertion_counter += len(inserted_ids)
+                logger.info(f"write_documents inserted documents with id {inserted_ids}")
+        else:
+            logger.warning(f"No documents written. Argument policy set to {policy.name}")
 
         return insertion_counter
 
@@ -7,11 +7,12 @@ from unittest import mock
 
 import pytest
 from haystack import Document
-from haystack.document_stores.errors import MissingDocumentError
+from haystack.document_stores.errors import DuplicateDocumentError, MissingDocumentError
 from haystack.document_stores.types import DuplicatePolicy
 from haystack.testing.document_store import DocumentStoreBaseTests
 
 from haystack_integrations.document_stores.astra import AstraDocumentStore
+from haystack_integrations.document_stores.astra.astra_client import AstraClient
 
 
 @pytest.fixture
@@ -42,6 +43,80 @@ def test_to_dict(mock_auth):  # noqa
         }
 
 
+def test_write_documents_skip_checks_existing_ids_in_batches(mock_auth):  # noqa
+    ds = AstraDocumentStore()
+    ds._index = mock.MagicMock()
+    ds._index.find_existing_ids.return_value = {"2"}
+    ds._index.insert.side_effect = lambda batch: [doc["_id"] for doc in batch]
+    docs = [
+        Document(id="1", content="first"),
+        Document(id="2", content="existing"),
+        Document(id="1", content="duplicate in batch"),
+        Document(id="3", content="third"),
+    ]
+
+    assert ds.write_documents(docs, policy=DuplicatePolicy.SKIP) == 2
+
+    ds._index.find_existing_ids.assert_called_once_with(["1", "2", "3"], batch_size=100)
+    inserted = ds._index.insert.call_args.args[0]
+    assert [(doc["_id"], doc["content"]) for doc in inserted] == [("1", "first"), ("3", "third")]
+
+
+def test_write_documents_fail_on_duplicates(mock_auth):  # noqa
+    ds = AstraDocumentStore()
+    ds._index = mock.MagicMock()
+    ds._index.find_existing_ids.return_value = {"2"}
+
+    with pytest.raises(DuplicateDocumentError, match="'1'"):
+        ds.write_documents([Document(id="1"), Document(id="1")], policy=DuplicatePolicy.FAIL)
+    ds._index.find_existing_ids.assert_not_called()
+
+    with pytest.raises(DuplicateDocumentError, match="'2'"):
+        ds.write_documents([Document(id="1"), Document(id="2")], policy=DuplicatePolicy.FAIL)
+    ds._index.insert.assert_not_called()
+
+
+def test_write_documents_overwrite_upserts_without_lookup(mock_auth):  # noqa
+    ds = AstraDocumentStore()
+    ds._index = mock.MagicMock()
+    ds._index.upsert.side_effect = len
+    docs = [Document(id="1", content="old"), Document(id="2", content="other"), Document(id="1", content="new")]
+
+    assert ds.write_documents(docs, policy=DuplicatePolicy.OVERWRITE) == 2
+
+    ds._index.find_existing_ids.assert_not_called()
+    upserted = ds._index.upsert.call_args.args[0]
+    assert [(doc["_id"], doc["content"]) for doc in upserted] == [("1", "new"), ("2", "other")]
+
+    # the upserts are sent in batches of at most 20 documents
+    ds._index.upsert.reset_mock()
+    docs = [Document(id=str(i), content=f"doc {i}") for i in range(45)]
+    assert ds.write_documents(docs, policy=DuplicatePolicy.OVERWRITE) == 45
+    assert [len(call.args[0]) for call in ds._index.upsert.call_args_list] == [20, 20, 5]
+
+
+@mock.patch("haystack_integrations.document_stores.astra.astra_client.AstraDBClient")
+def test_astra_client_bulk_operations(_mock_client):
+    client = AstraClient("http://example.com", "test_token", "collection", 768, "cosine")
+    collection = client._astra_db_collection
+    collection.find.side_effect = [[{"_id": "1"}], [{"_id": "3"}]]
+
+    assert client.find_existing_ids(["1", "2", "3"], batch_size=2) == {"1", "3"}
+    assert [call.kwargs["filter"] for call in collection.find.call_args_list] == [
+        {"_id": {"$in": ["1", "2"]}},
+        {"_id": {"$in": ["3"]}},
+    ]
+
+    collection.bulk_write.return_value = mock.Mock(matched_count=1, upserted_count=1)
+    assert client.upsert([{"_id": "1", "content": "a"}, {"_id": "2", "content": "b"}]) == 2
+    operations = collection.bulk_write.call_args.args[0]
+    assert [(op.filter, op.replacement, op.upsert) for op in operations] == [
+        ({"_id": "1"}, {"_id": "1", "content": "a"}, True),
+        ({"_id": "2"}, {"_id": "2", "content": "b"}, True),
+    ]
+    assert collection.bulk_write.call_args.kwargs == {"ordered": False}
+
+
 @pytest.mark.integration
 @pytest.mark.skipif(
     os.environ.get("ASTRA_DB_APPLICATION_TOKEN", "") == "", reason="ASTRA_DB_APPLICATION_TOKEN env var not set"
@@ -90,6 +90,80 @@ class ChromaQueryTextRetriever:
         top_k = top_k or self.top_k
         return {"documents": self.document_store.search([query], top_k, filters)[0]}
 
+    @component.output_types(documents=List[Document])
+    async def run_async(
+        self,
+        query: str,
+        filters: Optional[Dict[str, Any]] = None,
+        top_k: Optional[int] = None,
+    ):
+        """
+        Asynchronously run the retriever on the given input data.
+
+        Asynchronous methods are only supported for HTTP connections of the `ChromaDocumentStore`.
+
+        :param query: The input data for the retriever. In this case, a plain-text query.
+        :param filters: Filters applied to the retrieved Documents. The way runtime filters are applied depends on
+                        the `filter_policy` chosen at retriever initialization. See init method docstring for more
+                        details.
+        :param top_k: The maximum number of documents to retrieve.
+            If not specified, the default value from the constructor is used.
+        :returns: A dictionary with the following keys:
+            - `documents`: List of documents returned by the search engine.
+        """
+        filters = apply_filter_policy(self.filter_policy, self.filters, filters)
+        top_k = top_k or self.top_k
+        return {"documents": (await self.document_store.search_async([query], top_k, filters))[0]}
+
+    def run_batch(
+        self,
+        queries: List[str],
+        filters: Optional[Dict[str, Any]] = None,
+        top_k: Optional[int] = None,
+    ) -> Dict[str, List[List[Document]]]:
+        """
+        Run the retriever on multiple queries at once.
+
+        All queries are sent to Chroma in a single `query` call.
+
+        :param queries: The plain-text queries.
+        :param filters: Filters applied to the retrieved Documents of every query. The way runtime filters are applied
+                        depends on the `filter_policy` chosen at retriever initialization. See init method docstring
+                        for more details.
+        :param top_k: The maximum number of documents to retrieve per query.
+            If not specified, the default value from the constructor is used.
+        :returns: A dictionary with the following keys:
+            - `documents`: One list of documents per query, in the same order as `queries`.
+        """
+        filters = apply_filter_policy(self.filter_policy, self.filters, filters)
+        top_k = top_k or self.top_k
+        return {"documents": self.document_store.search(queries, top_k, filters)}
+
+    async def run_batch_async(
+        self,
+        queries: List[str],
+        filters: Optional[Dict[str, Any]] = None,
+        top_k: Optional[int] = None,
+    ) -> Dict[str, List[List[Document]]]:
+        """
+        Asynchronously run the retriever on multiple queries at once.
+
+        All queries are sent to Chroma in a single `query` call.
+        Asynchronous methods are only supported for HTTP connections of the `ChromaDocumentStore`.
+
+        :param queries: The plain-text queries.
+        :param filters: Filters applied to the retrieved Documents of every query. The way runtime filters are applied
+                        depends on the `filter_policy` chosen at retriever initialization. See init method docstring
+                        for more details.
+        :param top_k: The maximum number of documents to retrieve per query.
+            If not specified, the default value from the constructor is used.
+        :returns: A dictionary with the following keys:
+            - `documents`: One list of documents per query, in the same order as `queries`.
+        """
+        filters = apply_filter_policy(self.filter_policy, self.filters, filters)
+        top_k = top_k or self.top_k
+        return {"documents": await self.document_store.search_async(queries, top_k, filters)}
+
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "ChromaQueryTextRetriever":
         """
@@ -157,3 +231,83 @@ class ChromaEmbeddingRetriever(ChromaQueryTextRetriever):
 
         query_embeddings = [query_embedding]
         return {"documents": self.document_store.search_embeddings(query_embeddings, top_k, filters)[0]}
+
+    @component.output_types(documents=List[Document])
+    async def run_async(
+        self,
+        query_embedding: List[float],
+        filters: Optional[Dict[str, Any]] = None,
+        top_k: Optional[int] = None,
+    ):
+        """
+        Asynchronously run the retriever on the given input data.
+
+        Asynchronous methods are only supported for HTTP connections of the `ChromaDocumentStore`.
+
+        :param query_embedding: the query embeddings.
+        :param filters: Filters applied to the retrieved Documents. The way runtime filters are applied depends on
+                        the `filter_policy` chosen at retriever initialization. See init method docstring for more
+                        details.
+        :param top_k: the maximum number of documents to retrieve.
+            If not specified, the default value from the constructor is used.
+
+        :returns: a dictionary with the following keys:
+            - `documents`: List of documents returned by the search engine.
+        """
+        filters = apply_filter_policy(self.filter_policy, self.filters, filters)
+
+        top_k = top_k or self.top_k
+
+        query_embeddings = [query_embedding]
+        return {"documents": (await self.document_store.search_embeddings_async(query_embeddings, top_k, filters))[0]}
+
+    def run_batch(  # type: ignore[override]
+        self,
+        query_embeddings: List[List[float]],
+        filters: Optional[Dict[str, Any]] = None,
+        top_k: Optional[int] = None,
+    ) -> Dict[str, List[List[Document]]]:
+        """
+        Run the retriever on multiple query embeddings at once.
+
+        All query embeddings are sent to Chroma in a single `query` call.
+
+        :param query_embeddings: the query embeddings.
+        :param filters: Filters applied to the retrieved Documents of every query. The way runtime filters are applied
+                        depends on the `filter_policy` chosen at retriever initialization. See init method docstring
+                        for more details.
+        :param top_k: the maximum number of documents to retrieve per query.
+            If not specified, the default value from the constructor is used.
+
+        :returns: a dictionary with the following keys:
+            - `documents`: One list of documents per query embedding, in the same order as `query_embeddings`.
+        """
+        filters = apply_filter_policy(self.filter_policy, self.filters, filters)
+        top_k = top_k or self.top_k
+        return {"documents": self.document_store.search_embeddings(query_embeddings, top_k, filters)}
+
+    async def run_batch_async(  # type: ignore[override]
+        self,
+        query_embeddings: List[List[float]],
+        filters: Optional[Dict[str, Any]] = None,
+        top_k: Optional[int] = None,
+    ) -> Dict[str, List[List[Document]]]:
+        """
+        Asynchronously run the retriever on multiple query embeddings at once.
+
+        All query embeddings are sent to Chroma in a single `query` call.
+        Asynchronous methods are only supported for HTTP connections of the `ChromaDocumentStore`.
+
+        :param query_embeddings: the query embeddings.
+        :param filters: Filters applied to the retrieved Documents of every query. The way runtime filters are applied
+                        depends on the `filter_policy` chosen at retriever initialization. See init method docstring
+                        for more details.
+        :param top_k: the maximum number of documents to retrieve per query.
+            If not specified, the default value from the constructor is used.
+
+        :returns: a dictionary with the following keys:
+            - `documents`: One list of documents per query embedding, in the same order as `query_embeddings`.
+        """
+        filters = apply_filter_policy(self.filter_policy, self.filters, filters)
+        top_k = top_k or self.top_k
+        return {"documents": await self.document_store.search_embeddings_async(query_embeddings, top_k, filters)}
@@ -2,12 +2,14 @@
 #
 # SPDX-License-Identifier: Apache-2.0
 
-from typing import Any, Dict, List, Literal, Optional
+from itertools import repeat
+from typing import Any, AsyncGenerator, Dict, Generator, Iterable, List, Literal, Optional
 
 import chromadb
 from chromadb.api.types import GetResult, QueryResult
 from haystack import default_from_dict, default_to_dict, logging
 from haystack.dataclasses import Document
+from haystack.document_stores.errors import DuplicateDocumentError
 from haystack.document_stores.types import DuplicatePolicy
 from numpy import ndarray
 
@@ -19,6 +21,8 @@ logger = logging.getLogger(__name__)
 
 VALID_DISTANCE_FUNCTIONS = "l2", "cosine", "ip"
 SUPPORTED_TYPES_FOR_METADATA_VALUES = str, int, float, bool
+VALID_INCLUDE_FIELDS = "documents", "metadatas", "embeddings"
+DEFAULT_FILTER_BATCH_SIZE = 1_000
 
 
 class ChromaDocumentStore:
@@ -83,12 +87,15 @@ class ChromaDocumentStore:
         self._distance_function = distance_function
         self._metadata = metadata
         self._collection = None
+        self._max_batch_size = -1
 
         self._persist_path = persist_path
         self._host = host
         self._port = port
 
         self._initialized = False
+        self._async_collection = None
+        self._async_initialized = False
 
     def _ensure_initialized(self):
         if not self._initialized:
@@ -113,19 +120,13 @@ class ChromaDocumentStore:
                 # Local persistent storage
                 client = chromadb.PersistentClient(path=self._persist_path)
 
-            self._metadata = self._metadata or {}
-            if "hnsw:space" not in self._metadata:
-                self._metadata["hnsw:space"] = self._distance_function
+            self._max_batch_size = client.get_max_batch_size()
+            self._prepare_collection_metadata()
 
             existing_collection_names = [c.name for c in client.list_collections()]
             if self._collection_name in existing_collection_names:
                 self._collection = client.get_collection(self._collection_name, embedding_function=self._embedding_func)
-
-                if self._metadata != self._collection.metadata:
-                    logger.warning(
-                        "Collection already exists. "
-                        "The `distance_function` and `metadata` parameters will be ignored."
-                    )
+                self._check_collection_metadata(self._collection.metadata)
             else:
                 self._collection = client.create_collection(
                     name=self._collection_name,
@@ -135,6 +136,50 @@ class ChromaDocumentStore:
 
             self._initialized = True
 
+    async def _ensure_initialized_async(self):
+        if not self._async_initialized:
+            # Only the HTTP client has an async counterpart in Chroma
+            if self._persist_path or not self._host or self._port is None:
+                error_message = (
+                    "Async support in ChromaDocumentStore is only available for remote HTTP client connections. "
+                    "You must specify `host` and `port` and not `persist_path`."
+                )
+                raise ValueError(error_message)
+
+            client = await chromadb.AsyncHttpClient(
+                host=self._host,
+                port=self._port,
+            )
+
+            self._max_batch_size = await client.get_max_batch_size()
+            self._prepare_collection_metadata()
+
+            existing_collection_names = [c.name for c in await client.list_collections()]
+            if self._collection_name in existing_collection_names:
+                self._async_collection = await client.get_collection(
+                    self._collection_name, embedding_function=self._embedding_func
+                )
+                self._check_collection_metadata(self._async_collection.metadata)
+            else:
+                self._async_collection = await client.create_collection(
+                    name=self._collection_name,
+                    metadata=self._metadata,
+                    embedding_function=self._embedding_func,
+                )
+
+            self._async_initialized = True
+
+    def _prepare_collection_metadata(self):
+        self._metadata = self._metadata or {}
+        if "hnsw:space" not in self._metadata:
+            self._metadata["hnsw:space"] = self._distance_function
+
+    def _check_collection_metadata(self, collection_metadata: Optional[Dict[str, Any]]):
+        if self._metadata != collection_metadata:
+            logger.warning(
+                "Collection already exists. The `distance_function` and `metadata` parameters will be ignored."
+            )
+
     def count_documents(self) -> int:
         """
         Returns how many documents are present in the document store.
@@ -145,6 +190,18 @@ class ChromaDocumentStore:
         assert self._collection is not None
         return self._collection.count()
 
+    async def count_documents_async(self) -> int:
+        """
+        Asynchronously returns how many documents are present in the document store.
+
+        Asynchronous methods are only supported for HTTP connections.
+
+        :returns: how many documents are present in the document store.
+        """
+        await self._ensure_initialized_async()
+        assert self._async_collection is not None
+        return await self._async_collection.count()
+
     def filter_documents(self, filters: Optional[Dict[str, Any]] = None) -> List[Document]:
         """
          Returns the documents that match the filters provided.
@@ -210,7 +267,107 @@ class ChromaDocumentStore:
         self._ensure_initialized()
         assert self._collection is not None
 
-        kwargs: Dict[str, Any] = {"include": ["embeddings", "documents", "metadatas"]}
+        result = self._collection.get(**self._prepare_get_kwargs(filters))
+
+        return self._get_result_to_documents(result)
+
+    async def filter_documents_async(self, filters: Optional[Dict[str, Any]] = None) -> List[Document]:
+        """
+        Asynchronously returns the documents that match the filters provided.
+
+        Asynchronous methods are only supported for HTTP connections.
+
+        Filters are defined and converted the same way as in `filter_documents`.
+
+        :param filters: the filters to apply to the document list.
+        :returns: a list of Documents that match the given filters.
+        """
+        await self._ensure_initialized_async()
+        assert self._async_collection is not None
+
+        result = await self._async_collection.get(**self._prepare_get_kwargs(filters))
+
+        return self._get_result_to_documents(result)
+
+    def filter_documents_iter(
+        self,
+        filters: Optional[Dict[str, Any]] = None,
+        *,
+        batch_size: int = DEFAULT_FILTER_BATCH_SIZE,
+        include: Optional[List[str]] = None,
+    ) -> Generator[Document, None, None]:
+        """
+        Lazily yields the documents that match the filters provided.
+
+        Documents are fetched from Chroma in pages of `batch_size` using `limit` and `offset`, so exporting a large
+        collection doesn't require holding all of it in memory. Pages are read independently: writing to the
+        collection while iterating can make documents be skipped or returned twice.
+
+        Filters are defined and converted the same way as in `filter_documents`.
+
+        :param filters: the filters to apply to the document list.
+        :param batch_size: number of documents fetched from Chroma per request.
+        :param include: the fields to fetch, among `"documents"`, `"metadatas"` and `"embeddings"`.
+            Fields that are not included are left empty in the returned Documents, for example pass
+            `["documents", "metadatas"]` to skip embeddings. By default all of them are fetched.
+        :returns: a generator of Documents that match the given filters.
+        """
+        self._ensure_initialized()
+        assert self._collection is not None
+
+        kwargs = self._prepare_get_kwargs(filters, include)
+        offset = 0
+        while True:
+            result = self._collection.get(limit=batch_size, offset=offset, **kwargs)
+            yield from self._get_result_to_documents(result)
+            if len(result["ids"]) < batch_size:
+                break
+            offset += batch_size
+
+    async def filter_documents_iter_async(
+        self,
+        filters: Optional[Dict[str, Any]] = None,
+        *,
+        batch_size: int = DEFAULT_FILTER_BATCH_SIZE,
+        include: Optional[List[str]] = None,
+    ) -> AsyncGenerator[Document, None]:
+        """
+        Asynchronously and lazily yields the documents that match the filters provided.
+
+        Asynchronous methods are only supported for HTTP connections.
+
+        Documents are fetched from Chroma in pages of `batch_size` using `limit` and `offset`, so exporting a large
+        collection doesn't require holding all of it in memory. Pages are read independently: writing to the
+        collection while iterating can make documents be skipped or returned twice.
+
+        :param filters: the filters to apply to the document list.
+        :param batch_size: number of documents fetched from Chroma per request.
+        :param include: the fields to fetch, among `"documents"`, `"metadatas"` and `"embeddings"`.
+            Fields that are not included are left empty in the returned Documents. By default all of them are fetched.
+        :returns: an async generator of Documents that match the given filters.
+        """
+        await self._ensure_initialized_async()
+        assert self._async_collection is not None
+
+        kwargs = self._prepare_get_kwargs(filters, include)
+        offset = 0
+        while True:
+            result = await self._async_collection.get(limit=batch_size, offset=offset, **kwargs)
+            for doc in self._get_result_to_documents(result):
+                yield doc
+            if len(result["ids"]) < batch_size:
+                break
+            offset += batch_size
+
+    @staticmethod
+    def _prepare_get_kwargs(filters: Optional[Dict[str, Any]], include: Optional[List[str]] = None) -> Dict[str, Any]:
+        if include is None:
+            include = ["embeddings", "documents", "metadatas"]
+        elif invalid_fields := [field for field in include if field not in VALID_INCLUDE_FIELDS]:
+            msg = f"Invalid include fields: {invalid_fields}. Valid options are: {VALID_INCLUDE_FIELDS}."
+            raise ValueError(msg)
+
+        kwargs: Dict[str, Any] = {"include": include}
 
         if filters:
             chroma_filter = _convert_filters(filters)
@@ -221,21 +378,27 @@ class ChromaDocumentStore:
             if chroma_filter.where_document:
                 kwargs["where_document"] = chroma_filter.where_document
 
-        result = self._collection.get(**kwargs)
-
-        return self._get_result_to_documents(result)
+        return kwargs
 
     def write_documents(self, documents: List[Document], policy: DuplicatePolicy = DuplicatePolicy.FAIL) -> int:
         """
         Writes (or overwrites) documents into the store.
 
+        Documents are sent to Chroma in batches, each one capped at the maximum batch size supported by the client.
+
         :param documents:
             A list of documents to write into the document store.
         :param policy:
-            Not supported at the moment.
+            The duplicate policy to use when writing documents.
+            - `DuplicatePolicy.OVERWRITE`: documents with an existing id are upserted.
+            - `DuplicatePolicy.SKIP`: documents with an existing id are ignored.
+            - `DuplicatePolicy.FAIL` or `DuplicatePolicy.NONE`: a `DuplicateDocumentError` is raised if any of the
+            documents already exists. Nothing is written in that case.
 
         :raises ValueError:
             When input is not valid.
+        :raises DuplicateDocumentError:
+            If `policy` is `DuplicatePolicy.FAIL` and a document with the same id already exists.
 
         :returns:
             The number of documents written
@@ -243,63 +406,216 @@ class ChromaDocumentStore:
         self._ensure_initialized()
         assert self._collection is not None
 
-        for doc in documents:
-            if not isinstance(doc, Document):
-                msg = "param 'documents' must contain a list of objects of type Document"
-                raise ValueError(msg)
+        if policy == DuplicatePolicy.NONE:
+            policy = DuplicatePolicy.FAIL
+
+        records = self._prepare_records(documents, policy)
+        if not records:
+            return 0
+
+        include = ["metadatas"] if policy == DuplicatePolicy.OVERWRITE else []
+        existing: Dict[str, Optional[Dict[str, Any]]] = {}
+        for ids in self._batch([record["id"] for record in records]):
+            existing.update(self._get_result_to_metadatas(self._collection.get(ids=ids, include=include)))
+        records = self._resolve_existing_records(records, existing, policy)
+
+        for batch in self._prepare_write_batches(records):
+            if policy == DuplicatePolicy.OVERWRITE:
+                self._collection.upsert(**batch)
+            else:
+                self._collection.add(**batch)
+
+        return len(records)
+
+    async def write_documents_async(
+        self, documents: List[Document], policy: DuplicatePolicy = DuplicatePolicy.FAIL
+    ) -> int:
+        """
+        Asynchronously writes (or overwrites) documents into the store.
+
+        Asynchronous methods are only supported for HTTP connections.
+
+        :param documents:
+            A list of documents to write into the document store.
+        :param policy:
+            The duplicate policy to use when writing documents. See `write_documents` for details.
+
+        :raises ValueError:
+            When input is not valid.
+        :raises DuplicateDocumentError:
+            If `policy` is `DuplicatePolicy.FAIL` and a document with the same id already exists.
+
+        :returns:
+            The number of documents written
+        """
+        await self._ensure_initialized_async()
+        assert self._async_collection is not None
+
+        if policy == DuplicatePolicy.NONE:
+            policy = DuplicatePolicy.FAIL
+
+        records = self._prepare_records(documents, policy)
+        if not records:
+            return 0
+
+        include = ["metadatas"] if policy == DuplicatePolicy.OVERWRITE else []
+        existing: Dict[str, Optional[Dict[str, Any]]] = {}
+        for ids in self._batch([record["id"] for record in records]):
+            existing.update(self._get_result_to_metadatas(await self._async_collection.get(ids=ids, include=include)))
+        records = self._resolve_existing_records(records, existing, policy)
+
+        for batch in self._prepare_write_batches(records):
+            if policy == DuplicatePolicy.OVERWRITE:
+                await self._async_collection.upsert(**batch)
+            else:
+                await self._async_collection.add(**batch)
+
+        return len(records)
+
+    @staticmethod
+    def _convert_document_to_record(doc: Document) -> Optional[Dict[str, Any]]:
+        """
+        Converts a Document into the fields stored by Chroma, warning about the ones that are not supported.
+
+        Returns `None` if the Document can't be stored.
+        """
+        if not isinstance(doc, Document):
+            msg = "param 'documents' must contain a list of objects of type Document"
+            raise ValueError(msg)
+
+        if doc.content is None:
+            logger.warning(
+                "ChromaDocumentStore cannot store documents with `content=None`. "
+                "Document with id {doc_id} will be skipped.",
+                doc_id=doc.id,
+            )
+            return None
+        elif hasattr(doc, "blob") and doc.blob is not None:
+            logger.warning(
+                "Document with id {doc_id} contains the `blob` field. "
+                "ChromaDocumentStore cannot store `blob` fields. "
+                "This field will be ignored.",
+                doc_id=doc.id,
+            )
+        record: Dict[str, Any] = {"id": doc.id, "document": doc.content, "metadata": None, "embedding": doc.embedding}
+
+        if doc.meta:
+            valid_meta = {}
+            discarded_keys = []
 
-            if doc.content is None:
+            for k, v in doc.meta.items():
+                if isinstance(v, SUPPORTED_TYPES_FOR_METADATA_VALUES):
+                    valid_meta[k] = v
+                else:
+                    discarded_keys.append(k)
+
+            if discarded_keys:
                 logger.warning(
-                    "ChromaDocumentStore cannot store documents with `content=None`. "
-                    "Document with id {doc_id} will be skipped.",
+                    "Document {doc_id} contains `meta` values of unsupported types for the keys: {keys}. "
+                    "These items will be discarded. Supported types are: {types}.",
                     doc_id=doc.id,
+                    keys=", ".join(discarded_keys),
+                    types=", ".join([t.__name__ for t in SUPPORTED_TYPES_FOR_METADATA_VALUES]),
                 )
+
+            if valid_meta:
+                record["metadata"] = valid_meta
+
+        if hasattr(doc, "sparse_embedding") and doc.sparse_embedding is not None:
+            logger.warning(
+                "Document {doc_id} has the `sparse_embedding` field set, "
+                "but storing sparse embeddings in Chroma is not currently supported. "
+                "The `sparse_embedding` field will be ignored.",
+                doc_id=doc.id,
+            )
+
+        return record
+
+    def _prepare_records(self, documents: List[Document], policy: DuplicatePolicy) -> List[Dict[str, Any]]:
+        """
+        Converts the Documents to write into Chroma records, resolving duplicated ids within the input itself.
+
+        With `DuplicatePolicy.OVERWRITE` the last Document with a given id wins, with `DuplicatePolicy.SKIP` the first
+        one does, while `DuplicatePolicy.FAIL` raises a `DuplicateDocumentError`.
+        """
+        records: Dict[str, Dict[str, Any]] = {}
+        for doc in documents:
+            record = self._convert_document_to_record(doc)
+            if record is None:
                 continue
-            elif hasattr(doc, "blob") and doc.blob is not None:
-                logger.warning(
-                    "Document with id {doc_id} contains the `blob` field. "
-                    "ChromaDocumentStore cannot store `blob` fields. "
-                    "This field will be ignored.",
-                    doc_id=doc.id,
-                )
-            data = {"ids": [doc.id], "documents": [doc.content]}
-
-            if doc.meta:
-                valid_meta = {}
-                discarded_keys = []
-
-                for k, v in doc.meta.items():
-                    if isinstance(v, SUPPORTED_TYPES_FOR_METADATA_VALUES):
-                        valid_meta[k] = v
-                    else:
-                        discarded_keys.append(k)
-
-                if discarded_keys:
-                    logger.warning(
-                        "Document {doc_id} contains `meta` values of unsupported types for the keys: {keys}. "
-                        "These items will be discarded. Supported types are: {types}.",
-                        doc_id=doc.id,
-                        keys=", ".join(discarded_keys),
-                        types=", ".join([t.__name__ for t in SUPPORTED_TYPES_FOR_METADATA_VALUES]),
-                    )
+            if record["id"] in records:
+                if policy == DuplicatePolicy.FAIL:
+                    msg = f"ID '{record['id']}' appears more than once in the documents to write."
+                    raise DuplicateDocumentError(msg)
+                if policy == DuplicatePolicy.SKIP:
+                    continue
+            records[record["id"]] = record
+        return list(records.values())
 
-                if valid_meta:
-                    data["metadatas"] = [valid_meta]
+    @staticmethod
+    def _get_result_to_metadatas(result: GetResult) -> Dict[str, Optional[Dict[str, Any]]]:
+        """
+        Maps the ids of a `collection.get` result to their metadata, or to `None` if metadata was not included.
+        """
+        metadatas: Iterable[Any] = result.get("metadatas") or repeat(None)
+        return dict(zip(result["ids"], metadatas))
 
-            if doc.embedding is not None:
-                data["embeddings"] = [doc.embedding]
+    @staticmethod
+    def _resolve_existing_records(
+        records: List[Dict[str, Any]], existing: Dict[str, Optional[Dict[str, Any]]], policy: DuplicatePolicy
+    ) -> List[Dict[str, Any]]:
+        """
+        Applies the duplicate policy to the records whose id already exists in the collection.
 
-            if hasattr(doc, "sparse_embedding") and doc.sparse_embedding is not None:
-                logger.warning(
-                    "Document {doc_id} has the `sparse_embedding` field set, "
-                    "but storing sparse embeddings in Chroma is not currently supported. "
-                    "The `sparse_embedding` field will be ignored.",
-                    doc_id=doc.id,
-                )
+        `DuplicatePolicy.FAIL` raises and `DuplicatePolicy.SKIP` drops those records. Since Chroma's `upsert` merges the
+        new metadata into the stored one, `DuplicatePolicy.OVERWRITE` sets the stale metadata keys to `None`, which
+        removes them.
+        """
+        if not existing:
+            return records
+        if policy == DuplicatePolicy.FAIL:
+            msg = f"IDs {sorted(existing)} already exist in the document store."
+            raise DuplicateDocumentError(msg)
+        if policy == DuplicatePolicy.SKIP:
+            return [record for record in records if record["id"] not in existing]
+
+        for record in records:
+            metadata = record["metadata"] or {}
+            stale_keys = set(existing.get(record["id"]) or {}) - set(metadata)
+            if stale_keys:
+                record["metadata"] = {**metadata, **dict.fromkeys(stale_keys)}
+        return records
+
+    def _batch(self, items: List[Any]) -> Generator[List[Any], None, None]:
+        """
+        Splits `items` in consecutive chunks no larger than the maximum batch size supported by the client.
+        """
+        batch_size = self._max_batch_size if self._max_batch_size > 0 else max(len(items), 1)
+        for i in range(0, len(items), batch_size):
+            yield items[i : i + batch_size]
 
-            self._collection.add(**data)
+    def _prepare_write_batches(self, records: List[Dict[str, Any]]) -> Generator[Dict[str, Any], None, None]:
+        """
+        Groups the records into the columnar batches expected by `collection.add` and `collection.upsert`.
 
-        return len(documents)
+        Chroma computes the embeddings of a batch only when none of them is provided, so records with and without an
+        embedding are sent in separate batches.
+        """
+        with_embedding = [record for record in records if record["embedding"] is not None]
+        without_embedding = [record for record in records if record["embedding"] is None]
+
+        for group in (with_embedding, without_embedding):
+            for chunk in self._batch(group):
+                batch: Dict[str, Any] = {
+                    "ids": [record["id"] for record in chunk],
+                    "documents": [record["document"] for record in chunk],
+                }
+                metadatas = [record["metadata"] for record in chunk]
+                if any(metadata is not None for metadata in metadatas):
+                    batch["metadatas"] = metadatas
+                if group is with_embedding:
+                    batch["embeddings"] = [record["embedding"] for record in chunk]
+                yield batch
 
     def delete_documents(self, document_ids: List[str]) -> None:
         """
@@ -312,6 +628,19 @@ class ChromaDocumentStore:
 
         self._collection.delete(ids=document_ids)
 
+    async def delete_documents_async(self, document_ids: List[str]) -> None:
+        """
+        Asynchronously deletes all documents with a matching document_ids from the document store.
+
+        Asynchronous methods are only supported for HTTP connections.
+
+        :param document_ids: the document ids to delete
+        """
+        await self._ensure_initialized_async()
+        assert self._async_collection is not None
+
+        await self._async_collection.delete(ids=document_ids)
+
     def search(self, queries: List[str], top_k: int, filters: Optional[Dict[str, Any]] = None) -> List[List[Document]]:
         """Search the documents in the store using the provided text queries.
 
@@ -323,21 +652,26 @@ class ChromaDocumentStore:
         self._ensure_initialized()
         assert self._collection is not None
 
-        if not filters:
-            results = self._collection.query(
-                query_texts=queries,
-                n_results=top_k,
-                include=["embeddings", "documents", "metadatas", "distances"],
-            )
-        else:
-            chroma_filters = _convert_filters(filters=filters)
-            results = self._collection.query(
-                query_texts=queries,
-                n_results=top_k,
-                where=chroma_filters.where,
-                where_document=chroma_filters.where_document,
-                include=["embeddings", "documents", "metadatas", "distances"],
-            )
+        results = self._collection.query(query_texts=queries, **self._prepare_query_kwargs(top_k, filters))
+
+        return self._query_result_to_documents(results)
+
+    async def search_async(
+        self, queries: List[str], top_k: int, filters: Optional[Dict[str, Any]] = None
+    ) -> List[List[Document]]:
+        """Asynchronously search the documents in the store using the provided text queries.
+
+        Asynchronous methods are only supported for HTTP connections.
+
+        :param queries: the list of queries to search for.
+        :param top_k: top_k documents to return for each query.
+        :param filters: a dictionary of filters to apply to the search. Accepts filters in haystack format.
+        :returns: matching documents for each query.
+        """
+        await self._ensure_initialized_async()
+        assert self._async_collection is not None
+
+        results = await self._async_collection.query(query_texts=queries, **self._prepare_query_kwargs(top_k, filters))
 
         return self._query_result_to_documents(results)
 
@@ -357,24 +691,50 @@ class ChromaDocumentStore:
         self._ensure_initialized()
         assert self._collection is not None
 
-        if not filters:
-            results = self._collection.query(
-                query_embeddings=query_embeddings,
-                n_results=top_k,
-                include=["embeddings", "documents", "metadatas", "distances"],
-            )
-        else:
-            chroma_filters = _convert_filters(filters=filters)
-            results = self._collection.query(
-                query_embeddings=query_embeddings,
-                n_results=top_k,
-                where=chroma_filters.where,
-                where_document=chroma_filters.where_document,
-                include=["embeddings", "documents", "metadatas", "distances"],
-            )
+        results = self._collection.query(
+            query_embeddings=query_embeddings, **self._prepare_query_kwargs(top_k, filters)
+        )
+
+        return self._query_result_to_documents(results)
+
+    async def search_embeddings_async(
+        self, query_embeddings: List[List[float]], top_k: int, filters: Optional[Dict[str, Any]] = None
+    ) -> List[List[Document]]:
+        """
+        Asynchronously perform vector search on the stored document, pass the embeddings of the queries instead of
+        their text.
+
+        Asynchronous methods are only supported for HTTP connections.
+
+        :param query_embeddings: a list of embeddings to use as queries.
+        :param top_k: the maximum number of documents to retrieve.
+        :param filters: a dictionary of filters to apply to the search. Accepts filters in haystack format.
+
+        :returns: a list of lists of documents that match the given filters.
+        """
+        await self._ensure_initialized_async()
+        assert self._async_collection is not None
+
+        results = await self._async_collection.query(
+            query_embeddings=query_embeddings, **self._prepare_query_kwargs(top_k, filters)
+        )
 
         return self._query_result_to_documents(results)
 
+    @staticmethod
+    def _prepare_query_kwargs(top_k: int, filters: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        kwargs: Dict[str, Any] = {
+            "n_results": top_k,
+            "include": ["embeddings", "documents", "metadatas", "distances"],
+        }
+
+        if filters:
+            chroma_filters = _convert_filters(filters=filters)
+            kwargs["where"] = chroma_filters.where
+            kwargs["where_document"] = chroma_filters.where_document
+
+        return kwargs
+
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "ChromaDocumentStore":
         """
@@ -409,64 +769,67 @@ class ChromaDocumentStore:
     def _get_result_to_documents(result: GetResult) -> List[Document]:
         """
         Helper function to convert Chroma results into Haystack Documents
-        """
-        retval = []
-        for i in range(len(result.get("documents", []))):
-            document_dict: Dict[str, Any] = {"id": result["ids"][i]}
 
-            result_documents = result.get("documents")
-            if result_documents:
-                document_dict["content"] = result_documents[i]
-
-            result_metadata = result.get("metadatas")
-            # Ensure metadata[i] is not None or don't add it to the document dict
-            if result_metadata and result_metadata[i]:
-                document_dict["meta"] = result_metadata[i]
-
-            result_embeddings = result.get("embeddings")
-            if result_embeddings is not None:
-                if isinstance(result_embeddings[i], ndarray):
-                    document_dict["embedding"] = result_embeddings[i].tolist()
-                else:
-                    document_dict["embedding"] = result_embeddings[i]
-
-            retval.append(Document.from_dict(document_dict))
-
-        return retval
+        Only the fields included in the result are set on the Documents.
+        """
+        ids = result["ids"]
+        contents: Iterable[Any] = result.get("documents") or repeat(None)
+        metadatas: Iterable[Any] = result.get("metadatas") or repeat(None)
+        embeddings: Iterable[Any] = repeat(None)
+        if (result_embeddings := result.get("embeddings")) is not None:
+            embeddings = result_embeddings.tolist() if isinstance(result_embeddings, ndarray) else result_embeddings
+
+        return [
+            Document(
+                id=doc_id,
+                content=content,
+                # Ensure metadata is not None
+                meta=meta or {},
+                embedding=embedding.tolist() if isinstance(embedding, ndarray) else embedding,
+            )
+            for doc_id, content, meta, embedding in zip(ids, contents, metadatas, embeddings)
+        ]
 
     @staticmethod
     def _query_result_to_documents(result: QueryResult) -> List[List[Document]]:
         """
         Helper function to convert Chroma results into Haystack Documents
+
+        The results of each query are converted column by column: embeddings are turned into lists once per query
+        and the Documents are built directly, without going through `Document.from_dict` for every hit.
         """
         retval: List[List[Document]] = []
         documents = result.get("documents")
         if documents is None:
             return retval
 
-        for i, answers in enumerate(documents):
-            converted_answers = []
-            for j in range(len(answers)):
-                document_dict: Dict[str, Any] = {
-                    "id": result["ids"][i][j],
-                    "content": answers[j],
-                }
-
-                # prepare metadata
-                metadatas = result.get("metadatas")
-                try:
-                    if metadatas and metadatas[i][j] is not None:
-                        document_dict["meta"] = metadatas[i][j]
-                except IndexError:
-                    pass
-
-                if embeddings := result.get("embeddings"):
-                    document_dict["embedding"] = embeddings[i][j]
-
-                if distances := result.get("distances"):
-                    document_dict["score"] = distances[i][j]
-
-                converted_answers.append(Document.from_dict(document_dict))
-            retval.append(converted_answers)
+        ids = result["ids"]
+        metadatas: Iterable[Any] = result.get("metadatas") or repeat(None)
+        embeddings: Iterable[Any] = repeat(None)
+        if (result_embeddings := result.get("embeddings")) is not None:
+            embeddings = (e.tolist() if isinstance(e, ndarray) else e for e in result_embeddings)
+        distances: Iterable[Any] = result.get("distances") or repeat(None)
+
+        for query_ids, query_documents, query_metadatas, query_embeddings, query_distances in zip(
+            ids, documents, metadatas, embeddings, distances
+        ):
+            retval.append(
+                [
+                    Document(
+                        id=doc_id,
+                        content=content,
+                        meta=meta or {},
+                        embedding=embedding.tolist() if isinstance(embedding, ndarray) else embedding,
+                        score=score,
+                    )
+                    for doc_id, content, meta, embedding, score in zip(
+                        query_ids,
+                        query_documents,
+                        query_metadatas or repeat(None),
+                        repeat(None) if query_embeddings is None else query_embeddings,
+                        query_distances or repeat(None),
+                    )
+                ]
+            )
 
         return retval
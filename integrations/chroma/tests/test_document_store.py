@@ -13,12 +13,15 @@ import numpy as np
 import pytest
 from chromadb.api.types import Documents, EmbeddingFunction, Embeddings
 from haystack.dataclasses import ByteStream, Document
+from haystack.document_stores.errors import DuplicateDocumentError
+from haystack.document_stores.types import DuplicatePolicy
 from haystack.testing.document_store import (
     TEST_EMBEDDING_1,
     TEST_EMBEDDING_2,
     CountDocumentsTest,
     DeleteDocumentsTest,
     FilterDocumentsTest,
+    WriteDocumentsTest,
     _random_embeddings,
 )
 
@@ -34,10 +37,10 @@ class _TestEmbeddingFunction(EmbeddingFunction):
 
     def __call__(self, input: Documents) -> Embeddings:  # noqa - chroma will inspect the signature, it must match
         # embed the documents somehow
-        return [np.random.default_rng().uniform(-1, 1, 768).tolist()]
+        return [np.random.default_rng().uniform(-1, 1, 768).tolist() for _ in input]
 
 
-class TestDocumentStore(CountDocumentsTest, DeleteDocumentsTest, FilterDocumentsTest):
+class TestDocumentStore(CountDocumentsTest, DeleteDocumentsTest, FilterDocumentsTest, WriteDocumentsTest):
     """
     Common test cases will be provided by `DocumentStoreBaseTests` but
     you can add more to this class.
@@ -212,6 +215,134 @@ class TestDocumentStore(CountDocumentsTest, DeleteDocumentsTest, FilterDocuments
         result_empty_filters = document_store.search(["Third"], filters={}, top_k=1)
         assert result == result_empty_filters
 
+    def test_write_documents(self, document_store: ChromaDocumentStore):
+        doc = Document(content="test doc")
+        assert document_store.write_documents([doc]) == 1
+        with pytest.raises(DuplicateDocumentError):
+            document_store.write_documents([doc])
+        self.assert_documents_are_equal(document_store.filter_documents(), [doc])
+
+    def test_write_documents_in_batches(self, document_store: ChromaDocumentStore):
+        document_store._ensure_initialized()
+        document_store._max_batch_size = 2
+        docs = [Document(content=f"doc {i}", embedding=TEST_EMBEDDING_1) for i in range(3)]
+        docs += [Document(content=f"doc without embedding {i}", meta={"i": i}) for i in range(2)]
+
+        with mock.patch.object(
+            document_store._collection, "add", wraps=document_store._collection.add
+        ) as add, mock.patch.object(document_store._collection, "get", wraps=document_store._collection.get) as get:
+            assert document_store.write_documents(docs) == 5
+
+        assert get.call_count == 3
+        assert get.call_args.kwargs["include"] == []
+        assert [len(call.kwargs["ids"]) for call in add.call_args_list] == [2, 1, 2]
+        assert "embeddings" in add.call_args_list[1].kwargs
+        assert "embeddings" not in add.call_args_list[2].kwargs
+        assert "metadatas" not in add.call_args_list[0].kwargs
+        self.assert_documents_are_equal(document_store.filter_documents(), docs)
+
+    def test_write_documents_duplicate_ids_in_input(self, document_store: ChromaDocumentStore):
+        doc1 = Document(id="1", content="test doc 1")
+        doc2 = Document(id="1", content="test doc 2")
+
+        with pytest.raises(DuplicateDocumentError):
+            document_store.write_documents([doc1, doc2], policy=DuplicatePolicy.FAIL)
+        assert document_store.count_documents() == 0
+
+        assert document_store.write_documents([doc1, doc2], policy=DuplicatePolicy.SKIP) == 1
+        self.assert_documents_are_equal(document_store.filter_documents(), [doc1])
+
+        assert document_store.write_documents([doc1, doc2], policy=DuplicatePolicy.OVERWRITE) == 1
+        self.assert_documents_are_equal(document_store.filter_documents(), [doc2])
+
+    def test_write_documents_duplicate_overwrite_replaces_meta(self, document_store: ChromaDocumentStore):
+        document_store.write_documents([Document(id="1", content="test doc", meta={"a": 1, "b": 2})])
+        document_store.write_documents([Document(id="2", content="other doc", meta={"a": 1})])
+
+        docs = [Document(id="1", content="updated doc", meta={"b": 3}), Document(id="2", content="updated doc")]
+        assert document_store.write_documents(docs, policy=DuplicatePolicy.OVERWRITE) == 2
+        self.assert_documents_are_equal(document_store.filter_documents(), docs)
+
+    def test_write_documents_duplicate_skip_mixed(self, document_store: ChromaDocumentStore):
+        docs = [Document(content=f"doc {i}") for i in range(3)]
+        document_store.write_documents(docs[:2])
+
+        assert document_store.write_documents(docs, policy=DuplicatePolicy.SKIP) == 1
+        assert document_store.count_documents() == 3
+
+    def test_filter_documents_iter(self, document_store: ChromaDocumentStore):
+        docs = [Document(content=f"doc {i}", meta={"number": i}, embedding=TEST_EMBEDDING_1) for i in range(5)]
+        document_store.write_documents(docs)
+        document_store.write_documents([Document(content="other doc", meta={"number": 10})])
+
+        with mock.patch.object(document_store._collection, "get", wraps=document_store._collection.get) as get:
+            iterator = document_store.filter_documents_iter(
+                filters={"field": "meta.number", "operator": "<", "value": 10}, batch_size=2
+            )
+            first = next(iterator)
+            assert get.call_count == 1
+            result = [first, *iterator]
+
+        assert [call.kwargs["offset"] for call in get.call_args_list] == [0, 2, 4]
+        assert all(call.kwargs["limit"] == 2 for call in get.call_args_list)
+        self.assert_documents_are_equal(result, docs)
+        assert result[0].embedding == pytest.approx(TEST_EMBEDDING_1)
+
+    def test_filter_documents_iter_include(self, document_store: ChromaDocumentStore):
+        doc = Document(content="test doc", meta={"number": 1}, embedding=TEST_EMBEDDING_1)
+        document_store.write_documents([doc])
+
+        result = list(document_store.filter_documents_iter(include=["documents", "metadatas"]))
+        assert result == [Document(id=doc.id, content="test doc", meta={"number": 1})]
+
+        result = list(document_store.filter_documents_iter(include=[]))
+        assert result == [Document(id=doc.id)]
+
+        with pytest.raises(ValueError):
+            list(document_store.filter_documents_iter(include=["distances"]))
+
+    def test_search_embeddings_multiple_queries(self, document_store: ChromaDocumentStore):
+        docs = [
+            Document(content="zeros doc", meta={"name": "zeros"}, embedding=TEST_EMBEDDING_1),
+            Document(content="ones doc", embedding=TEST_EMBEDDING_2),
+        ]
+        document_store.write_documents(docs)
+
+        result = document_store.search_embeddings([TEST_EMBEDDING_1, TEST_EMBEDDING_2], top_k=2)
+
+        assert len(result) == 2
+        assert [doc.content for doc in result[0]] == ["zeros doc", "ones doc"]
+        assert [doc.content for doc in result[1]] == ["ones doc", "zeros doc"]
+        assert result[0][0].meta == {"name": "zeros"}
+        assert result[0][1].meta == {}
+        assert result[1][0].embedding == pytest.approx(TEST_EMBEDDING_2)
+        assert isinstance(result[1][0].embedding, list)
+        assert result[0][0].score <= result[0][1].score
+
+    def test_query_result_to_documents(self):
+        result = {
+            "ids": [["1", "2"], []],
+            "documents": [["doc 1", "doc 2"], []],
+            "metadatas": [[{"a": 1}, None], []],
+            "embeddings": [np.array([[0.1, 0.2], [0.3, 0.4]]), np.empty((0, 2))],
+            "distances": [[0.5, 0.7], []],
+        }
+
+        documents = ChromaDocumentStore._query_result_to_documents(result)
+
+        assert documents == [
+            [
+                Document(id="1", content="doc 1", meta={"a": 1}, embedding=[0.1, 0.2], score=0.5),
+                Document(id="2", content="doc 2", embedding=[0.3, 0.4], score=0.7),
+            ],
+            [],
+        ]
+
+    def test_query_result_to_documents_without_optional_fields(self):
+        result = {"ids": [["1"]], "documents": [["doc 1"]], "metadatas": None, "embeddings": None, "distances": None}
+
+        assert ChromaDocumentStore._query_result_to_documents(result) == [[Document(id="1", content="doc 1")]]
+
     def test_write_documents_unsupported_meta_values(self, document_store: ChromaDocumentStore):
         """
         Unsupported meta values should be removed from the documents before writing them to the database
@@ -235,7 +366,7 @@ class TestDocumentStore(CountDocumentsTest, DeleteDocumentsTest, FilterDocuments
         assert written_docs[2].meta == {"ok": 123}
 
     def test_documents_with_content_none_are_not_stored(self, document_store: ChromaDocumentStore):
-        document_store.write_documents([Document(content=None)])
+        assert document_store.write_documents([Document(content=None)]) == 0
         assert document_store.filter_documents() == []
 
     def test_blob_not_stored(self, document_store: ChromaDocumentStore):
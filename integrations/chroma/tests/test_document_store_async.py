@@ -0,0 +1,128 @@
+# SPDX-FileCopyrightText: 2023-present deepset GmbH <info@deepset.ai>
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import operator
+import sys
+import uuid
+from typing import List
+from unittest import mock
+
+import pytest
+from haystack.dataclasses import Document
+from haystack.document_stores.errors import DuplicateDocumentError
+from haystack.document_stores.types import DuplicatePolicy
+from haystack.testing.document_store import TEST_EMBEDDING_1, TEST_EMBEDDING_2
+
+from haystack_integrations.document_stores.chroma import ChromaDocumentStore
+
+from .test_document_store import _TestEmbeddingFunction
+
+
+@pytest.mark.asyncio
+async def test_async_methods_require_http_connection():
+    store = ChromaDocumentStore()
+    with pytest.raises(ValueError):
+        await store.count_documents_async()
+
+
+@pytest.mark.integration
+@pytest.mark.skipif(
+    sys.platform == "win32",
+    reason="This test requires running the Chroma server. For simplicity, we don't run it on Windows.",
+)
+class TestDocumentStoreAsync:
+    @pytest.fixture
+    def document_store(self) -> ChromaDocumentStore:
+        with mock.patch(
+            "haystack_integrations.document_stores.chroma.document_store.get_embedding_function"
+        ) as get_func:
+            get_func.return_value = _TestEmbeddingFunction()
+            return ChromaDocumentStore(
+                embedding_function="test_function", collection_name=str(uuid.uuid1()), host="localhost", port=8000
+            )
+
+    @staticmethod
+    def assert_documents_are_equal(received: List[Document], expected: List[Document]):
+        received.sort(key=operator.attrgetter("id"))
+        expected.sort(key=operator.attrgetter("id"))
+
+        assert [doc.id for doc in received] == [doc.id for doc in expected]
+        for doc_received, doc_expected in zip(received, expected):
+            assert doc_received.content == doc_expected.content
+            assert doc_received.meta == doc_expected.meta
+
+    @pytest.mark.asyncio
+    async def test_write_documents_async(self, document_store: ChromaDocumentStore):
+        docs = [Document(content="test doc 1", meta={"i": 1}), Document(content="test doc 2")]
+        assert await document_store.write_documents_async(docs) == 2
+        assert await document_store.count_documents_async() == 2
+
+        with pytest.raises(DuplicateDocumentError):
+            await document_store.write_documents_async(docs)
+        assert await document_store.write_documents_async(docs, policy=DuplicatePolicy.SKIP) == 0
+
+        updated = Document(id=docs[0].id, content="updated doc")
+        assert await document_store.write_documents_async([updated], policy=DuplicatePolicy.OVERWRITE) == 1
+        self.assert_documents_are_equal(await document_store.filter_documents_async(), [updated, docs[1]])
+
+    @pytest.mark.asyncio
+    async def test_filter_documents_async(self, document_store: ChromaDocumentStore):
+        docs = [Document(content=f"doc {i}", meta={"number": i}) for i in range(5)]
+        await document_store.write_documents_async(docs)
+
+        result = await document_store.filter_documents_async(
+            filters={"field": "meta.number", "operator": ">=", "value": 3}
+        )
+        self.assert_documents_are_equal(result, docs[3:])
+
+    @pytest.mark.asyncio
+    async def test_filter_documents_iter_async(self, document_store: ChromaDocumentStore):
+        docs = [Document(content=f"doc {i}", meta={"number": i}, embedding=TEST_EMBEDDING_1) for i in range(5)]
+        await document_store.write_documents_async(docs)
+
+        result = [
+            doc
+            async for doc in document_store.filter_documents_iter_async(
+                filters={"field": "meta.number", "operator": ">=", "value": 1},
+                batch_size=2,
+                include=["documents", "metadatas"],
+            )
+        ]
+        self.assert_documents_are_equal(result, docs[1:])
+        assert all(doc.embedding is None for doc in result)
+
+    @pytest.mark.asyncio
+    async def test_delete_documents_async(self, document_store: ChromaDocumentStore):
+        doc = Document(content="test doc")
+        await document_store.write_documents_async([doc])
+        assert await document_store.count_documents_async() == 1
+
+        await document_store.delete_documents_async([doc.id])
+        assert await document_store.count_documents_async() == 0
+
+    @pytest.mark.asyncio
+    async def test_search_embeddings_async(self, document_store: ChromaDocumentStore):
+        docs = [
+            Document(content="zeros doc", meta={"name": "zeros"}, embedding=TEST_EMBEDDING_1),
+            Document(content="ones doc", meta={"name": "ones"}, embedding=TEST_EMBEDDING_2),
+        ]
+        await document_store.write_documents_async(docs)
+
+        result = await document_store.search_embeddings_async([TEST_EMBEDDING_2], top_k=1)
+        assert len(result) == 1
+        assert result[0][0].content == "ones doc"
+
+        result = await document_store.search_embeddings_async(
+            [TEST_EMBEDDING_2], top_k=2, filters={"field": "meta.name", "operator": "==", "value": "zeros"}
+        )
+        assert [doc.content for doc in result[0]] == ["zeros doc"]
+
+    @pytest.mark.asyncio
+    async def test_search_async(self, document_store: ChromaDocumentStore):
+        docs = [Document(content="First document"), Document(content="Second document")]
+        await document_store.write_documents_async(docs)
+
+        result = await document_store.search_async(["Second"], top_k=1)
+        assert len(result) == 1
+        assert len(result[0]) == 1
@@ -2,10 +2,13 @@
 #
 # SPDX-License-Identifier: Apache-2.0
 
+from unittest.mock import AsyncMock, Mock
+
 import pytest
+from haystack import Document
 from haystack.document_stores.types import FilterPolicy
 
-from haystack_integrations.components.retrievers.chroma import ChromaQueryTextRetriever
+from haystack_integrations.components.retrievers.chroma import ChromaEmbeddingRetriever, ChromaQueryTextRetriever
 from haystack_integrations.document_stores.chroma import ChromaDocumentStore
 
 
@@ -106,3 +109,65 @@ def test_retriever_from_json_no_filter_policy(request):
     assert retriever.filters == {"bar": "baz"}
     assert retriever.top_k == 42
     assert retriever.filter_policy == FilterPolicy.REPLACE  # default even if not specified
+
+
+@pytest.mark.asyncio
+async def test_query_text_retriever_run_async():
+    ds = Mock(spec=ChromaDocumentStore)
+    ds.search_async = AsyncMock(return_value=[[Document(content="test doc")]])
+    retriever = ChromaQueryTextRetriever(ds, filters={"field": "meta.a", "operator": "==", "value": 1}, top_k=3)
+
+    result = await retriever.run_async(query="test")
+
+    ds.search_async.assert_awaited_once_with(["test"], 3, {"field": "meta.a", "operator": "==", "value": 1})
+    assert result["documents"] == [Document(content="test doc")]
+
+
+@pytest.mark.asyncio
+async def test_embedding_retriever_run_async():
+    ds = Mock(spec=ChromaDocumentStore)
+    ds.search_embeddings_async = AsyncMock(return_value=[[Document(content="test doc")]])
+    retriever = ChromaEmbeddingRetriever(ds, top_k=3)
+
+    result = await retriever.run_async(query_embedding=[0.1, 0.2], top_k=5)
+
+    ds.search_embeddings_async.assert_awaited_once_with([[0.1, 0.2]], 5, {})
+    assert result["documents"] == [Document(content="test doc")]
+
+
+def test_query_text_retriever_run_batch():
+    ds = Mock(spec=ChromaDocumentStore)
+    ds.search.return_value = [[Document(content="doc 1")], [Document(content="doc 2")]]
+    retriever = ChromaQueryTextRetriever(ds, top_k=3)
+
+    result = retriever.run_batch(
+        queries=["query 1", "query 2"], filters={"field": "meta.a", "operator": "==", "value": 1}
+    )
+
+    ds.search.assert_called_once_with(["query 1", "query 2"], 3, {"field": "meta.a", "operator": "==", "value": 1})
+    assert result["documents"] == [[Document(content="doc 1")], [Document(content="doc 2")]]
+
+
+def test_embedding_retriever_run_batch():
+    ds = Mock(spec=ChromaDocumentStore)
+    ds.search_embeddings.return_value = [[Document(content="doc 1")], [Document(content="doc 2")]]
+    retriever = ChromaEmbeddingRetriever(ds, filters={"field": "meta.a", "operator": "==", "value": 1})
+
+    result = retriever.run_batch(query_embeddings=[[0.1, 0.2], [0.3, 0.4]], top_k=5)
+
+    ds.search_embeddings.assert_called_once_with(
+        [[0.1, 0.2], [0.3, 0.4]], 5, {"field": "meta.a", "operator": "==", "value": 1}
+    )
+    assert result["documents"] == [[Document(content="doc 1")], [Document(content="doc 2")]]
+
+
+@pytest.mark.asyncio
+async def test_embedding_retriever_run_batch_async():
+    ds = Mock(spec=ChromaDocumentStore)
+    ds.search_embeddings_async = AsyncMock(return_value=[[Document(content="doc 1")], [Document(content="doc 2")]])
+    retriever = ChromaEmbeddingRetriever(ds, top_k=3)
+
+    result = await retriever.run_batch_async(query_embeddings=[[0.1, 0.2], [0.3, 0.4]])
+
+    ds.search_embeddings_async.assert_awaited_once_with([[0.1, 0.2], [0.3, 0.4]], 3, {})
+    assert result["documents"] == [[Document(content="doc 1")], [Document(content="doc 2")]]
@@ -3,5 +3,6 @@
 # SPDX-License-Identifier: Apache-2.0
 from .bm25_retriever import ElasticsearchBM25Retriever
 from .embedding_retriever import ElasticsearchEmbeddingRetriever
+from .hybrid_retriever import ElasticsearchHybridRetriever
 
-__all__ = ["ElasticsearchBM25Retriever", "ElasticsearchEmbeddingRetriever"]
+__all__ = ["ElasticsearchBM25Retriever", "ElasticsearchEmbeddingRetriever", "ElasticsearchHybridRetriever"]
@@ -160,3 +160,55 @@ class ElasticsearchBM25Retriever:
             scale_score=self._scale_score,
         )
         return {"documents": docs}
+
+    def run_batch(
+        self, queries: List[str], filters: Optional[Dict[str, Any]] = None, top_k: Optional[int] = None
+    ) -> Dict[str, List[List[Document]]]:
+        """
+        Retrieve documents for multiple queries using the BM25 keyword-based algorithm.
+
+        All queries are sent to Elasticsearch in a single multi search request.
+
+        :param queries: Strings to search in the `Document`s text.
+        :param filters: Filters applied to the retrieved Documents of every query. The way runtime filters are applied
+                        depends on the `filter_policy` chosen at retriever initialization. See init method docstring
+                        for more details.
+        :param top_k: Maximum number of `Document` to return per query.
+        :returns: A dictionary with the following keys:
+            - `documents`: One list of `Document`s per query, in the same order as `queries`.
+        """
+        filters = apply_filter_policy(self._filter_policy, self._filters, filters)
+        docs = self._document_store._bm25_retrieval_batch(
+            queries=queries,
+            filters=filters,
+            fuzziness=self._fuzziness,
+            top_k=top_k or self._top_k,
+            scale_score=self._scale_score,
+        )
+        return {"documents": docs}
+
+    async def run_batch_async(
+        self, queries: List[str], filters: Optional[Dict[str, Any]] = None, top_k: Optional[int] = None
+    ) -> Dict[str, List[List[Document]]]:
+        """
+        Asynchronously retrieve documents for multiple queries using the BM25 keyword-based algorithm.
+
+        All queries are sent to Elasticsearch in a single multi search request.
+
+        :param queries: Strings to search in the `Document`s text.
+        :param filters: Filters applied to the retrieved Documents of every query. The way runtime filters are applied
+                        depends on the `filter_policy` chosen at retriever initialization. See init method docstring
+                        for more details.
+        :param top_k: Maximum number of `Document` to return per query.
+        :returns: A dictionary with the following keys:
+            - `documents`: One list of `Document`s per query, in the same order as `queries`.
+        """
+        filters = apply_filter_policy(self._filter_policy, self._filters, filters)
+        docs = await self._document_store._bm25_retrieval_batch_async(
+            queries=queries,
+            filters=filters,
+            fuzziness=self._fuzziness,
+            top_k=top_k or self._top_k,
+            scale_score=self._scale_score,
+        )
+        return {"documents": docs}
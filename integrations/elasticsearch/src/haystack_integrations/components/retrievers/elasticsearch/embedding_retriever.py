@@ -52,6 +52,7 @@ class ElasticsearchEmbeddingRetriever:
         filters: Optional[Dict[str, Any]] = None,
         top_k: int = 10,
         num_candidates: Optional[int] = None,
+        rescore_oversample: Optional[float] = None,
         filter_policy: Union[str, FilterPolicy] = FilterPolicy.REPLACE,
     ):
         """
@@ -65,6 +66,11 @@ class ElasticsearchEmbeddingRetriever:
             Increasing this value will improve search accuracy at the cost of slower search speeds.
             You can read more about it in the Elasticsearch
             [documentation](https://www.elastic.co/guide/en/elasticsearch/reference/current/knn-search.html#tune-approximate-knn-for-speed-accuracy)
+        :param rescore_oversample: Oversampling factor for quantized embedding fields, such as `int8_hnsw` or
+            `bbq_hnsw`. When set, `oversample * top_k` candidates are retrieved using the quantized vectors and
+            rescored with the original vectors, which recovers most of the accuracy lost by quantization.
+            You can read more about it in the Elasticsearch
+            [documentation](https://www.elastic.co/guide/en/elasticsearch/reference/current/knn-search.html#dense-vector-knn-search-rescoring)
         :param filter_policy: Policy to determine how filters are applied.
         :raises ValueError: If `document_store` is not an instance of ElasticsearchDocumentStore.
         """
@@ -76,6 +82,7 @@ class ElasticsearchEmbeddingRetriever:
         self._filters = filters or {}
         self._top_k = top_k
         self._num_candidates = num_candidates
+        self._rescore_oversample = rescore_oversample
         self._filter_policy = FilterPolicy.from_str(filter_policy) if isinstance(filter_policy, str) else filter_policy
 
     def to_dict(self) -> Dict[str, Any]:
@@ -90,6 +97,7 @@ class ElasticsearchEmbeddingRetriever:
             filters=self._filters,
             top_k=self._top_k,
             num_candidates=self._num_candidates,
+            rescore_oversample=self._rescore_oversample,
             filter_policy=self._filter_policy.value,
             document_store=self._document_store.to_dict(),
         )
@@ -133,6 +141,7 @@ class ElasticsearchEmbeddingRetriever:
             filters=filters,
             top_k=top_k or self._top_k,
             num_candidates=self._num_candidates,
+            rescore_oversample=self._rescore_oversample,
         )
         return {"documents": docs}
 
@@ -158,5 +167,62 @@ class ElasticsearchEmbeddingRetriever:
             filters=filters,
             top_k=top_k or self._top_k,
             num_candidates=self._num_candidates,
+            rescore_oversample=self._rescore_oversample,
+        )
+        return {"documents": docs}
+
+    def run_batch(
+        self,
+        query_embeddings: List[List[float]],
+        filters: Optional[Dict[str, Any]] = None,
+        top_k: Optional[int] = None,
+    ) -> Dict[str, List[List[Document]]]:
+        """
+        Retrieve documents for multiple query embeddings using a vector similarity metric.
+
+        All queries are sent to Elasticsearch in a single multi search request.
+
+        :param query_embeddings: Embeddings of the queries.
+        :param filters: Filters applied when fetching documents from the Document Store, for every query.
+            The way runtime filters are applied depends on the `filter_policy` selected when initializing the Retriever.
+        :param top_k: Maximum number of documents to return per query.
+        :returns: A dictionary with the following keys:
+            - `documents`: One list of `Document`s per query embedding, in the same order as `query_embeddings`.
+        """
+        filters = apply_filter_policy(self._filter_policy, self._filters, filters)
+        docs = self._document_store._embedding_retrieval_batch(
+            query_embeddings=query_embeddings,
+            filters=filters,
+            top_k=top_k or self._top_k,
+            num_candidates=self._num_candidates,
+            rescore_oversample=self._rescore_oversample,
+        )
+        return {"documents": docs}
+
+    async def run_batch_async(
+        self,
+        query_embeddings: List[List[float]],
+        filters: Optional[Dict[str, Any]] = None,
+        top_k: Optional[int] = None,
+    ) -> Dict[str, List[List[Document]]]:
+        """
+        Asynchronously retrieve documents for multiple query embeddings using a vector similarity metric.
+
+        All queries are sent to Elasticsearch in a single multi search request.
+
+        :param query_embeddings: Embeddings of the queries.
+        :param filters: Filters applied when fetching documents from the Document Store, for every query.
+            The way runtime filters are applied depends on the `filter_policy` selected when initializing the Retriever.
+        :param top_k: Maximum number of documents to return per query.
+        :returns: A dictionary with the following keys:
+            - `documents`: One list of `Document`s per query embedding, in the same order as `query_embeddings`.
+        """
+        filters = apply_filter_policy(self._filter_policy, self._filters, filters)
+        docs = await self._document_store._embedding_retrieval_batch_async(
+            query_embeddings=query_embeddings,
+            filters=filters,
+            top_k=top_k or self._top_k,
+            num_candidates=self._num_candidates,
+            rescore_oversample=self._rescore_oversample,
         )
         return {"documents": docs}
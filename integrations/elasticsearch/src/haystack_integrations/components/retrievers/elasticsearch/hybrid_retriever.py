@@ -0,0 +1,208 @@
+# SPDX-FileCopyrightText: 2023-present deepset GmbH <info@deepset.ai>
+#
+# SPDX-License-Identifier: Apache-2.0
+from typing import Any, Dict, List, Optional, Union
+
+from haystack import component, default_from_dict, default_to_dict
+from haystack.dataclasses import Document
+from haystack.document_stores.types import FilterPolicy
+from haystack.document_stores.types.filter_policy import apply_filter_policy
+
+from haystack_integrations.document_stores.elasticsearch.document_store import ElasticsearchDocumentStore
+
+
+@component
+class ElasticsearchHybridRetriever:
+    """
+    ElasticsearchHybridRetriever retrieves documents from the ElasticsearchDocumentStore combining BM25 and vector
+    similarity search in a single request.
+
+    By default the results of both searches are fused server-side with Reciprocal Rank Fusion, using the
+    [RRF retriever](https://www.elastic.co/guide/en/elasticsearch/reference/current/rrf.html) of Elasticsearch.
+    For clusters that don't support it, set `use_rrf=False` to send a combined `query` and `knn` request whose scores
+    are weighted by `bm25_boost` and `embedding_boost`.
+
+    Usage example:
+    ```python
+    from haystack import Document
+    from haystack.components.embedders import SentenceTransformersTextEmbedder
+    from haystack_integrations.document_stores.elasticsearch import ElasticsearchDocumentStore
+    from haystack_integrations.components.retrievers.elasticsearch import ElasticsearchHybridRetriever
+
+    document_store = ElasticsearchDocumentStore(hosts="http://localhost:9200")
+    retriever = ElasticsearchHybridRetriever(document_store=document_store)
+
+    # Add documents to DocumentStore
+    documents = [
+        Document(text="My name is Carla and I live in Berlin"),
+        Document(text="My name is Paul and I live in New York"),
+        Document(text="My name is Silvano and I live in Matera"),
+        Document(text="My name is Usagi Tsukino and I live in Tokyo"),
+    ]
+    document_store.write_documents(documents)
+
+    te = SentenceTransformersTextEmbedder()
+    te.warm_up()
+    query = "Who lives in Berlin?"
+    query_embedding = te.run(query)["embedding"]
+
+    result = retriever.run(query=query, query_embedding=query_embedding)
+    for doc in result["documents"]:
+        print(doc.content)
+    ```
+    """
+
+    def __init__(
+        self,
+        *,
+        document_store: ElasticsearchDocumentStore,
+        filters: Optional[Dict[str, Any]] = None,
+        fuzziness: str = "AUTO",
+        top_k: int = 10,
+        num_candidates: Optional[int] = None,
+        rank_window_size: Optional[int] = None,
+        rank_constant: int = 60,
+        use_rrf: bool = True,
+        bm25_boost: float = 1.0,
+        embedding_boost: float = 1.0,
+        filter_policy: Union[str, FilterPolicy] = FilterPolicy.REPLACE,
+    ):
+        """
+        Create the ElasticsearchHybridRetriever component.
+
+        :param document_store: An instance of ElasticsearchDocumentStore.
+        :param filters: Filters applied to the retrieved Documents. They are applied to both the BM25 and the
+            vector similarity search.
+        :param fuzziness: Fuzziness parameter passed to Elasticsearch for the BM25 search. See the official
+            [documentation](https://www.elastic.co/guide/en/elasticsearch/reference/current/common-options.html#fuzziness)
+            for more details.
+        :param top_k: Maximum number of Documents to return.
+        :param num_candidates: Number of approximate nearest neighbor candidates on each shard.
+            Defaults to 10 times the number of neighbours retrieved by the vector similarity search.
+        :param rank_window_size: Number of top documents of each search that are considered by the rank fusion.
+            Defaults to `top_k`, and values lower than `top_k` are raised to `top_k`.
+            Larger values improve relevance at the cost of performance.
+        :param rank_constant: Constant that determines how much influence documents in individual result sets per
+            query have over the final ranking. Only used when `use_rrf` is `True`.
+        :param use_rrf: Whether to fuse the results with the RRF retriever of Elasticsearch.
+            Set it to `False` for clusters that don't support the RRF retriever.
+        :param bm25_boost: Weight of the BM25 score. Only used when `use_rrf` is `False`.
+        :param embedding_boost: Weight of the vector similarity score. Only used when `use_rrf` is `False`.
+        :param filter_policy: Policy to determine how filters are applied.
+        :raises ValueError: If `document_store` is not an instance of ElasticsearchDocumentStore.
+        """
+        if not isinstance(document_store, ElasticsearchDocumentStore):
+            msg = "document_store must be an instance of ElasticsearchDocumentStore"
+            raise ValueError(msg)
+
+        self._document_store = document_store
+        self._filters = filters or {}
+        self._fuzziness = fuzziness
+        self._top_k = top_k
+        self._num_candidates = num_candidates
+        self._rank_window_size = rank_window_size
+        self._rank_constant = rank_constant
+        self._use_rrf = use_rrf
+        self._bm25_boost = bm25_boost
+        self._embedding_boost = embedding_boost
+        self._filter_policy = FilterPolicy.from_str(filter_policy) if isinstance(filter_policy, str) else filter_policy
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Serializes the component to a dictionary.
+
+        :returns:
+            Dictionary with serialized data.
+        """
+        return default_to_dict(
+            self,
+            filters=self._filters,
+            fuzziness=self._fuzziness,
+            top_k=self._top_k,
+            num_candidates=self._num_candidates,
+            rank_window_size=self._rank_window_size,
+            rank_constant=self._rank_constant,
+            use_rrf=self._use_rrf,
+            bm25_boost=self._bm25_boost,
+            embedding_boost=self._embedding_boost,
+            filter_policy=self._filter_policy.value,
+            document_store=self._document_store.to_dict(),
+        )
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "ElasticsearchHybridRetriever":
+        """
+        Deserializes the component from a dictionary.
+
+        :param data:
+            Dictionary to deserialize from.
+        :returns:
+            Deserialized component.
+        """
+        data["init_parameters"]["document_store"] = ElasticsearchDocumentStore.from_dict(
+            data["init_parameters"]["document_store"]
+        )
+        if filter_policy := data["init_parameters"].get("filter_policy"):
+            data["init_parameters"]["filter_policy"] = FilterPolicy.from_str(filter_policy)
+        return default_from_dict(cls, data)
+
+    def _retrieval_kwargs(self, filters: Optional[Dict[str, Any]], top_k: Optional[int]) -> Dict[str, Any]:
+        return {
+            "filters": apply_filter_policy(self._filter_policy, self._filters, filters),
+            "fuzziness": self._fuzziness,
+            "top_k": top_k or self._top_k,
+            "num_candidates": self._num_candidates,
+            "rank_window_size": self._rank_window_size,
+            "rank_constant": self._rank_constant,
+            "use_rrf": self._use_rrf,
+            "bm25_boost": self._bm25_boost,
+            "embedding_boost": self._embedding_boost,
+        }
+
+    @component.output_types(documents=List[Document])
+    def run(
+        self,
+        query: str,
+        query_embedding: List[float],
+        filters: Optional[Dict[str, Any]] = None,
+        top_k: Optional[int] = None,
+    ):
+        """
+        Retrieve documents combining BM25 and vector similarity search.
+
+        :param query: String to search in the `Document`s text.
+        :param query_embedding: Embedding of the query.
+        :param filters: Filters applied when fetching documents from the Document Store.
+            The way runtime filters are applied depends on the `filter_policy` selected when initializing the Retriever.
+        :param top_k: Maximum number of documents to return.
+        :returns: A dictionary with the following keys:
+            - `documents`: List of `Document`s that best match the query and the query embedding.
+        """
+        docs = self._document_store._hybrid_retrieval(
+            query=query, query_embedding=query_embedding, **self._retrieval_kwargs(filters, top_k)
+        )
+        return {"documents": docs}
+
+    @component.output_types(documents=List[Document])
+    async def run_async(
+        self,
+        query: str,
+        query_embedding: List[float],
+        filters: Optional[Dict[str, Any]] = None,
+        top_k: Optional[int] = None,
+    ):
+        """
+        Asynchronously retrieve documents combining BM25 and vector similarity search.
+
+        :param query: String to search in the `Document`s text.
+        :param query_embedding: Embedding of the query.
+        :param filters: Filters applied when fetching documents from the Document Store.
+            The way runtime filters are applied depends on the `filter_policy` selected when initializing the Retriever.
+        :param top_k: Maximum number of documents to return.
+        :returns: A dictionary with the following keys:
+            - `documents`: List of `Document`s that best match the query and the query embedding.
+        """
+        docs = await self._document_store._hybrid_retrieval_async(
+            query=query, query_embedding=query_embedding, **self._retrieval_kwargs(filters, top_k)
+        )
+        return {"documents": docs}
@@ -1,8 +1,9 @@
 # SPDX-FileCopyrightText: 2023-present deepset GmbH <info@deepset.ai>
 #
 # SPDX-License-Identifier: Apache-2.0
-from collections.abc import Mapping
-from typing import Any, Dict, List, Literal, Optional, Union
+from collections.abc import AsyncIterable, Iterable, Mapping
+from contextlib import asynccontextmanager, contextmanager
+from typing import Any, AsyncGenerator, Dict, Generator, List, Literal, Optional, Union
 
 import numpy as np
 
@@ -31,6 +32,21 @@ Hosts = Union[str, List[Union[str, Mapping[str, Union[str, int]], NodeConfig]]]
 # all be mapped to scores ~1.
 BM25_SCALING_FACTOR = 8
 DOC_ALREADY_EXISTS = 409
+DEFAULT_SCAN_BATCH_SIZE = 1_000
+# how long Elasticsearch keeps a point in time alive between two consecutive pages of a scan
+PIT_KEEP_ALIVE = "1m"
+DEFAULT_BULK_CHUNK_SIZE = 500
+DEFAULT_MAX_CHUNK_BYTES = 100 * 1024 * 1024
+SUPPORTED_EMBEDDING_INDEX_TYPES = [
+    "hnsw",
+    "int8_hnsw",
+    "int4_hnsw",
+    "bbq_hnsw",
+    "flat",
+    "int8_flat",
+    "int4_flat",
+    "bbq_flat",
+]
 
 
 class ElasticsearchDocumentStore:
@@ -66,6 +82,8 @@ class ElasticsearchDocumentStore:
         custom_mapping: Optional[Dict[str, Any]] = None,
         index: str = "default",
         embedding_similarity_function: Literal["cosine", "dot_product", "l2_norm", "max_inner_product"] = "cosine",
+        embedding_index_options: Optional[Dict[str, Any]] = None,
+        refresh: Union[bool, Literal["wait_for"]] = "wait_for",
         **kwargs,
     ):
         """
@@ -90,6 +108,18 @@ class ElasticsearchDocumentStore:
             To choose the most appropriate function, look for information about your embedding model.
             To understand how document scores are computed, see the Elasticsearch
             [documentation](https://www.elastic.co/guide/en/elasticsearch/reference/current/dense-vector.html#dense-vector-params)
+        :param embedding_index_options: The `index_options` of the embedding field, used to configure how vectors
+            are indexed and quantized. For example, `{"type": "int8_hnsw", "m": 16, "ef_construction": 100}`.
+            Supported types are `hnsw`, `int8_hnsw`, `int4_hnsw`, `bbq_hnsw` and their `flat` counterparts.
+            Quantized types reduce the memory needed by the vector index by 4x (`int8`), 8x (`int4`) or 32x (`bbq`).
+            This parameter only takes effect if the index does not yet exist and is created without `custom_mapping`.
+            For more information, see the Elasticsearch
+            [documentation](https://www.elastic.co/guide/en/elasticsearch/reference/current/dense-vector.html#dense-vector-index-options)
+        :param refresh: The refresh policy used when writing and deleting documents.
+            `"wait_for"` waits for the next scheduled refresh so changes are visible to searches once the call returns,
+            `True` forces an immediate refresh after each request, and `False` doesn't wait for a refresh at all,
+            which gives the highest ingestion throughput. For more information, see the Elasticsearch
+            [documentation](https://www.elastic.co/guide/en/elasticsearch/reference/current/docs-refresh.html)
         :param **kwargs: Optional arguments that `Elasticsearch` takes.
         """
         self._hosts = hosts
@@ -98,13 +128,23 @@ class ElasticsearchDocumentStore:
         self._index = index
         self._embedding_similarity_function = embedding_similarity_function
         self._custom_mapping = custom_mapping
+        self._embedding_index_options = embedding_index_options
+        self._refresh = refresh
         self._kwargs = kwargs
         self._initialized = False
+        self._bulk_loading = False
 
         if self._custom_mapping and not isinstance(self._custom_mapping, Dict):
             msg = "custom_mapping must be a dictionary"
             raise ValueError(msg)
 
+        if embedding_index_options and embedding_index_options.get("type") not in SUPPORTED_EMBEDDING_INDEX_TYPES:
+            msg = (
+                f"embedding_index_options must have a 'type' among {', '.join(SUPPORTED_EMBEDDING_INDEX_TYPES)}, "
+                f"got '{embedding_index_options.get('type')}'"
+            )
+            raise ValueError(msg)
+
     def _ensure_initialized(self):
         """
         Ensures both sync and async clients are initialized and the index exists.
@@ -154,6 +194,9 @@ class ElasticsearchDocumentStore:
                     ],
                 }
 
+                if self._embedding_index_options:
+                    mappings["properties"]["embedding"]["index_options"] = self._embedding_index_options
+
             # Create the index if it doesn't exist
             if not self._client.indices.exists(index=self._index):
                 self._client.indices.create(index=self._index, mappings=mappings)
@@ -192,6 +235,8 @@ class ElasticsearchDocumentStore:
             custom_mapping=self._custom_mapping,
             index=self._index,
             embedding_similarity_function=self._embedding_similarity_function,
+            embedding_index_options=self._embedding_index_options,
+            refresh=self._refresh,
             **self._kwargs,
         )
 
@@ -228,55 +273,144 @@ class ElasticsearchDocumentStore:
 
     def _search_documents(self, **kwargs) -> List[Document]:
         """
-        Calls the Elasticsearch client's search method and handles pagination.
+        Calls the Elasticsearch client's search method and returns the top hits as Documents.
         """
-        top_k = kwargs.get("size")
-        if top_k is None and "knn" in kwargs and "k" in kwargs["knn"]:
-            top_k = kwargs["knn"]["k"]
+        res = self.client.search(index=self._index, **self._prepare_search_kwargs(kwargs))
+        return [self._deserialize_document(hit) for hit in res["hits"]["hits"]]
 
-        documents: List[Document] = []
-        from_ = 0
-        # Handle pagination
-        while True:
-            res = self.client.search(
-                index=self._index,
-                from_=from_,
-                **kwargs,
-            )
+    async def _search_documents_async(self, **kwargs) -> List[Document]:
+        """
+        Asynchronously calls the Elasticsearch client's search method and returns the top hits as Documents.
+        """
+        res = await self._async_client.search(index=self._index, **self._prepare_search_kwargs(kwargs))  # type: ignore
+        return [self._deserialize_document(hit) for hit in res["hits"]["hits"]]
 
-            documents.extend(self._deserialize_document(hit) for hit in res["hits"]["hits"])  # type: ignore
-            from_ = len(documents)
+    @staticmethod
+    def _prepare_search_kwargs(kwargs: Dict[str, Any]) -> Dict[str, Any]:
+        # kNN searches return `size` hits (10 by default), so we make sure all `k` neighbours are returned at once
+        if "size" not in kwargs and "knn" in kwargs and "k" in kwargs["knn"]:
+            return {**kwargs, "size": kwargs["knn"]["k"]}
+        return kwargs
 
-            if top_k is not None and from_ >= top_k:
-                break
-            if from_ >= res["hits"]["total"]["value"]:
-                break
-        return documents
+    @staticmethod
+    def _prepare_msearch(bodies: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        # The multi search body alternates between a header and a search body. An empty header
+        # means that the search targets the index the msearch request was sent to.
+        searches: List[Dict[str, Any]] = []
+        for body in bodies:
+            searches.append({})
+            searches.append(ElasticsearchDocumentStore._prepare_search_kwargs(body))
+        return searches
+
+    def _deserialize_msearch_responses(self, responses: List[Dict[str, Any]]) -> List[List[Document]]:
+        results = []
+        for response in responses:
+            if "error" in response:
+                msg = f"Failed to search documents in Elasticsearch. Error:\n{response['error']}"
+                raise DocumentStoreError(msg)
+            results.append([self._deserialize_document(hit) for hit in response["hits"]["hits"]])
+        return results
 
-    async def _search_documents_async(self, **kwargs) -> List[Document]:
+    def _msearch_documents(self, bodies: List[Dict[str, Any]]) -> List[List[Document]]:
         """
-        Asynchronously calls the Elasticsearch client's search method and handles pagination.
+        Runs multiple searches in a single request with the Elasticsearch client's msearch method.
         """
-        top_k = kwargs.get("size")
-        if top_k is None and "knn" in kwargs and "k" in kwargs["knn"]:
-            top_k = kwargs["knn"]["k"]
+        if not bodies:
+            return []
+        res = self.client.msearch(index=self._index, searches=self._prepare_msearch(bodies))
+        return self._deserialize_msearch_responses(res["responses"])
 
-        documents: List[Document] = []
-        from_ = 0
+    async def _msearch_documents_async(self, bodies: List[Dict[str, Any]]) -> List[List[Document]]:
+        """
+        Asynchronously runs multiple searches in a single request with the Elasticsearch client's msearch method.
+        """
+        if not bodies:
+            return []
+        res = await self._async_client.msearch(  # type: ignore
+            index=self._index, searches=self._prepare_msearch(bodies)
+        )
+        return self._deserialize_msearch_responses(res["responses"])
 
-        # handle pagination
-        while True:
-            res = await self._async_client.search(index=self._index, from_=from_, **kwargs)  # type: ignore
-            documents.extend(self._deserialize_document(hit) for hit in res["hits"]["hits"])  # type: ignore
-            from_ = len(documents)
+    @staticmethod
+    def _prepare_scan_request(filters: Optional[Dict[str, Any]], batch_size: int) -> Dict[str, Any]:
+        if filters and "operator" not in filters and "conditions" not in filters:
+            msg = "Invalid filter syntax. See https://docs.haystack.deepset.ai/docs/metadata-filtering for details."
+            raise ValueError(msg)
 
-            if top_k is not None and from_ >= top_k:
-                break
+        # `_shard_doc` is the most efficient sort order to page through a point in time with `search_after`
+        body: Dict[str, Any] = {"size": batch_size, "sort": ["_shard_doc"], "track_total_hits": False}
+        if filters:
+            body["query"] = {"bool": {"filter": _normalize_filters(filters)}}
+        return body
 
-            if from_ >= res["hits"]["total"]["value"]:
-                break
+    def filter_documents_iter(
+        self, filters: Optional[Dict[str, Any]] = None, *, batch_size: int = DEFAULT_SCAN_BATCH_SIZE
+    ) -> Generator[Document, None, None]:
+        """
+        Lazily yields all documents that match the filters.
 
-        return documents
+        Documents are fetched in pages of `batch_size` from a point in time of the index using `search_after`,
+        so memory usage stays bounded and there is no limit on the number of documents that can be returned.
+
+        :param filters: A dictionary of filters to apply. For more information on the structure of the filters,
+            see the official Elasticsearch
+            [documentation](https://www.elastic.co/guide/en/elasticsearch/reference/current/query-dsl.html)
+        :param batch_size: Number of documents fetched from Elasticsearch per request.
+        :returns: A generator of `Document`s that match the filters.
+        """
+        body = self._prepare_scan_request(filters, batch_size)
+        self._ensure_initialized()
+
+        pit_id = self.client.open_point_in_time(index=self._index, keep_alive=PIT_KEEP_ALIVE)["id"]
+        try:
+            while True:
+                res = self.client.search(pit={"id": pit_id, "keep_alive": PIT_KEEP_ALIVE}, **body)
+                # the point in time id might change between requests, so we always use the most recent one
+                pit_id = res.get("pit_id", pit_id)
+                hits = res["hits"]["hits"]
+                for hit in hits:
+                    yield self._deserialize_document(hit)
+                if len(hits) < batch_size:
+                    break
+                body["search_after"] = hits[-1]["sort"]
+        finally:
+            self.client.close_point_in_time(id=pit_id)
+
+    async def filter_documents_iter_async(
+        self, filters: Optional[Dict[str, Any]] = None, *, batch_size: int = DEFAULT_SCAN_BATCH_SIZE
+    ) -> AsyncGenerator[Document, None]:
+        """
+        Asynchronously and lazily yields all documents that match the filters.
+
+        Documents are fetched in pages of `batch_size` from a point in time of the index using `search_after`,
+        so memory usage stays bounded and there is no limit on the number of documents that can be returned.
+
+        :param filters: A dictionary of filters to apply. For more information on the structure of the filters,
+            see the official Elasticsearch
+            [documentation](https://www.elastic.co/guide/en/elasticsearch/reference/current/query-dsl.html)
+        :param batch_size: Number of documents fetched from Elasticsearch per request.
+        :returns: An async generator of `Document`s that match the filters.
+        """
+        body = self._prepare_scan_request(filters, batch_size)
+        self._ensure_initialized()
+
+        pit = await self._async_client.open_point_in_time(index=self._index, keep_alive=PIT_KEEP_ALIVE)  # type: ignore
+        pit_id = pit["id"]
+        try:
+            while True:
+                res = await self._async_client.search(  # type: ignore
+                    pit={"id": pit_id, "keep_alive": PIT_KEEP_ALIVE}, **body
+                )
+                # the point in time id might change between requests, so we always use the most recent one
+                pit_id = res.get("pit_id", pit_id)
+                hits = res["hits"]["hits"]
+                for hit in hits:
+                    yield self._deserialize_document(hit)
+                if len(hits) < batch_size:
+                    break
+                body["search_after"] = hits[-1]["sort"]
+        finally:
+            await self._async_client.close_point_in_time(id=pit_id)  # type: ignore
 
     def filter_documents(self, filters: Optional[Dict[str, Any]] = None) -> List[Document]:
         """
@@ -287,14 +421,7 @@ class ElasticsearchDocumentStore:
             [documentation](https://www.elastic.co/guide/en/elasticsearch/reference/current/query-dsl.html)
         :returns: List of `Document`s that match the filters.
         """
-        if filters and "operator" not in filters and "conditions" not in filters:
-            msg = "Invalid filter syntax. See https://docs.haystack.deepset.ai/docs/metadata-filtering for details."
-            raise ValueError(msg)
-
-        self._ensure_initialized()
-        query = {"bool": {"filter": _normalize_filters(filters)}} if filters else None
-        documents = self._search_documents(query=query)
-        return documents
+        return list(self.filter_documents_iter(filters))
 
     async def filter_documents_async(self, filters: Optional[Dict[str, Any]] = None) -> List[Document]:
         """
@@ -305,14 +432,7 @@ class ElasticsearchDocumentStore:
             [documentation](https://www.elastic.co/guide/en/elasticsearch/reference/current/query-dsl.html)
         :returns: List of `Document`s that match the filters.
         """
-        if filters and "operator" not in filters and "conditions" not in filters:
-            msg = "Invalid filter syntax. See https://docs.haystack.deepset.ai/docs/metadata-filtering for details."
-            raise ValueError(msg)
-
-        self._ensure_initialized()
-        query = {"bool": {"filter": _normalize_filters(filters)}} if filters else None
-        documents = await self._search_documents_async(query=query)
-        return documents
+        return [doc async for doc in self.filter_documents_iter_async(filters)]
 
     @staticmethod
     def _deserialize_document(hit: Dict[str, Any]) -> Document:
@@ -330,6 +450,69 @@ class ElasticsearchDocumentStore:
 
         return Document.from_dict(data)
 
+    @staticmethod
+    def _prepare_bulk_action(doc: Document, op_type: str) -> Dict[str, Any]:
+        """
+        Creates a bulk action for the given `Document`.
+
+        :param doc: The `Document` to write.
+        :param op_type: The bulk operation type, either `index` or `create`.
+        :returns: The bulk action to send to Elasticsearch.
+        """
+        if not isinstance(doc, Document):
+            msg = "param 'documents' must contain a list of objects of type Document"
+            raise ValueError(msg)
+
+        doc_dict = doc.to_dict()
+
+        if "sparse_embedding" in doc_dict:
+            sparse_embedding = doc_dict.pop("sparse_embedding", None)
+            if sparse_embedding:
+                logger.warning(
+                    "Document {doc_id} has the `sparse_embedding` field set,"
+                    "but storing sparse embeddings in Elasticsearch is not currently supported."
+                    "The `sparse_embedding` field will be ignored.",
+                    doc_id=doc.id,
+                )
+        return {
+            "_op_type": op_type,
+            "_id": doc.id,
+            "_source": doc_dict,
+        }
+
+    @staticmethod
+    def _process_bulk_write_errors(errors: List[Dict[str, Any]], policy: DuplicatePolicy) -> None:
+        """
+        Raises the appropriate exception for the errors returned by a bulk write, taking the policy into account.
+        """
+        if not errors:
+            return
+
+        duplicate_errors_ids = []
+        other_errors = []
+        for e in errors:
+            error_type = e["create"]["error"]["type"] if "create" in e else None
+            if policy == DuplicatePolicy.FAIL and error_type == "version_conflict_engine_exception":
+                duplicate_errors_ids.append(e["create"]["_id"])
+            elif policy == DuplicatePolicy.SKIP and error_type == "version_conflict_engine_exception":
+                # when the policy is skip, duplication errors are OK and we should not raise an exception
+                continue
+            else:
+                other_errors.append(e)
+
+        if len(duplicate_errors_ids) > 0:
+            msg = f"IDs '{', '.join(duplicate_errors_ids)}' already exist in the document store."
+            raise DuplicateDocumentError(msg)
+
+        if len(other_errors) > 0:
+            msg = f"Failed to write documents to Elasticsearch. Errors:\n{other_errors}"
+            raise DocumentStoreError(msg)
+
+    @property
+    def _refresh_policy(self) -> Union[bool, str]:
+        # Waiting for a refresh while refreshes are disabled would block until the end of the bulk load
+        return False if self._bulk_loading else self._refresh
+
     def write_documents(self, documents: List[Document], policy: DuplicatePolicy = DuplicatePolicy.NONE) -> int:
         """
         Writes `Document`s to Elasticsearch.
@@ -352,55 +535,71 @@ class ElasticsearchDocumentStore:
 
         action = "index" if policy == DuplicatePolicy.OVERWRITE else "create"
 
-        elasticsearch_actions = []
-        for doc in documents:
-            doc_dict = doc.to_dict()
-
-            if "sparse_embedding" in doc_dict:
-                sparse_embedding = doc_dict.pop("sparse_embedding", None)
-                if sparse_embedding:
-                    logger.warning(
-                        "Document {doc_id} has the `sparse_embedding` field set,"
-                        "but storing sparse embeddings in Elasticsearch is not currently supported."
-                        "The `sparse_embedding` field will be ignored.",
-                        doc_id=doc.id,
-                    )
-            elasticsearch_actions.append(
-                {
-                    "_op_type": action,
-                    "_id": doc.id,
-                    "_source": doc_dict,
-                }
-            )
-
         documents_written, errors = helpers.bulk(
             client=self.client,
-            actions=elasticsearch_actions,
-            refresh="wait_for",
+            actions=(self._prepare_bulk_action(doc, action) for doc in documents),
+            refresh=self._refresh_policy,
             index=self._index,
             raise_on_error=False,
         )
+        self._process_bulk_write_errors(errors, policy)  # type: ignore[arg-type]
 
-        if errors:
-            duplicate_errors_ids = []
-            other_errors = []
-            for e in errors:
-                error_type = e["create"]["error"]["type"]
-                if policy == DuplicatePolicy.FAIL and error_type == "version_conflict_engine_exception":
-                    duplicate_errors_ids.append(e["create"]["_id"])
-                elif policy == DuplicatePolicy.SKIP and error_type == "version_conflict_engine_exception":
-                    # when the policy is skip, duplication errors are OK and we should not raise an exception
-                    continue
-                else:
-                    other_errors.append(e)
-
-            if len(duplicate_errors_ids) > 0:
-                msg = f"IDs '{', '.join(duplicate_errors_ids)}' already exist in the document store."
-                raise DuplicateDocumentError(msg)
-
-            if len(other_errors) > 0:
-                msg = f"Failed to write documents to Elasticsearch. Errors:\n{other_errors}"
-                raise DocumentStoreError(msg)
+        return documents_written
+
+    def write_documents_streaming(
+        self,
+        documents: Iterable[Document],
+        policy: DuplicatePolicy = DuplicatePolicy.NONE,
+        *,
+        chunk_size: int = DEFAULT_BULK_CHUNK_SIZE,
+        max_chunk_bytes: int = DEFAULT_MAX_CHUNK_BYTES,
+        thread_count: int = 1,
+    ) -> int:
+        """
+        Writes `Document`s from any iterable to Elasticsearch, without materializing them in memory.
+
+        Documents are consumed lazily and sent in chunks, so this method is suited for large ingestion jobs
+        that read documents from a generator. With `thread_count` greater than 1, chunks are sent in parallel.
+        Combine it with `bulk_load()` to disable index refreshes for the duration of a backfill.
+
+        :param documents: Iterable of Documents to write to the document store.
+        :param policy: DuplicatePolicy to apply when a document with the same ID already exists in the document store.
+        :param chunk_size: Maximum number of documents sent to Elasticsearch in a single bulk request.
+        :param max_chunk_bytes: Maximum size of a single bulk request in bytes.
+        :param thread_count: Number of threads used to send bulk requests in parallel.
+        :raises ValueError: If `documents` contains objects that are not `Document`s.
+        :raises DuplicateDocumentError: If a document with the same ID already exists in the document store and
+            `policy` is set to `DuplicatePolicy.FAIL` or `DuplicatePolicy.NONE`.
+        :raises DocumentStoreError: If an error occurs while writing the documents to the document store.
+        :returns: Number of documents written to the document store.
+        """
+        if policy == DuplicatePolicy.NONE:
+            policy = DuplicatePolicy.FAIL
+
+        action = "index" if policy == DuplicatePolicy.OVERWRITE else "create"
+        actions = (self._prepare_bulk_action(doc, action) for doc in documents)
+        bulk_kwargs: Dict[str, Any] = {
+            "client": self.client,
+            "actions": actions,
+            "chunk_size": chunk_size,
+            "max_chunk_bytes": max_chunk_bytes,
+            "refresh": self._refresh_policy,
+            "index": self._index,
+            "raise_on_error": False,
+        }
+        if thread_count > 1:
+            results = helpers.parallel_bulk(thread_count=thread_count, **bulk_kwargs)
+        else:
+            results = helpers.streaming_bulk(**bulk_kwargs)
+
+        documents_written = 0
+        errors = []
+        for ok, item in results:
+            if ok:
+                documents_written += 1
+            else:
+                errors.append(item)
+        self._process_bulk_write_errors(errors, policy)
 
         return documents_written
 
@@ -428,33 +627,14 @@ class ElasticsearchDocumentStore:
         if policy == DuplicatePolicy.NONE:
             policy = DuplicatePolicy.FAIL
 
-        actions = []
-        for doc in documents:
-            doc_dict = doc.to_dict()
-
-            if "sparse_embedding" in doc_dict:
-                sparse_embedding = doc_dict.pop("sparse_embedding", None)
-                if sparse_embedding:
-                    logger.warning(
-                        "Document {doc_id} has the `sparse_embedding` field set,"
-                        "but storing sparse embeddings in Elasticsearch is not currently supported."
-                        "The `sparse_embedding` field will be ignored.",
-                        doc_id=doc.id,
-                    )
-
-            action = {
-                "_op_type": "create" if policy == DuplicatePolicy.FAIL else "index",
-                "_id": doc.id,
-                "_source": doc_dict,
-            }
-            actions.append(action)
+        action = "create" if policy == DuplicatePolicy.FAIL else "index"
 
         try:
             success, failed = await helpers.async_bulk(
                 client=self._async_client,
-                actions=actions,
+                actions=(self._prepare_bulk_action(doc, action) for doc in documents),
                 index=self._index,
-                refresh=True,
+                refresh=self._refresh_policy,
                 raise_on_error=False,
             )
             if failed:
@@ -470,6 +650,130 @@ class ElasticsearchDocumentStore:
             msg = f"Failed to write documents to Elasticsearch: {e!s}"
             raise DocumentStoreError(msg) from e
 
+    async def write_documents_streaming_async(
+        self,
+        documents: Union[Iterable[Document], AsyncIterable[Document]],
+        policy: DuplicatePolicy = DuplicatePolicy.NONE,
+        *,
+        chunk_size: int = DEFAULT_BULK_CHUNK_SIZE,
+        max_chunk_bytes: int = DEFAULT_MAX_CHUNK_BYTES,
+    ) -> int:
+        """
+        Asynchronously writes `Document`s from any iterable or async iterable to Elasticsearch, without
+        materializing them in memory.
+
+        Documents are consumed lazily and sent in chunks, so this method is suited for large ingestion jobs.
+        Combine it with `bulk_load_async()` to disable index refreshes for the duration of a backfill.
+
+        :param documents: Iterable or async iterable of Documents to write to the document store.
+        :param policy: DuplicatePolicy to apply when a document with the same ID already exists in the document store.
+        :param chunk_size: Maximum number of documents sent to Elasticsearch in a single bulk request.
+        :param max_chunk_bytes: Maximum size of a single bulk request in bytes.
+        :raises ValueError: If `documents` contains objects that are not `Document`s.
+        :raises DuplicateDocumentError: If a document with the same ID already exists in the document store and
+            `policy` is set to `DuplicatePolicy.FAIL` or `DuplicatePolicy.NONE`.
+        :raises DocumentStoreError: If an error occurs while writing the documents to the document store.
+        :returns: Number of documents written to the document store.
+        """
+        self._ensure_initialized()
+
+        if policy == DuplicatePolicy.NONE:
+            policy = DuplicatePolicy.FAIL
+
+        action = "index" if policy == DuplicatePolicy.OVERWRITE else "create"
+
+        async def actions() -> AsyncGenerator[Dict[str, Any], None]:
+            if isinstance(documents, AsyncIterable):
+                async for doc in documents:
+                    yield self._prepare_bulk_action(doc, action)
+            else:
+                for doc in documents:
+                    yield self._prepare_bulk_action(doc, action)
+
+        documents_written = 0
+        errors = []
+        async for ok, item in helpers.async_streaming_bulk(
+            client=self._async_client,
+            actions=actions(),
+            chunk_size=chunk_size,
+            max_chunk_bytes=max_chunk_bytes,
+            refresh=self._refresh_policy,
+            index=self._index,
+            raise_on_error=False,
+        ):
+            if ok:
+                documents_written += 1
+            else:
+                errors.append(item)
+        self._process_bulk_write_errors(errors, policy)
+
+        return documents_written
+
+    @staticmethod
+    def _extract_refresh_interval(settings: Dict[str, Any], index: str) -> Optional[str]:
+        return settings.get(index, {}).get("settings", {}).get("index", {}).get("refresh_interval")
+
+    @contextmanager
+    def bulk_load(self) -> Generator[None, None, None]:
+        """
+        Context manager that disables index refreshes for the duration of a bulk load.
+
+        While the context is active, writes don't wait for refreshes and new documents are not visible to searches.
+        On exit the previous `refresh_interval` of the index is restored and the index is refreshed once.
+
+        Usage example:
+        ```python
+        with document_store.bulk_load():
+            document_store.write_documents_streaming(read_documents(), thread_count=4)
+        ```
+        """
+        self._ensure_initialized()
+
+        settings = self.client.indices.get_settings(index=self._index, name="index.refresh_interval")
+        previous_refresh_interval = self._extract_refresh_interval(settings.body, self._index)
+        self.client.indices.put_settings(index=self._index, settings={"index": {"refresh_interval": "-1"}})
+        self._bulk_loading = True
+        try:
+            yield
+        finally:
+            self._bulk_loading = False
+            # Setting the value to None resets it to the cluster default
+            self.client.indices.put_settings(
+                index=self._index, settings={"index": {"refresh_interval": previous_refresh_interval}}
+            )
+            self.client.indices.refresh(index=self._index)
+
+    @asynccontextmanager
+    async def bulk_load_async(self) -> AsyncGenerator[None, None]:
+        """
+        Async context manager that disables index refreshes for the duration of a bulk load.
+
+        While the context is active, writes don't wait for refreshes and new documents are not visible to searches.
+        On exit the previous `refresh_interval` of the index is restored and the index is refreshed once.
+
+        Usage example:
+        ```python
+        async with document_store.bulk_load_async():
+            await document_store.write_documents_streaming_async(read_documents())
+        ```
+        """
+        self._ensure_initialized()
+        indices = self._async_client.indices  # type: ignore
+
+        settings = await indices.get_settings(index=self._index, name="index.refresh_interval")
+        previous_refresh_interval = self._extract_refresh_interval(settings.body, self._index)
+        await indices.put_settings(index=self._index, settings={"index": {"refresh_interval": "-1"}})
+        self._bulk_loading = True
+        try:
+            yield
+        finally:
+            self._bulk_loading = False
+            # Setting the value to None resets it to the cluster default
+            await indices.put_settings(
+                index=self._index, settings={"index": {"refresh_interval": previous_refresh_interval}}
+            )
+            await indices.refresh(index=self._index)
+
     def delete_documents(self, document_ids: List[str]) -> None:
         """
         Deletes all documents with a matching document_ids from the document store.
@@ -479,7 +783,7 @@ class ElasticsearchDocumentStore:
         helpers.bulk(
             client=self.client,
             actions=({"_op_type": "delete", "_id": id_} for id_ in document_ids),
-            refresh="wait_for",
+            refresh=self._refresh_policy,
             index=self._index,
             raise_on_error=False,
         )
@@ -497,31 +801,16 @@ class ElasticsearchDocumentStore:
                 client=self._async_client,
                 actions=({"_op_type": "delete", "_id": id_} for id_ in document_ids),
                 index=self._index,
-                refresh=True,
+                refresh=self._refresh_policy,
             )
         except Exception as e:
             msg = f"Failed to delete documents from Elasticsearch: {e!s}"
             raise DocumentStoreError(msg) from e
 
-    def _bm25_retrieval(
-        self,
-        query: str,
-        *,
-        filters: Optional[Dict[str, Any]] = None,
-        fuzziness: str = "AUTO",
-        top_k: int = 10,
-        scale_score: bool = False,
-    ) -> List[Document]:
-        """
-        Retrieves documents using BM25 retrieval.
-
-        :param query: The query string to search for
-        :param filters: Optional filters to narrow down the search space
-        :param fuzziness: Fuzziness parameter for the search query
-        :param top_k: Maximum number of documents to return
-        :param scale_score: Whether to scale the similarity score to the range [0,1]
-        :returns: List of Documents that match the query
-        """
+    @staticmethod
+    def _prepare_bm25_search_request(
+        *, query: str, filters: Optional[Dict[str, Any]], fuzziness: str, top_k: int
+    ) -> Dict[str, Any]:
         if not query:
             msg = "query must be a non empty string"
             raise ValueError(msg)
@@ -547,11 +836,38 @@ class ElasticsearchDocumentStore:
         if filters:
             body["query"]["bool"]["filter"] = _normalize_filters(filters)
 
+        return body
+
+    @staticmethod
+    def _scale_bm25_scores(documents: List[Document]) -> None:
+        for doc in documents:
+            if doc.score is not None:
+                doc.score = float(1 / (1 + np.exp(-(doc.score / float(BM25_SCALING_FACTOR)))))
+
+    def _bm25_retrieval(
+        self,
+        query: str,
+        *,
+        filters: Optional[Dict[str, Any]] = None,
+        fuzziness: str = "AUTO",
+        top_k: int = 10,
+        scale_score: bool = False,
+    ) -> List[Document]:
+        """
+        Retrieves documents using BM25 retrieval.
+
+        :param query: The query string to search for
+        :param filters: Optional filters to narrow down the search space
+        :param fuzziness: Fuzziness parameter for the search query
+        :param top_k: Maximum number of documents to return
+        :param scale_score: Whether to scale the similarity score to the range [0,1]
+        :returns: List of Documents that match the query
+        """
+        body = self._prepare_bm25_search_request(query=query, filters=filters, fuzziness=fuzziness, top_k=top_k)
         documents = self._search_documents(**body)
 
         if scale_score:
-            for doc in documents:
-                doc.score = float(1 / (1 + np.exp(-np.asarray(doc.score / BM25_SCALING_FACTOR))))
+            self._scale_bm25_scores(documents)
 
         return documents
 
@@ -576,58 +892,87 @@ class ElasticsearchDocumentStore:
         """
         self._ensure_initialized()
 
-        if not query:
-            msg = "query must be a non empty string"
-            raise ValueError(msg)
+        body = self._prepare_bm25_search_request(query=query, filters=filters, fuzziness=fuzziness, top_k=top_k)
+        documents = await self._search_documents_async(**body)
 
-        # Prepare the search body
-        search_body = {
-            "size": top_k,
-            "query": {
-                "bool": {
-                    "must": [
-                        {
-                            "multi_match": {
-                                "query": query,
-                                "type": "most_fields",
-                                "operator": "OR",
-                                "fuzziness": fuzziness,
-                            }
-                        }
-                    ]
-                }
-            },
-        }
+        if scale_score:
+            self._scale_bm25_scores(documents)
 
-        if filters:
-            search_body["query"]["bool"]["filter"] = _normalize_filters(filters)  # type:ignore
+        return documents
+
+    def _bm25_retrieval_batch(
+        self,
+        queries: List[str],
+        *,
+        filters: Optional[Dict[str, Any]] = None,
+        fuzziness: str = "AUTO",
+        top_k: int = 10,
+        scale_score: bool = False,
+    ) -> List[List[Document]]:
+        """
+        Retrieves documents for multiple queries using BM25 retrieval, in a single multi search request.
 
-        documents = await self._search_documents_async(**search_body)
+        :param queries: The query strings to search for
+        :param filters: Optional filters to narrow down the search space, applied to all queries
+        :param fuzziness: Fuzziness parameter for the search queries
+        :param top_k: Maximum number of documents to return per query
+        :param scale_score: Whether to scale the similarity score to the range [0,1]
+        :returns: One list of Documents that match the query for each query, in the same order as `queries`
+        """
+        bodies = [
+            self._prepare_bm25_search_request(query=query, filters=filters, fuzziness=fuzziness, top_k=top_k)
+            for query in queries
+        ]
+        results = self._msearch_documents(bodies)
 
         if scale_score:
-            for doc in documents:
-                if doc.score is not None:
-                    doc.score = float(1 / (1 + np.exp(-(doc.score / float(BM25_SCALING_FACTOR)))))
+            for documents in results:
+                self._scale_bm25_scores(documents)
 
-        return documents
+        return results
 
-    def _embedding_retrieval(
+    async def _bm25_retrieval_batch_async(
         self,
-        query_embedding: List[float],
+        queries: List[str],
         *,
         filters: Optional[Dict[str, Any]] = None,
+        fuzziness: str = "AUTO",
         top_k: int = 10,
-        num_candidates: Optional[int] = None,
-    ) -> List[Document]:
+        scale_score: bool = False,
+    ) -> List[List[Document]]:
         """
-        Retrieves documents using dense vector similarity search.
+        Asynchronously retrieves documents for multiple queries using BM25 retrieval, in a single multi search request.
 
-        :param query_embedding: Embedding vector to search for
-        :param filters: Optional filters to narrow down the search space
-        :param top_k: Maximum number of documents to return
-        :param num_candidates: Number of candidates to consider in the search
-        :returns: List of Documents most similar to query_embedding
+        :param queries: The query strings to search for
+        :param filters: Optional filters to narrow down the search space, applied to all queries
+        :param fuzziness: Fuzziness parameter for the search queries
+        :param top_k: Maximum number of documents to return per query
+        :param scale_score: Whether to scale the similarity score to the range [0,1]
+        :returns: One list of Documents that match the query for each query, in the same order as `queries`
         """
+        self._ensure_initialized()
+
+        bodies = [
+            self._prepare_bm25_search_request(query=query, filters=filters, fuzziness=fuzziness, top_k=top_k)
+            for query in queries
+        ]
+        results = await self._msearch_documents_async(bodies)
+
+        if scale_score:
+            for documents in results:
+                self._scale_bm25_scores(documents)
+
+        return results
+
+    @staticmethod
+    def _prepare_embedding_search_request(
+        *,
+        query_embedding: List[float],
+        filters: Optional[Dict[str, Any]],
+        top_k: int,
+        num_candidates: Optional[int],
+        rescore_oversample: Optional[float],
+    ) -> Dict[str, Any]:
         if not query_embedding:
             msg = "query_embedding must be a non-empty list of floats"
             raise ValueError(msg)
@@ -647,8 +992,41 @@ class ElasticsearchDocumentStore:
         if filters:
             body["knn"]["filter"] = _normalize_filters(filters)
 
-        docs = self._search_documents(**body)
-        return docs
+        if rescore_oversample is not None:
+            # Fetches `oversample * k` candidates using the quantized vectors
+            # and rescores them with the original float vectors
+            body["knn"]["rescore_vector"] = {"oversample": rescore_oversample}
+
+        return body
+
+    def _embedding_retrieval(
+        self,
+        query_embedding: List[float],
+        *,
+        filters: Optional[Dict[str, Any]] = None,
+        top_k: int = 10,
+        num_candidates: Optional[int] = None,
+        rescore_oversample: Optional[float] = None,
+    ) -> List[Document]:
+        """
+        Retrieves documents using dense vector similarity search.
+
+        :param query_embedding: Embedding vector to search for
+        :param filters: Optional filters to narrow down the search space
+        :param top_k: Maximum number of documents to return
+        :param num_candidates: Number of candidates to consider in the search
+        :param rescore_oversample: Oversampling factor used to rescore the results of quantized vector fields
+            with the original vectors
+        :returns: List of Documents most similar to query_embedding
+        """
+        body = self._prepare_embedding_search_request(
+            query_embedding=query_embedding,
+            filters=filters,
+            top_k=top_k,
+            num_candidates=num_candidates,
+            rescore_oversample=rescore_oversample,
+        )
+        return self._search_documents(**body)
 
     async def _embedding_retrieval_async(
         self,
@@ -657,6 +1035,7 @@ class ElasticsearchDocumentStore:
         filters: Optional[Dict[str, Any]] = None,
         top_k: int = 10,
         num_candidates: Optional[int] = None,
+        rescore_oversample: Optional[float] = None,
     ) -> List[Document]:
         """
         Asynchronously retrieves documents using dense vector similarity search.
@@ -665,29 +1044,239 @@ class ElasticsearchDocumentStore:
         :param filters: Optional filters to narrow down the search space
         :param top_k: Maximum number of documents to return
         :param num_candidates: Number of candidates to consider in the search
+        :param rescore_oversample: Oversampling factor used to rescore the results of quantized vector fields
+            with the original vectors
         :returns: List of Documents most similar to query_embedding
         """
         self._ensure_initialized()
 
+        body = self._prepare_embedding_search_request(
+            query_embedding=query_embedding,
+            filters=filters,
+            top_k=top_k,
+            num_candidates=num_candidates,
+            rescore_oversample=rescore_oversample,
+        )
+        return await self._search_documents_async(**body)
+
+    def _embedding_retrieval_batch(
+        self,
+        query_embeddings: List[List[float]],
+        *,
+        filters: Optional[Dict[str, Any]] = None,
+        top_k: int = 10,
+        num_candidates: Optional[int] = None,
+        rescore_oversample: Optional[float] = None,
+    ) -> List[List[Document]]:
+        """
+        Retrieves documents for multiple query embeddings using dense vector similarity search,
+        in a single multi search request.
+
+        :param query_embeddings: Embedding vectors to search for
+        :param filters: Optional filters to narrow down the search space, applied to all queries
+        :param top_k: Maximum number of documents to return per query
+        :param num_candidates: Number of candidates to consider in the search
+        :param rescore_oversample: Oversampling factor used to rescore the results of quantized vector fields
+            with the original vectors
+        :returns: One list of Documents for each query embedding, in the same order as `query_embeddings`
+        """
+        bodies = [
+            self._prepare_embedding_search_request(
+                query_embedding=query_embedding,
+                filters=filters,
+                top_k=top_k,
+                num_candidates=num_candidates,
+                rescore_oversample=rescore_oversample,
+            )
+            for query_embedding in query_embeddings
+        ]
+        return self._msearch_documents(bodies)
+
+    async def _embedding_retrieval_batch_async(
+        self,
+        query_embeddings: List[List[float]],
+        *,
+        filters: Optional[Dict[str, Any]] = None,
+        top_k: int = 10,
+        num_candidates: Optional[int] = None,
+        rescore_oversample: Optional[float] = None,
+    ) -> List[List[Document]]:
+        """
+        Asynchronously retrieves documents for multiple query embeddings using dense vector similarity search,
+        in a single multi search request.
+
+        :param query_embeddings: Embedding vectors to search for
+        :param filters: Optional filters to narrow down the search space, applied to all queries
+        :param top_k: Maximum number of documents to return per query
+        :param num_candidates: Number of candidates to consider in the search
+        :param rescore_oversample: Oversampling factor used to rescore the results of quantized vector fields
+            with the original vectors
+        :returns: One list of Documents for each query embedding, in the same order as `query_embeddings`
+        """
+        self._ensure_initialized()
+
+        bodies = [
+            self._prepare_embedding_search_request(
+                query_embedding=query_embedding,
+                filters=filters,
+                top_k=top_k,
+                num_candidates=num_candidates,
+                rescore_oversample=rescore_oversample,
+            )
+            for query_embedding in query_embeddings
+        ]
+        return await self._msearch_documents_async(bodies)
+
+    @staticmethod
+    def _prepare_hybrid_search_request(
+        *,
+        query: str,
+        query_embedding: List[float],
+        filters: Optional[Dict[str, Any]],
+        fuzziness: str,
+        top_k: int,
+        num_candidates: Optional[int],
+        rank_window_size: Optional[int],
+        rank_constant: int,
+        use_rrf: bool,
+        bm25_boost: float,
+        embedding_boost: float,
+    ) -> Dict[str, Any]:
+        # the BM25 search is the same query the BM25 retrieval sends
+        bm25_query = ElasticsearchDocumentStore._prepare_bm25_search_request(
+            query=query, filters=filters, fuzziness=fuzziness, top_k=top_k
+        )["query"]
         if not query_embedding:
             msg = "query_embedding must be a non-empty list of floats"
             raise ValueError(msg)
 
-        # If num_candidates is not set, use top_k * 10 as default
-        if num_candidates is None:
-            num_candidates = top_k * 10
+        # each sub-search must return at least as many candidates as the fusion considers
+        k = max(top_k, rank_window_size or 0)
+        if not num_candidates:
+            num_candidates = k * 10
 
-        # Prepare the search body
-        search_body = {
-            "knn": {
-                "field": "embedding",
-                "query_vector": query_embedding,
-                "k": top_k,
-                "num_candidates": num_candidates,
-            },
+        knn: Dict[str, Any] = {
+            "field": "embedding",
+            "query_vector": query_embedding,
+            "k": k,
+            "num_candidates": num_candidates,
         }
-
         if filters:
-            search_body["knn"]["filter"] = _normalize_filters(filters)
+            knn["filter"] = _normalize_filters(filters)
 
-        return await self._search_documents_async(**search_body)
+        if not use_rrf:
+            # Scores of the BM25 query and the kNN search are summed up, weighted by their boosts
+            bm25_query["bool"]["boost"] = bm25_boost
+            knn["boost"] = embedding_boost
+            return {"size": top_k, "query": bm25_query, "knn": knn}
+
+        rrf: Dict[str, Any] = {
+            "retrievers": [{"standard": {"query": bm25_query}}, {"knn": knn}],
+            "rank_constant": rank_constant,
+        }
+        if rank_window_size is not None:
+            # Elasticsearch rejects a rank window smaller than the number of documents returned
+            rrf["rank_window_size"] = k
+        return {"size": top_k, "retriever": {"rrf": rrf}}
+
+    def _hybrid_retrieval(
+        self,
+        query: str,
+        query_embedding: List[float],
+        *,
+        filters: Optional[Dict[str, Any]] = None,
+        fuzziness: str = "AUTO",
+        top_k: int = 10,
+        num_candidates: Optional[int] = None,
+        rank_window_size: Optional[int] = None,
+        rank_constant: int = 60,
+        use_rrf: bool = True,
+        bm25_boost: float = 1.0,
+        embedding_boost: float = 1.0,
+    ) -> List[Document]:
+        """
+        Retrieves documents combining BM25 and dense vector similarity search in a single request.
+
+        By default the results of both searches are fused with Reciprocal Rank Fusion using the RRF retriever of
+        Elasticsearch. For clusters that don't support it, set `use_rrf` to `False` to send a single request with
+        both a `query` and a `knn` section, whose scores are summed up weighted by `bm25_boost` and `embedding_boost`.
+
+        :param query: The query string to search for
+        :param query_embedding: Embedding vector to search for
+        :param filters: Optional filters to narrow down the search space
+        :param fuzziness: Fuzziness parameter for the BM25 search query
+        :param top_k: Maximum number of documents to return
+        :param num_candidates: Number of candidates to consider in the kNN search
+        :param rank_window_size: Number of documents of each search considered by the rank fusion
+        :param rank_constant: Constant that determines how much documents in lower ranks contribute to the fused score
+        :param use_rrf: Whether to fuse the results with the RRF retriever
+        :param bm25_boost: Weight of the BM25 score when `use_rrf` is `False`
+        :param embedding_boost: Weight of the vector similarity score when `use_rrf` is `False`
+        :returns: List of Documents that best match the query and the query embedding
+        """
+        body = self._prepare_hybrid_search_request(
+            query=query,
+            query_embedding=query_embedding,
+            filters=filters,
+            fuzziness=fuzziness,
+            top_k=top_k,
+            num_candidates=num_candidates,
+            rank_window_size=rank_window_size,
+            rank_constant=rank_constant,
+            use_rrf=use_rrf,
+            bm25_boost=bm25_boost,
+            embedding_boost=embedding_boost,
+        )
+        return self._search_documents(**body)
+
+    async def _hybrid_retrieval_async(
+        self,
+        query: str,
+        query_embedding: List[float],
+        *,
+        filters: Optional[Dict[str, Any]] = None,
+        fuzziness: str = "AUTO",
+        top_k: int = 10,
+        num_candidates: Optional[int] = None,
+        rank_window_size: Optional[int] = None,
+        rank_constant: int = 60,
+        use_rrf: bool = True,
+        bm25_boost: float = 1.0,
+        embedding_boost: float = 1.0,
+    ) -> List[Document]:
+        """
+        Asynchronously retrieves documents combining BM25 and dense vector similarity search in a single request.
+
+        By default the results of both searches are fused with Reciprocal Rank Fusion using the RRF retriever of
+        Elasticsearch. For clusters that don't support it, set `use_rrf` to `False` to send a single request with
+        both a `query` and a `knn` section, whose scores are summed up weighted by `bm25_boost` and `embedding_boost`.
+
+        :param query: The query string to search for
+        :param query_embedding: Embedding vector to search for
+        :param filters: Optional filters to narrow down the search space
+        :param fuzziness: Fuzziness parameter for the BM25 search query
+        :param top_k: Maximum number of documents to return
+        :param num_candidates: Number of candidates to consider in the kNN search
+        :param rank_window_size: Number of documents of each search considered by the rank fusion
+        :param rank_constant: Constant that determines how much documents in lower ranks contribute to the fused score
+        :param use_rrf: Whether to fuse the results with the RRF retriever
+        :param bm25_boost: Weight of the BM25 score when `use_rrf` is `False`
+        :param embedding_boost: Weight of the vector similarity score when `use_rrf` is `False`
+        :returns: List of Documents that best match the query and the query embedding
+        """
+        self._ensure_initialized()
+
+        body = self._prepare_hybrid_search_request(
+            query=query,
+            query_embedding=query_embedding,
+            filters=filters,
+            fuzziness=fuzziness,
+            top_k=top_k,
+            num_candidates=num_candidates,
+            rank_window_size=rank_window_size,
+            rank_constant=rank_constant,
+            use_rrf=use_rrf,
+            bm25_boost=bm25_boost,
+            embedding_boost=embedding_boost,
+        )
+        return await self._search_documents_async(**body)
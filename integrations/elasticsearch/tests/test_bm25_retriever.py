@@ -41,6 +41,8 @@ def test_to_dict(_mock_elasticsearch_client):
                     "custom_mapping": None,
                     "index": "default",
                     "embedding_similarity_function": "cosine",
+                    "embedding_index_options": None,
+                    "refresh": "wait_for",
                 },
                 "type": "haystack_integrations.document_stores.elasticsearch.document_store.ElasticsearchDocumentStore",
             },
@@ -180,3 +182,35 @@ async def test_run_time_params_async():
     assert len(res) == 1
     assert len(res["documents"]) == 1
     assert res["documents"][0].content == "test document"
+
+
+def test_run_batch():
+    mock_store = Mock(spec=ElasticsearchDocumentStore)
+    mock_store._bm25_retrieval_batch.return_value = [[Document(content="doc 1")], [Document(content="doc 2")]]
+    retriever = ElasticsearchBM25Retriever(document_store=mock_store, top_k=3)
+    res = retriever.run_batch(queries=["query 1", "query 2"])
+    mock_store._bm25_retrieval_batch.assert_called_once_with(
+        queries=["query 1", "query 2"],
+        filters={},
+        fuzziness="AUTO",
+        top_k=3,
+        scale_score=False,
+    )
+    assert [[doc.content for doc in docs] for docs in res["documents"]] == [["doc 1"], ["doc 2"]]
+
+
+@pytest.mark.asyncio
+async def test_run_batch_async():
+    mock_store = Mock(spec=ElasticsearchDocumentStore)
+    mock_store._bm25_retrieval_batch_async.return_value = [[Document(content="doc 1")], []]
+    retriever = ElasticsearchBM25Retriever(document_store=mock_store)
+    res = await retriever.run_batch_async(queries=["query 1", "query 2"], top_k=1)
+    mock_store._bm25_retrieval_batch_async.assert_called_once_with(
+        queries=["query 1", "query 2"],
+        filters={},
+        fuzziness="AUTO",
+        top_k=1,
+        scale_score=False,
+    )
+    assert len(res["documents"]) == 2
+    assert res["documents"][1] == []
@@ -50,6 +50,8 @@ def test_to_dict(_mock_elasticsearch_client):
             "custom_mapping": None,
             "index": "default",
             "embedding_similarity_function": "cosine",
+            "embedding_index_options": None,
+            "refresh": "wait_for",
         },
     }
 
@@ -63,6 +65,7 @@ def test_from_dict(_mock_elasticsearch_client):
             "custom_mapping": None,
             "index": "default",
             "embedding_similarity_function": "cosine",
+            "refresh": False,
         },
     }
     document_store = ElasticsearchDocumentStore.from_dict(data)
@@ -70,6 +73,226 @@ def test_from_dict(_mock_elasticsearch_client):
     assert document_store._index == "default"
     assert document_store._custom_mapping is None
     assert document_store._embedding_similarity_function == "cosine"
+    assert document_store._refresh is False
+
+
+@patch("haystack_integrations.document_stores.elasticsearch.document_store.Elasticsearch")
+def test_filter_documents_iter_pages_with_search_after(mock_elasticsearch):
+    mock_client = mock_elasticsearch.return_value
+    mock_client.open_point_in_time.return_value = {"id": "pit-1"}
+    mock_client.search.side_effect = [
+        {
+            "pit_id": "pit-2",
+            "hits": {
+                "hits": [
+                    {"_source": {"id": "1", "content": "a"}, "_score": None, "sort": [1]},
+                    {"_source": {"id": "2", "content": "b"}, "_score": None, "sort": [2]},
+                ]
+            },
+        },
+        {"pit_id": "pit-2", "hits": {"hits": [{"_source": {"id": "3", "content": "c"}, "_score": None, "sort": [3]}]}},
+    ]
+    document_store = ElasticsearchDocumentStore(hosts="http://testhost:9200")
+
+    docs = list(document_store.filter_documents_iter(batch_size=2))
+
+    assert [doc.id for doc in docs] == ["1", "2", "3"]
+    first_call, second_call = mock_client.search.call_args_list
+    assert first_call.kwargs["pit"]["id"] == "pit-1"
+    assert "search_after" not in first_call.kwargs
+    assert second_call.kwargs["pit"]["id"] == "pit-2"
+    assert second_call.kwargs["search_after"] == [2]
+    assert "from_" not in second_call.kwargs
+    mock_client.close_point_in_time.assert_called_once_with(id="pit-2")
+
+
+@patch("haystack_integrations.document_stores.elasticsearch.document_store.helpers.bulk")
+@patch("haystack_integrations.document_stores.elasticsearch.document_store.Elasticsearch")
+def test_write_documents_uses_refresh_policy(_mock_elasticsearch, mock_bulk):
+    mock_bulk.return_value = (1, [])
+    document_store = ElasticsearchDocumentStore(hosts="http://testhost:9200", refresh=False)
+
+    document_store.write_documents([Document(content="test")])
+
+    assert mock_bulk.call_args.kwargs["refresh"] is False
+
+
+@patch("haystack_integrations.document_stores.elasticsearch.document_store.helpers.parallel_bulk")
+@patch("haystack_integrations.document_stores.elasticsearch.document_store.helpers.streaming_bulk")
+@patch("haystack_integrations.document_stores.elasticsearch.document_store.Elasticsearch")
+def test_write_documents_streaming(_mock_elasticsearch, mock_streaming_bulk, mock_parallel_bulk):
+    mock_streaming_bulk.return_value = iter([(True, {}), (True, {})])
+    mock_parallel_bulk.return_value = iter([(True, {})])
+    document_store = ElasticsearchDocumentStore(hosts="http://testhost:9200")
+    documents = (Document(content=f"doc {i}") for i in range(2))
+
+    assert document_store.write_documents_streaming(documents, chunk_size=10, max_chunk_bytes=1000) == 2
+    kwargs = mock_streaming_bulk.call_args.kwargs
+    assert kwargs["chunk_size"] == 10
+    assert kwargs["max_chunk_bytes"] == 1000
+    assert [action["_op_type"] for action in kwargs["actions"]] == ["create", "create"]
+    mock_parallel_bulk.assert_not_called()
+
+    assert document_store.write_documents_streaming([Document(content="doc")], thread_count=4) == 1
+    assert mock_parallel_bulk.call_args.kwargs["thread_count"] == 4
+
+
+@patch("haystack_integrations.document_stores.elasticsearch.document_store.helpers.streaming_bulk")
+@patch("haystack_integrations.document_stores.elasticsearch.document_store.Elasticsearch")
+def test_write_documents_streaming_duplicate_fails(_mock_elasticsearch, mock_streaming_bulk):
+    error = {"create": {"_id": "1", "error": {"type": "version_conflict_engine_exception"}}}
+    mock_streaming_bulk.return_value = iter([(False, error)])
+    document_store = ElasticsearchDocumentStore(hosts="http://testhost:9200")
+
+    with pytest.raises(DuplicateDocumentError):
+        document_store.write_documents_streaming([Document(id="1", content="doc")])
+
+
+@patch("haystack_integrations.document_stores.elasticsearch.document_store.helpers.bulk")
+@patch("haystack_integrations.document_stores.elasticsearch.document_store.Elasticsearch")
+def test_bulk_load_disables_refresh(mock_elasticsearch, mock_bulk):
+    mock_client = mock_elasticsearch.return_value
+    mock_client.indices.get_settings.return_value.body = {
+        "default": {"settings": {"index": {"refresh_interval": "5s"}}}
+    }
+    mock_bulk.return_value = (1, [])
+    document_store = ElasticsearchDocumentStore(hosts="http://testhost:9200")
+
+    with document_store.bulk_load():
+        mock_client.indices.put_settings.assert_called_once_with(
+            index="default", settings={"index": {"refresh_interval": "-1"}}
+        )
+        document_store.write_documents([Document(content="test")])
+        assert mock_bulk.call_args.kwargs["refresh"] is False
+
+    mock_client.indices.put_settings.assert_called_with(index="default", settings={"index": {"refresh_interval": "5s"}})
+    mock_client.indices.refresh.assert_called_once_with(index="default")
+    assert document_store._refresh_policy == "wait_for"
+
+
+def test_prepare_hybrid_search_request_rrf():
+    body = ElasticsearchDocumentStore._prepare_hybrid_search_request(
+        query="query",
+        query_embedding=[0.1, 0.2],
+        filters={"field": "type", "operator": "==", "value": "article"},
+        fuzziness="AUTO",
+        top_k=5,
+        num_candidates=None,
+        rank_window_size=20,
+        rank_constant=10,
+        use_rrf=True,
+        bm25_boost=1.0,
+        embedding_boost=1.0,
+    )
+
+    assert body["size"] == 5
+    rrf = body["retriever"]["rrf"]
+    assert rrf["rank_window_size"] == 20
+    assert rrf["rank_constant"] == 10
+    standard, knn = rrf["retrievers"]
+    assert standard["standard"]["query"]["bool"]["filter"] == {"bool": {"must": {"term": {"type": "article"}}}}
+    assert knn["knn"]["k"] == 20
+    assert knn["knn"]["num_candidates"] == 200
+    assert knn["knn"]["filter"] == {"bool": {"must": {"term": {"type": "article"}}}}
+
+
+def test_prepare_hybrid_search_request_rank_window_size_at_least_top_k():
+    body = ElasticsearchDocumentStore._prepare_hybrid_search_request(
+        query="query",
+        query_embedding=[0.1, 0.2],
+        filters=None,
+        fuzziness="AUTO",
+        top_k=15,
+        num_candidates=None,
+        rank_window_size=5,
+        rank_constant=60,
+        use_rrf=True,
+        bm25_boost=1.0,
+        embedding_boost=1.0,
+    )
+
+    assert body["size"] == 15
+    assert body["retriever"]["rrf"]["rank_window_size"] == 15
+
+
+def test_prepare_hybrid_search_request_without_rrf():
+    body = ElasticsearchDocumentStore._prepare_hybrid_search_request(
+        query="query",
+        query_embedding=[0.1, 0.2],
+        filters=None,
+        fuzziness="AUTO",
+        top_k=5,
+        num_candidates=None,
+        rank_window_size=None,
+        rank_constant=60,
+        use_rrf=False,
+        bm25_boost=0.3,
+        embedding_boost=0.7,
+    )
+
+    assert "retriever" not in body
+    assert body["query"]["bool"]["boost"] == 0.3
+    assert body["knn"]["boost"] == 0.7
+    assert body["knn"]["k"] == 5
+
+
+@patch("haystack_integrations.document_stores.elasticsearch.document_store.Elasticsearch")
+def test_init_with_embedding_index_options(mock_elasticsearch):
+    mock_client = mock_elasticsearch.return_value
+    mock_client.indices.exists.return_value = False
+    index_options = {"type": "int8_hnsw", "m": 32, "ef_construction": 200}
+
+    _ = ElasticsearchDocumentStore(hosts="http://testhost:9200", embedding_index_options=index_options).client
+
+    mappings = mock_client.indices.create.call_args.kwargs["mappings"]
+    assert mappings["properties"]["embedding"]["index_options"] == index_options
+
+
+def test_init_with_unsupported_embedding_index_type():
+    with pytest.raises(ValueError, match="embedding_index_options"):
+        ElasticsearchDocumentStore(hosts="http://testhost:9200", embedding_index_options={"type": "int2_hnsw"})
+
+
+def test_prepare_embedding_search_request_with_rescore_oversample():
+    body = ElasticsearchDocumentStore._prepare_embedding_search_request(
+        query_embedding=[0.1, 0.2], filters=None, top_k=5, num_candidates=100, rescore_oversample=2.5
+    )
+
+    assert body["knn"]["num_candidates"] == 100
+    assert body["knn"]["rescore_vector"] == {"oversample": 2.5}
+
+
+@patch("haystack_integrations.document_stores.elasticsearch.document_store.Elasticsearch")
+def test_bm25_retrieval_batch_uses_msearch(mock_elasticsearch):
+    mock_client = mock_elasticsearch.return_value
+    mock_client.msearch.return_value = {
+        "responses": [
+            {"hits": {"hits": [{"_source": {"id": "1", "content": "a"}, "_score": 2.0}]}},
+            {"hits": {"hits": []}},
+        ]
+    }
+    document_store = ElasticsearchDocumentStore(hosts="http://testhost:9200")
+
+    results = document_store._bm25_retrieval_batch(["first", "second"], top_k=3)
+
+    assert [[doc.id for doc in docs] for docs in results] == [["1"], []]
+    mock_client.search.assert_not_called()
+    searches = mock_client.msearch.call_args.kwargs["searches"]
+    assert searches[0] == {}
+    assert searches[1]["query"]["bool"]["must"][0]["multi_match"]["query"] == "first"
+    assert searches[3]["size"] == 3
+
+
+@patch("haystack_integrations.document_stores.elasticsearch.document_store.Elasticsearch")
+def test_embedding_retrieval_batch_raises_on_error(mock_elasticsearch):
+    mock_client = mock_elasticsearch.return_value
+    mock_client.msearch.return_value = {"responses": [{"error": {"type": "search_phase_execution_exception"}}]}
+    document_store = ElasticsearchDocumentStore(hosts="http://testhost:9200")
+
+    with pytest.raises(DocumentStoreError):
+        document_store._embedding_retrieval_batch([[0.1, 0.2]])
+    searches = mock_client.msearch.call_args.kwargs["searches"]
+    assert searches[1]["size"] == 10
 
 
 @pytest.mark.integration
@@ -285,6 +508,65 @@ class TestDocumentStore(DocumentStoreBaseTests):
         results = document_store._embedding_retrieval(query_embedding=[0.1, 0.1, 0.1, 0.1], top_k=11, filters={})
         assert len(results) == 11
 
+    @pytest.mark.parametrize("use_rrf", [True, False])
+    def test_hybrid_retrieval(self, document_store: ElasticsearchDocumentStore, use_rrf):
+        docs = [
+            Document(content="Functional programming with Haskell", embedding=[0.1, 0.1, 0.1, 0.1]),
+            Document(content="Object oriented programming with Java", embedding=[1.0, 1.0, 1.0, 1.0]),
+            Document(content="Cooking pasta", embedding=[0.9, 0.9, 0.9, 0.9]),
+        ]
+        document_store.write_documents(docs)
+
+        results = document_store._hybrid_retrieval(
+            "Java programming", [1.0, 1.0, 1.0, 1.0], top_k=2, rank_window_size=3, use_rrf=use_rrf
+        )
+
+        assert len(results) == 2
+        assert results[0].content == "Object oriented programming with Java"
+
+    def test_embedding_retrieval_with_quantized_index(self, request):
+        store = ElasticsearchDocumentStore(
+            hosts=["http://localhost:9200"],
+            index=f"{request.node.name}",
+            embedding_similarity_function="max_inner_product",
+            embedding_index_options={"type": "int8_hnsw", "m": 16, "ef_construction": 100},
+        )
+        try:
+            mapping = store.client.indices.get_mapping(index=store._index)
+            embedding_mapping = mapping[store._index]["mappings"]["properties"]["embedding"]
+            assert embedding_mapping["index_options"]["type"] == "int8_hnsw"
+
+            store.write_documents(
+                [
+                    Document(content="Most similar document", embedding=[1.0, 1.0, 1.0, 1.0]),
+                    Document(content="Less similar document", embedding=[0.1, 0.1, 0.1, 0.1]),
+                ]
+            )
+            results = store._embedding_retrieval(
+                query_embedding=[1.0, 1.0, 1.0, 1.0], top_k=1, num_candidates=10, rescore_oversample=2.0
+            )
+            assert len(results) == 1
+            assert results[0].content == "Most similar document"
+        finally:
+            store.client.options(ignore_status=[400, 404]).indices.delete(index=store._index)
+            store.client.close()
+
+    def test_retrieval_batch(self, document_store: ElasticsearchDocumentStore):
+        document_store.write_documents(
+            [
+                Document(content="Haskell is a functional programming language", embedding=[1.0, 0.0, 0.0, 0.0]),
+                Document(content="Java is an object oriented programming language", embedding=[0.0, 1.0, 0.0, 0.0]),
+            ]
+        )
+
+        bm25_results = document_store._bm25_retrieval_batch(["functional", "object oriented"], top_k=1)
+        assert [docs[0].content.split()[0] for docs in bm25_results] == ["Haskell", "Java"]
+
+        embedding_results = document_store._embedding_retrieval_batch(
+            [[0.0, 1.0, 0.0, 0.0], [1.0, 0.0, 0.0, 0.0]], top_k=1
+        )
+        assert [docs[0].content.split()[0] for docs in embedding_results] == ["Java", "Haskell"]
+
     def test_embedding_retrieval_query_documents_different_embedding_sizes(
         self, document_store: ElasticsearchDocumentStore
     ):
@@ -309,6 +591,32 @@ class TestDocumentStore(DocumentStoreBaseTests):
         with pytest.raises(DocumentStoreError):
             document_store.write_documents(docs)
 
+    def test_filter_documents_iter(self, document_store: ElasticsearchDocumentStore):
+        docs = [Document(content=f"doc {i}", meta={"number": i % 2}) for i in range(25)]
+        document_store.write_documents(docs)
+
+        filters = {"field": "number", "operator": "==", "value": 1}
+        results = list(document_store.filter_documents_iter(filters=filters, batch_size=5))
+
+        assert sorted(doc.content for doc in results) == sorted(doc.content for doc in docs if doc.meta["number"] == 1)
+
+    def test_filter_documents_beyond_max_result_window(self, document_store: ElasticsearchDocumentStore):
+        document_store.client.indices.put_settings(index=document_store._index, settings={"max_result_window": 10})
+        document_store.write_documents([Document(content=f"doc {i}") for i in range(30)])
+
+        assert len(document_store.filter_documents()) == 30
+
+    def test_write_documents_streaming(self, document_store: ElasticsearchDocumentStore):
+        documents = (Document(content=f"doc {i}") for i in range(20))
+
+        with document_store.bulk_load():
+            written = document_store.write_documents_streaming(documents, chunk_size=5, thread_count=2)
+
+        assert written == 20
+        assert document_store.count_documents() == 20
+        settings = document_store.client.indices.get_settings(index=document_store._index)
+        assert "refresh_interval" not in settings[document_store._index]["settings"]["index"]
+
     @patch("haystack_integrations.document_stores.elasticsearch.document_store.Elasticsearch")
     def test_init_with_custom_mapping(self, mock_elasticsearch):
         custom_mapping = {
@@ -397,6 +705,37 @@ class TestElasticsearchDocumentStoreAsync:
         assert len(result) == 1
         assert result[0].meta["number"] == 100
 
+    @pytest.mark.asyncio
+    async def test_write_documents_streaming_async(self, document_store):
+        async def documents():
+            for i in range(12):
+                yield Document(content=f"doc {i}")
+
+        async with document_store.bulk_load_async():
+            written = await document_store.write_documents_streaming_async(documents(), chunk_size=5)
+
+        assert written == 12
+        assert await document_store.count_documents_async() == 12
+
+    @pytest.mark.asyncio
+    async def test_bm25_retrieval_batch_async(self, document_store):
+        await document_store.write_documents_async(
+            [Document(content="Haskell is functional"), Document(content="Java is object oriented")]
+        )
+
+        results = await document_store._bm25_retrieval_batch_async(["functional", "object"], top_k=1)
+
+        assert [docs[0].content for docs in results] == ["Haskell is functional", "Java is object oriented"]
+
+    @pytest.mark.asyncio
+    async def test_filter_documents_iter_async(self, document_store):
+        docs = [Document(content=f"doc {i}") for i in range(12)]
+        await document_store.write_documents_async(docs)
+
+        results = [doc async for doc in document_store.filter_documents_iter_async(batch_size=5)]
+
+        assert sorted(doc.id for doc in results) == sorted(doc.id for doc in docs)
+
     @pytest.mark.asyncio
     async def test_bm25_retrieval_async(self, document_store):
         docs = [
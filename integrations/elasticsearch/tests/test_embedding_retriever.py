@@ -18,6 +18,7 @@ def test_init_default():
     assert retriever._filters == {}
     assert retriever._top_k == 10
     assert retriever._num_candidates is None
+    assert retriever._rescore_oversample is None
 
     retriever = ElasticsearchEmbeddingRetriever(document_store=mock_store, filter_policy="replace")
     assert retriever._filter_policy == FilterPolicy.REPLACE
@@ -41,6 +42,8 @@ def test_to_dict(_mock_elasticsearch_client):
                     "custom_mapping": None,
                     "index": "default",
                     "embedding_similarity_function": "cosine",
+                    "embedding_index_options": None,
+                    "refresh": "wait_for",
                 },
                 "type": "haystack_integrations.document_stores.elasticsearch.document_store.ElasticsearchDocumentStore",
             },
@@ -48,6 +51,7 @@ def test_to_dict(_mock_elasticsearch_client):
             "top_k": 10,
             "filter_policy": "replace",
             "num_candidates": None,
+            "rescore_oversample": None,
         },
     }
 
@@ -108,6 +112,7 @@ def test_run():
         filters={},
         top_k=10,
         num_candidates=None,
+        rescore_oversample=None,
     )
     assert len(res) == 1
     assert len(res["documents"]) == 1
@@ -115,6 +120,20 @@ def test_run():
     assert res["documents"][0].embedding == [0.1, 0.2]
 
 
+def test_run_with_rescore_oversample():
+    mock_store = Mock(spec=ElasticsearchDocumentStore)
+    mock_store._embedding_retrieval.return_value = [Document(content="Test doc")]
+    retriever = ElasticsearchEmbeddingRetriever(document_store=mock_store, num_candidates=100, rescore_oversample=3.0)
+    retriever.run(query_embedding=[0.5, 0.7])
+    mock_store._embedding_retrieval.assert_called_once_with(
+        query_embedding=[0.5, 0.7],
+        filters={},
+        top_k=10,
+        num_candidates=100,
+        rescore_oversample=3.0,
+    )
+
+
 @pytest.mark.asyncio
 async def test_run_async():
     mock_store = Mock(spec=ElasticsearchDocumentStore)
@@ -126,6 +145,7 @@ async def test_run_async():
         filters={},
         top_k=10,
         num_candidates=None,
+        rescore_oversample=None,
     )
     assert len(res) == 1
     assert len(res["documents"]) == 1
@@ -150,6 +170,7 @@ async def test_run_init_params_async():
         filters={"some": "filter"},
         top_k=3,
         num_candidates=30,
+        rescore_oversample=None,
     )
     assert len(res) == 1
     assert len(res["documents"]) == 1
@@ -171,10 +192,41 @@ async def test_run_time_params_async():
 
     res = await retriever.run_async(query_embedding=[0.5, 0.7], filters={"another": "filter"}, top_k=1)
     mock_store._embedding_retrieval_async.assert_called_once_with(
-        query_embedding=[0.5, 0.7], filters={"another": "filter"}, top_k=1, num_candidates=30
+        query_embedding=[0.5, 0.7], filters={"another": "filter"}, top_k=1, num_candidates=30, rescore_oversample=None
     )
 
     assert len(res) == 1
     assert len(res["documents"]) == 1
     assert res["documents"][0].content == "test document"
     assert res["documents"][0].embedding == [0.1, 0.2]
+
+
+def test_run_batch():
+    mock_store = Mock(spec=ElasticsearchDocumentStore)
+    mock_store._embedding_retrieval_batch.return_value = [[Document(content="doc 1")], [Document(content="doc 2")]]
+    retriever = ElasticsearchEmbeddingRetriever(document_store=mock_store, num_candidates=30)
+    res = retriever.run_batch(query_embeddings=[[0.1, 0.2], [0.3, 0.4]])
+    mock_store._embedding_retrieval_batch.assert_called_once_with(
+        query_embeddings=[[0.1, 0.2], [0.3, 0.4]],
+        filters={},
+        top_k=10,
+        num_candidates=30,
+        rescore_oversample=None,
+    )
+    assert [[doc.content for doc in docs] for docs in res["documents"]] == [["doc 1"], ["doc 2"]]
+
+
+@pytest.mark.asyncio
+async def test_run_batch_async():
+    mock_store = Mock(spec=ElasticsearchDocumentStore)
+    mock_store._embedding_retrieval_batch_async.return_value = [[Document(content="doc 1")]]
+    retriever = ElasticsearchEmbeddingRetriever(document_store=mock_store)
+    res = await retriever.run_batch_async(query_embeddings=[[0.1, 0.2]], top_k=2)
+    mock_store._embedding_retrieval_batch_async.assert_called_once_with(
+        query_embeddings=[[0.1, 0.2]],
+        filters={},
+        top_k=2,
+        num_candidates=None,
+        rescore_oversample=None,
+    )
+    assert res["documents"][0][0].content == "doc 1"
@@ -0,0 +1,139 @@
+# SPDX-FileCopyrightText: 2023-present deepset GmbH <info@deepset.ai>
+#
+# SPDX-License-Identifier: Apache-2.0
+from unittest.mock import Mock, patch
+
+import pytest
+from haystack.dataclasses import Document
+from haystack.document_stores.types import FilterPolicy
+
+from haystack_integrations.components.retrievers.elasticsearch import ElasticsearchHybridRetriever
+from haystack_integrations.document_stores.elasticsearch import ElasticsearchDocumentStore
+
+
+def test_init_default():
+    mock_store = Mock(spec=ElasticsearchDocumentStore)
+    retriever = ElasticsearchHybridRetriever(document_store=mock_store)
+    assert retriever._document_store == mock_store
+    assert retriever._filters == {}
+    assert retriever._fuzziness == "AUTO"
+    assert retriever._top_k == 10
+    assert retriever._num_candidates is None
+    assert retriever._rank_window_size is None
+    assert retriever._rank_constant == 60
+    assert retriever._use_rrf
+    assert retriever._filter_policy == FilterPolicy.REPLACE
+
+    with pytest.raises(ValueError):
+        ElasticsearchHybridRetriever(document_store=mock_store, filter_policy="keep")
+
+
+def test_init_wrong_document_store():
+    with pytest.raises(ValueError):
+        ElasticsearchHybridRetriever(document_store=Mock())
+
+
+@patch("haystack_integrations.document_stores.elasticsearch.document_store.Elasticsearch")
+def test_to_dict(_mock_elasticsearch_client):
+    document_store = ElasticsearchDocumentStore(hosts="some fake host")
+    retriever = ElasticsearchHybridRetriever(document_store=document_store, rank_window_size=50)
+    res = retriever.to_dict()
+    t = "haystack_integrations.components.retrievers.elasticsearch.hybrid_retriever.ElasticsearchHybridRetriever"
+    assert res == {
+        "type": t,
+        "init_parameters": {
+            "document_store": {
+                "init_parameters": {
+                    "hosts": "some fake host",
+                    "custom_mapping": None,
+                    "index": "default",
+                    "embedding_similarity_function": "cosine",
+                    "embedding_index_options": None,
+                    "refresh": "wait_for",
+                },
+                "type": "haystack_integrations.document_stores.elasticsearch.document_store.ElasticsearchDocumentStore",
+            },
+            "filters": {},
+            "fuzziness": "AUTO",
+            "top_k": 10,
+            "num_candidates": None,
+            "rank_window_size": 50,
+            "rank_constant": 60,
+            "use_rrf": True,
+            "bm25_boost": 1.0,
+            "embedding_boost": 1.0,
+            "filter_policy": "replace",
+        },
+    }
+
+
+@patch("haystack_integrations.document_stores.elasticsearch.document_store.Elasticsearch")
+def test_from_dict(_mock_elasticsearch_client):
+    t = "haystack_integrations.components.retrievers.elasticsearch.hybrid_retriever.ElasticsearchHybridRetriever"
+    data = {
+        "type": t,
+        "init_parameters": {
+            "document_store": {
+                "init_parameters": {"hosts": "some fake host", "index": "default"},
+                "type": "haystack_integrations.document_stores.elasticsearch.document_store.ElasticsearchDocumentStore",
+            },
+            "filters": {},
+            "top_k": 5,
+            "rank_window_size": 50,
+            "use_rrf": False,
+            "filter_policy": "merge",
+        },
+    }
+    retriever = ElasticsearchHybridRetriever.from_dict(data)
+    assert retriever._document_store
+    assert retriever._top_k == 5
+    assert retriever._rank_window_size == 50
+    assert not retriever._use_rrf
+    assert retriever._filter_policy == FilterPolicy.MERGE
+
+
+def test_run():
+    mock_store = Mock(spec=ElasticsearchDocumentStore)
+    mock_store._hybrid_retrieval.return_value = [Document(content="Test doc")]
+    retriever = ElasticsearchHybridRetriever(document_store=mock_store, rank_window_size=20)
+    res = retriever.run(query="some query", query_embedding=[0.5, 0.7])
+    mock_store._hybrid_retrieval.assert_called_once_with(
+        query="some query",
+        query_embedding=[0.5, 0.7],
+        filters={},
+        fuzziness="AUTO",
+        top_k=10,
+        num_candidates=None,
+        rank_window_size=20,
+        rank_constant=60,
+        use_rrf=True,
+        bm25_boost=1.0,
+        embedding_boost=1.0,
+    )
+    assert len(res["documents"]) == 1
+    assert res["documents"][0].content == "Test doc"
+
+
+@pytest.mark.asyncio
+async def test_run_async():
+    mock_store = Mock(spec=ElasticsearchDocumentStore)
+    mock_store._hybrid_retrieval_async.return_value = [Document(content="test document")]
+    retriever = ElasticsearchHybridRetriever(
+        document_store=mock_store, filters={"some": "filter"}, top_k=3, filter_policy=FilterPolicy.MERGE
+    )
+    res = await retriever.run_async(query="some query", query_embedding=[0.5, 0.7], filters={"another": "filter"})
+    mock_store._hybrid_retrieval_async.assert_called_once_with(
+        query="some query",
+        query_embedding=[0.5, 0.7],
+        filters={"another": "filter"},
+        fuzziness="AUTO",
+        top_k=3,
+        num_candidates=None,
+        rank_window_size=None,
+        rank_constant=60,
+        use_rrf=True,
+        bm25_boost=1.0,
+        embedding_boost=1.0,
+    )
+    assert len(res["documents"]) == 1
+    assert res["documents"][0].content == "test document"
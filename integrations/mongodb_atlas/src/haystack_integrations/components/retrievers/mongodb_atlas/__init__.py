@@ -1,4 +1,5 @@
 from haystack_integrations.components.retrievers.mongodb_atlas.embedding_retriever import MongoDBAtlasEmbeddingRetriever
 from haystack_integrations.components.retrievers.mongodb_atlas.full_text_retriever import MongoDBAtlasFullTextRetriever
+from haystack_integrations.components.retrievers.mongodb_atlas.hybrid_retriever import MongoDBAtlasHybridRetriever
 
-__all__ = ["MongoDBAtlasEmbeddingRetriever", "MongoDBAtlasFullTextRetriever"]
+__all__ = ["MongoDBAtlasEmbeddingRetriever", "MongoDBAtlasFullTextRetriever", "MongoDBAtlasHybridRetriever"]
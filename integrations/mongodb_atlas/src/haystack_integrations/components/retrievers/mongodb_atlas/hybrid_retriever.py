@@ -0,0 +1,168 @@
+# SPDX-FileCopyrightText: 2023-present deepset GmbH <info@deepset.ai>
+#
+# SPDX-License-Identifier: Apache-2.0
+from typing import Any, Dict, List, Optional, Union
+
+from haystack import component, default_from_dict, default_to_dict
+from haystack.dataclasses import Document
+from haystack.document_stores.types import FilterPolicy
+from haystack.document_stores.types.filter_policy import apply_filter_policy
+
+from haystack_integrations.document_stores.mongodb_atlas import MongoDBAtlasDocumentStore
+
+
+@component
+class MongoDBAtlasHybridRetriever:
+    """
+    Retrieves documents from the MongoDBAtlasDocumentStore by combining embedding similarity and full-text search.
+
+    The vector search and the full-text search run in a single aggregation and their results are fused with
+    reciprocal rank fusion. It uses the `$rankFusion` stage where the MongoDB server supports it and an equivalent
+    `$unionWith` pipeline otherwise.
+    Both the vector_search_index and the full_text_search_index of the MongoDBAtlasDocumentStore are used.
+
+    Usage example:
+    ```python
+    import numpy as np
+    from haystack_integrations.document_stores.mongodb_atlas import MongoDBAtlasDocumentStore
+    from haystack_integrations.components.retrievers.mongodb_atlas import MongoDBAtlasHybridRetriever
+
+    store = MongoDBAtlasDocumentStore(database_name="haystack_integration_test",
+                                      collection_name="test_embeddings_collection",
+                                      vector_search_index="cosine_index",
+                                      full_text_search_index="full_text_index")
+    retriever = MongoDBAtlasHybridRetriever(document_store=store)
+
+    results = retriever.run(query="Lorem ipsum", query_embedding=np.random.random(768).tolist())
+    print(results["documents"])
+    ```
+
+    The example above retrieves the 10 documents ranked highest by the fusion of the full-text search for
+    "Lorem ipsum" and the vector search for a random query embedding.
+    """
+
+    def __init__(
+        self,
+        *,
+        document_store: MongoDBAtlasDocumentStore,
+        filters: Optional[Dict[str, Any]] = None,
+        top_k: int = 10,
+        filter_policy: Union[str, FilterPolicy] = FilterPolicy.REPLACE,
+    ):
+        """
+        Create the MongoDBAtlasHybridRetriever component.
+
+        :param document_store: An instance of MongoDBAtlasDocumentStore.
+        :param filters: Filters applied to the retrieved Documents. Make sure that the fields used in the filters are
+            included in the configuration of both the `vector_search_index` and the `full_text_search_index`.
+            The configuration must be done manually in the Web UI of MongoDB Atlas.
+        :param top_k: Maximum number of Documents to return.
+        :param filter_policy: Policy to determine how filters are applied.
+
+        :raises ValueError: If `document_store` is not an instance of `MongoDBAtlasDocumentStore`.
+        """
+        if not isinstance(document_store, MongoDBAtlasDocumentStore):
+            msg = "document_store must be an instance of MongoDBAtlasDocumentStore"
+            raise ValueError(msg)
+
+        self.document_store = document_store
+        self.filters = filters or {}
+        self.top_k = top_k
+        self.filter_policy = (
+            filter_policy if isinstance(filter_policy, FilterPolicy) else FilterPolicy.from_str(filter_policy)
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Serializes the component to a dictionary.
+
+        :returns:
+            Dictionary with serialized data.
+        """
+        return default_to_dict(
+            self,
+            filters=self.filters,
+            top_k=self.top_k,
+            filter_policy=self.filter_policy.value,
+            document_store=self.document_store.to_dict(),
+        )
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "MongoDBAtlasHybridRetriever":
+        """
+        Deserializes the component from a dictionary.
+
+        :param data:
+            Dictionary to deserialize from.
+        :returns:
+              Deserialized component.
+        """
+        data["init_parameters"]["document_store"] = MongoDBAtlasDocumentStore.from_dict(
+            data["init_parameters"]["document_store"]
+        )
+        if filter_policy := data["init_parameters"].get("filter_policy"):
+            data["init_parameters"]["filter_policy"] = FilterPolicy.from_str(filter_policy)
+        return default_from_dict(cls, data)
+
+    @component.output_types(documents=List[Document])
+    def run(
+        self,
+        query: Union[str, List[str]],
+        query_embedding: List[float],
+        filters: Optional[Dict[str, Any]] = None,
+        top_k: Optional[int] = None,
+    ) -> Dict[str, List[Document]]:
+        """
+        Retrieve documents from the MongoDBAtlasDocumentStore, based on both full-text search and embedding similarity.
+
+        :param query: The query string or a list of query strings for the full-text search.
+        :param query_embedding: Embedding of the query.
+        :param filters: Filters applied to the retrieved Documents. The way runtime filters are applied depends on
+                        the `filter_policy` chosen at retriever initialization. See init method docstring for more
+                        details.
+        :param top_k: Maximum number of Documents to return. Overrides the value specified at initialization.
+        :returns: A dictionary with the following keys:
+            - `documents`: List of Documents ranked highest by the fusion of the two searches
+        """
+        filters = apply_filter_policy(self.filter_policy, self.filters, filters)
+        top_k = top_k or self.top_k
+
+        docs = self.document_store._hybrid_retrieval(
+            query=query,
+            query_embedding=query_embedding,
+            filters=filters,
+            top_k=top_k,
+        )
+        return {"documents": docs}
+
+    @component.output_types(documents=List[Document])
+    async def run_async(
+        self,
+        query: Union[str, List[str]],
+        query_embedding: List[float],
+        filters: Optional[Dict[str, Any]] = None,
+        top_k: Optional[int] = None,
+    ) -> Dict[str, List[Document]]:
+        """
+        Asynchronously retrieve documents from the MongoDBAtlasDocumentStore, based on both full-text search and
+        embedding similarity.
+
+        :param query: The query string or a list of query strings for the full-text search.
+        :param query_embedding: Embedding of the query.
+        :param filters: Filters applied to the retrieved Documents. The way runtime filters are applied depends on
+                        the `filter_policy` chosen at retriever initialization. See init method docstring for more
+                        details.
+        :param top_k: Maximum number of Documents to return. Overrides the value specified at initialization.
+        :returns: A dictionary with the following keys:
+            - `documents`: List of Documents ranked highest by the fusion of the two searches
+        """
+        filters = apply_filter_policy(self.filter_policy, self.filters, filters)
+        top_k = top_k or self.top_k
+
+        docs = await self.document_store._hybrid_retrieval_async(
+            query=query,
+            query_embedding=query_embedding,
+            filters=filters,
+            top_k=top_k,
+        )
+        return {"documents": docs}
@@ -1,9 +1,14 @@
 # SPDX-FileCopyrightText: 2023-present deepset GmbH <info@deepset.ai>
 #
 # SPDX-License-Identifier: Apache-2.0
+import asyncio
 import re
-from typing import Any, Dict, List, Literal, Optional, Union
+import threading
+import weakref
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Dict, Iterator, List, Literal, Mapping, Optional, Tuple, Union
 
+from bson.binary import VECTOR_SUBTYPE, Binary, BinaryVectorDtype
 from haystack import default_from_dict, default_to_dict, logging
 from haystack.dataclasses.document import Document
 from haystack.document_stores.errors import DocumentStoreError, DuplicateDocumentError
@@ -13,12 +18,50 @@ from pymongo import AsyncMongoClient, InsertOne, MongoClient, ReplaceOne, Update
 from pymongo.asynchronous.collection import AsyncCollection
 from pymongo.collection import Collection
 from pymongo.driver_info import DriverInfo
-from pymongo.errors import BulkWriteError
+from pymongo.errors import BulkWriteError, OperationFailure
 
 from haystack_integrations.document_stores.mongodb_atlas.filters import _normalize_filters
 
 logger = logging.getLogger(__name__)
 
+# Constant used by reciprocal rank fusion, matching the one used by MongoDB's `$rankFusion` stage
+RRF_K = 60
+
+# Error code returned by MongoDB when a write violates a unique index, e.g. the one on the document ids
+DUPLICATE_KEY_ERROR_CODE = 11000
+
+# Default number of documents written in a single bulk write operation
+DEFAULT_WRITE_BATCH_SIZE = 1000
+
+# BSON binary vector types the embeddings can be stored as, instead of arrays of doubles
+BINARY_VECTOR_DTYPES = {
+    "float32": BinaryVectorDtype.FLOAT32,
+    "int8": BinaryVectorDtype.INT8,
+    "packed_bit": BinaryVectorDtype.PACKED_BIT,
+}
+
+# Error code returned by MongoDB for pipeline stages it does not know, e.g. `$rankFusion` before MongoDB 8.1
+UNRECOGNIZED_PIPELINE_STAGE_ERROR_CODE = 40324
+
+# MongoDB clients shared by all the document stores of the process, keyed by connection string and client options.
+# Each client holds its own connection pool, so sharing them avoids opening a pool per document store.
+# Async clients can only be used in the event loop they were created in, so they are also keyed by event loop.
+# They are closed when the last document store using them exits, so the stores using each of them are counted.
+_ClientKey = Tuple[Optional[str], Tuple[Tuple[str, Any], ...]]
+
+
+@dataclass
+class _SharedAsyncClient:
+    client: AsyncMongoClient
+    users: int = 0
+
+
+_clients: Dict[_ClientKey, MongoClient] = {}
+_async_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[_ClientKey, _SharedAsyncClient]]" = (
+    weakref.WeakKeyDictionary()
+)
+_clients_lock = threading.Lock()
+
 
 class MongoDBAtlasDocumentStore:
     """
@@ -65,6 +108,13 @@ class MongoDBAtlasDocumentStore:
         collection_name: str,
         vector_search_index: str,
         full_text_search_index: str,
+        write_batch_size: int = DEFAULT_WRITE_BATCH_SIZE,
+        max_concurrent_batches: int = 4,
+        embedding_format: Literal["array", "float32", "int8", "packed_bit"] = "array",
+        max_pool_size: Optional[int] = None,
+        min_pool_size: Optional[int] = None,
+        max_idle_time_ms: Optional[int] = None,
+        compressors: Optional[List[Literal["snappy", "zlib", "zstd"]]] = None,
     ):
         """
         Creates a new MongoDBAtlasDocumentStore instance.
@@ -84,12 +134,51 @@ class MongoDBAtlasDocumentStore:
             Create a full_text_search_index in the Atlas web UI and specify the init params of
             MongoDBAtlasDocumentStore. For more details refer to MongoDB Atlas
             [documentation](https://www.mongodb.com/docs/atlas/atlas-search/create-index/).
-
-        :raises ValueError: If the collection name contains invalid characters.
+        :param write_batch_size: The number of documents written in a single bulk write operation.
+            Bigger batches need fewer round trips to MongoDB Atlas, but each of them must fit in a single request.
+        :param max_concurrent_batches: The maximum number of bulk write operations run concurrently when writing
+            documents asynchronously. Set it to 1 to write the batches one after another.
+        :param embedding_format: How embeddings are stored in the collection.
+            - `"array"`: an array of doubles.
+            - `"float32"`: a BSON binary vector of 32-bit floats, taking about half of the space of an array.
+            - `"int8"`: a BSON binary vector of 8-bit integers. The embeddings must already be quantized to integers
+              between -128 and 127, for example by an embedder with int8 precision.
+            - `"packed_bit"`: a BSON binary vector of bits. The embeddings must already be packed to integers
+              between 0 and 255, for example by an embedder with ubinary precision.
+            The query embeddings of vector searches are encoded the same way. Embeddings stored as binary vectors are
+            decoded back to lists of floats when they are read.
+            See MongoDB Atlas [documentation](https://www.mongodb.com/docs/atlas/atlas-vector-search/create-embeddings/)
+            for the vector search indexes needed by each format.
+        :param max_pool_size: The maximum number of connections of the client connection pool.
+            If not set, the MongoDB driver default of 100 is used.
+        :param min_pool_size: The number of connections the client connection pool keeps open even when idle.
+            If not set, the MongoDB driver default of 0 is used.
+        :param max_idle_time_ms: How long a connection can stay idle in the pool before being closed, in milliseconds.
+            If not set, idle connections are never closed.
+        :param compressors: The compressors to negotiate with the server to compress the network traffic, by order
+            of preference. `"snappy"` and `"zstd"` need the `python-snappy` and `zstandard` packages respectively.
+
+        The MongoDB clients are shared by all the document stores of the process using the same connection string and
+        client options, and so are the retrievers using them. Async clients are shared within each event loop.
+
+        :raises ValueError: If the collection name contains invalid characters, `write_batch_size` or
+            `max_concurrent_batches` is not positive or `embedding_format` is not supported.
         """
         if collection_name and not bool(re.match(r"^[a-zA-Z0-9\-_]+$", collection_name)):
             msg = f'Invalid collection name: "{collection_name}". It can only contain letters, numbers, -, or _.'
             raise ValueError(msg)
+        if write_batch_size < 1:
+            msg = f"write_batch_size must be a positive integer, got {write_batch_size}."
+            raise ValueError(msg)
+        if max_concurrent_batches < 1:
+            msg = f"max_concurrent_batches must be a positive integer, got {max_concurrent_batches}."
+            raise ValueError(msg)
+        if embedding_format != "array" and embedding_format not in BINARY_VECTOR_DTYPES:
+            msg = (
+                f"Invalid embedding_format: '{embedding_format}'. "
+                f"Supported formats are: {['array', *BINARY_VECTOR_DTYPES]}."
+            )
+            raise ValueError(msg)
 
         self.mongo_connection_string = mongo_connection_string
 
@@ -97,24 +186,42 @@ class MongoDBAtlasDocumentStore:
         self.collection_name = collection_name
         self.vector_search_index = vector_search_index
         self.full_text_search_index = full_text_search_index
+        self.write_batch_size = write_batch_size
+        self.max_concurrent_batches = max_concurrent_batches
+        self.embedding_format = embedding_format
+        self.max_pool_size = max_pool_size
+        self.min_pool_size = min_pool_size
+        self.max_idle_time_ms = max_idle_time_ms
+        self.compressors = compressors
         self._connection: Optional[MongoClient] = None
         self._connection_async: Optional[AsyncMongoClient] = None
         self._collection: Optional[Collection] = None
         self._collection_async: Optional[AsyncCollection] = None
-
-    def __del__(self) -> None:
-        """
-        Destructor method to close MongoDB connections when the instance is destroyed.
-        """
-        if self._connection:
-            self._connection.close()
+        self._rank_fusion_supported: Optional[bool] = None
 
     async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
         """
         Asynchronous exit method to close MongoDB connections when the instance is destroyed.
+
+        The async client is shared, so it's only closed when the last document store using it exits. Document stores
+        set up afterwards use a new client.
         """
         if self._connection_async:
-            await self._connection_async.close()
+            client = self._connection_async
+            self._connection_async = None
+            self._collection_async = None
+            close_client = False
+            with _clients_lock:
+                loop_clients = _async_clients.get(asyncio.get_running_loop(), {})
+                for key, shared_client in list(loop_clients.items()):
+                    if shared_client.client is client:
+                        shared_client.users -= 1
+                        if shared_client.users == 0:
+                            del loop_clients[key]
+                            close_client = True
+                        break
+            if close_client:
+                await client.close()
 
     @property
     def connection(self) -> Union[AsyncMongoClient, MongoClient]:
@@ -189,10 +296,17 @@ class MongoDBAtlasDocumentStore:
         :raises DocumentStoreError: If the connection to MongoDB Atlas fails.
         :raises DocumentStoreError: If the collection does not exist.
         """
+        if self._collection is not None:
+            return
+
         if not self._connection:
-            self._connection = MongoClient(
-                self.mongo_connection_string.resolve_value(), driver=DriverInfo(name="MongoDBAtlasHaystackIntegration")
-            )
+            key = self._client_key()
+            with _clients_lock:
+                if key not in _clients:
+                    _clients[key] = MongoClient(
+                        key[0], driver=DriverInfo(name="MongoDBAtlasHaystackIntegration"), **dict(key[1])
+                    )
+                self._connection = _clients[key]
 
         if not self._connection_is_valid():
             msg = "Connection to MongoDB Atlas failed."
@@ -202,9 +316,8 @@ class MongoDBAtlasDocumentStore:
             msg = f"Collection '{self.collection_name}' does not exist in database '{self.database_name}'."
             raise DocumentStoreError(msg)
 
-        if self._collection is None:
-            database = self._connection[self.database_name]
-            self._collection = database[self.collection_name]
+        database = self._connection[self.database_name]
+        self._collection = database[self.collection_name]
 
     async def _ensure_connection_setup_async(self) -> None:
         """
@@ -213,10 +326,21 @@ class MongoDBAtlasDocumentStore:
         :raises DocumentStoreError: If the connection to MongoDB Atlas fails.
         :raises DocumentStoreError: If the collection does not exist.
         """
+        if self._collection_async is not None:
+            return
+
         if not self._connection_async:
-            self._connection_async = AsyncMongoClient(
-                self.mongo_connection_string.resolve_value(), driver=DriverInfo(name="MongoDBAtlasHaystackIntegration")
-            )
+            key = self._client_key()
+            with _clients_lock:
+                loop_clients = _async_clients.setdefault(asyncio.get_running_loop(), {})
+                if key not in loop_clients:
+                    loop_clients[key] = _SharedAsyncClient(
+                        AsyncMongoClient(
+                            key[0], driver=DriverInfo(name="MongoDBAtlasHaystackIntegration"), **dict(key[1])
+                        )
+                    )
+                loop_clients[key].users += 1
+                self._connection_async = loop_clients[key].client
 
         if not await self._connection_is_valid_async():
             msg = "Connection to MongoDB Atlas failed."
@@ -226,9 +350,23 @@ class MongoDBAtlasDocumentStore:
             msg = f"Collection '{self.collection_name}' does not exist in database '{self.database_name}'."
             raise DocumentStoreError(msg)
 
-        if self._collection_async is None:
-            database = self._connection_async[self.database_name]
-            self._collection_async = database[self.collection_name]
+        database = self._connection_async[self.database_name]
+        self._collection_async = database[self.collection_name]
+
+    def _client_key(self) -> _ClientKey:
+        """
+        Builds the key of the shared MongoDB clients the document store can use.
+
+        :returns: The connection string and the client options that differ from the MongoDB driver defaults.
+        """
+        options = {
+            "maxPoolSize": self.max_pool_size,
+            "minPoolSize": self.min_pool_size,
+            "maxIdleTimeMS": self.max_idle_time_ms,
+            "compressors": ",".join(self.compressors) if self.compressors else None,
+        }
+        client_options = tuple((name, value) for name, value in options.items() if value is not None)
+        return self.mongo_connection_string.resolve_value(), client_options
 
     def to_dict(self) -> Dict[str, Any]:
         """
@@ -244,6 +382,13 @@ class MongoDBAtlasDocumentStore:
             collection_name=self.collection_name,
             vector_search_index=self.vector_search_index,
             full_text_search_index=self.full_text_search_index,
+            write_batch_size=self.write_batch_size,
+            max_concurrent_batches=self.max_concurrent_batches,
+            embedding_format=self.embedding_format,
+            max_pool_size=self.max_pool_size,
+            min_pool_size=self.min_pool_size,
+            max_idle_time_ms=self.max_idle_time_ms,
+            compressors=self.compressors,
         )
 
     @classmethod
@@ -287,12 +432,7 @@ class MongoDBAtlasDocumentStore:
         :param filters: The filters to apply. It returns only the documents that match the filters.
         :returns: A list of Documents that match the given filters.
         """
-        self._ensure_connection_setup()
-        filters = _normalize_filters(filters) if filters else None
-        documents = list(self._collection.find(filters))  # type: ignore[union-attr]
-        for doc in documents:
-            doc.pop("_id", None)  # MongoDB's internal id doesn't belong into a Haystack document, so we remove it.
-        return [Document.from_dict(doc) for doc in documents]
+        return list(self.filter_documents_iter(filters))
 
     async def filter_documents_async(self, filters: Optional[Dict[str, Any]] = None) -> List[Document]:
         """
@@ -304,66 +444,98 @@ class MongoDBAtlasDocumentStore:
         :param filters: The filters to apply. It returns only the documents that match the filters.
         :returns: A list of Documents that match the given filters.
         """
+        return [doc async for doc in self.filter_documents_iter_async(filters)]
+
+    def filter_documents_iter(
+        self,
+        filters: Optional[Dict[str, Any]] = None,
+        *,
+        batch_size: Optional[int] = None,
+        return_embedding: bool = True,
+    ) -> Iterator[Document]:
+        """
+        Iterates over the documents that match the filters provided.
+
+        The documents are read from the cursor in batches and converted to Documents one at a time,
+        so the matching documents never need to be held in memory all at once.
+
+        :param filters: The filters to apply. It returns only the documents that match the filters.
+        :param batch_size: The number of documents the cursor fetches from MongoDB Atlas per round trip.
+            If not set, the driver's default is used.
+        :param return_embedding: Whether to return the embeddings of the documents.
+            If `False`, the embeddings are excluded on the server and not transferred.
+        :returns: An iterator over the Documents that match the given filters.
+        """
+        self._ensure_connection_setup()
+        filters = _normalize_filters(filters) if filters else None
+        cursor = self._collection.find(  # type: ignore[union-attr]
+            filters, self._filter_projection(return_embedding=return_embedding), batch_size=batch_size or 0
+        )
+        for doc in cursor:
+            yield self._mongo_doc_to_haystack_doc(doc)
+
+    async def filter_documents_iter_async(
+        self,
+        filters: Optional[Dict[str, Any]] = None,
+        *,
+        batch_size: Optional[int] = None,
+        return_embedding: bool = True,
+    ) -> AsyncIterator[Document]:
+        """
+        Asynchronously iterates over the documents that match the filters provided.
+
+        :param filters: The filters to apply. It returns only the documents that match the filters.
+        :param batch_size: The number of documents the cursor fetches from MongoDB Atlas per round trip.
+            If not set, the driver's default is used.
+        :param return_embedding: Whether to return the embeddings of the documents.
+            If `False`, the embeddings are excluded on the server and not transferred.
+        :returns: An async iterator over the Documents that match the given filters.
+        """
         await self._ensure_connection_setup_async()
         filters = _normalize_filters(filters) if filters else None
-        documents = await self._collection_async.find(filters).to_list()  # type: ignore[union-attr]
-        for doc in documents:
-            doc.pop("_id", None)
-        return [Document.from_dict(doc) for doc in documents]
+        cursor = self._collection_async.find(  # type: ignore[union-attr]
+            filters, self._filter_projection(return_embedding=return_embedding), batch_size=batch_size or 0
+        )
+        async for doc in cursor:
+            yield self._mongo_doc_to_haystack_doc(doc)
+
+    @staticmethod
+    def _filter_projection(*, return_embedding: bool) -> Dict[str, int]:
+        """
+        Builds the projection of filtered documents, leaving out MongoDB's internal id and optionally the embedding.
+        """
+        projection = {"_id": 0}
+        if not return_embedding:
+            projection["embedding"] = 0
+        return projection
 
     def write_documents(self, documents: List[Document], policy: DuplicatePolicy = DuplicatePolicy.NONE) -> int:
         """
         Writes documents into the MongoDB Atlas collection.
 
+        Documents are written in unordered bulk operations of `write_batch_size` documents, so a document that
+        can't be written doesn't prevent the others from being written.
+
         :param documents: A list of Documents to write to the document store.
         :param policy: The duplicate policy to use when writing documents.
         :raises DuplicateDocumentError: If a document with the same ID already exists in the document store
              and the policy is set to DuplicatePolicy.FAIL (or not specified).
+        :raises DocumentStoreError: If some documents could not be written for other reasons.
         :raises ValueError: If the documents are not of type Document.
         :returns: The number of documents written to the document store.
         """
         self._ensure_connection_setup()
+        policy, operations = self._prepare_write_operations(documents, policy)
 
-        if len(documents) > 0:
-            if not isinstance(documents[0], Document):
-                msg = "param 'documents' must contain a list of objects of type Document"
-                raise ValueError(msg)
-
-        if policy == DuplicatePolicy.NONE:
-            policy = DuplicatePolicy.FAIL
-
-        mongo_documents = []
-        for doc in documents:
-            doc_dict = doc.to_dict(flatten=False)
-            if "sparse_embedding" in doc_dict:
-                sparse_embedding = doc_dict.pop("sparse_embedding", None)
-                if sparse_embedding:
-                    logger.warning(
-                        "Document {id} has the `sparse_embedding` field set,"
-                        "but storing sparse embeddings in MongoDB Atlas is not currently supported."
-                        "The `sparse_embedding` field will be ignored.",
-                        id=doc.id,
-                    )
-            mongo_documents.append(doc_dict)
-        operations: List[Union[UpdateOne, InsertOne, ReplaceOne]]
-        written_docs = len(documents)
-
-        if policy == DuplicatePolicy.SKIP:
-            operations = [UpdateOne({"id": doc["id"]}, {"$setOnInsert": doc}, upsert=True) for doc in mongo_documents]
-            existing_documents = self._collection.count_documents({"id": {"$in": [doc.id for doc in documents]}})  # type: ignore[union-attr]
-            written_docs -= existing_documents
-        elif policy == DuplicatePolicy.FAIL:
-            operations = [InsertOne(doc) for doc in mongo_documents]
-        else:
-            operations = [ReplaceOne({"id": doc["id"]}, upsert=True, replacement=doc) for doc in mongo_documents]
-
-        try:
-            self._collection.bulk_write(operations)  # type: ignore[union-attr]
-        except BulkWriteError as e:
-            msg = f"Duplicate documents found: {e.details['writeErrors']}"
-            raise DuplicateDocumentError(msg) from e
+        results: List[Mapping[str, Any]] = []
+        for batch in self._split_into_batches(operations):
+            try:
+                result = self._collection.bulk_write(batch, ordered=False)  # type: ignore[union-attr]
+                results.append(result.bulk_api_result)
+            except BulkWriteError as e:
+                results.append(e.details)
 
-        return written_docs
+        return self._process_bulk_write_results(results, policy)
 
     async def write_documents_async(
         self, documents: List[Document], policy: DuplicatePolicy = DuplicatePolicy.NONE
@@ -371,15 +543,59 @@ class MongoDBAtlasDocumentStore:
         """
         Writes documents into the MongoDB Atlas collection.
 
+        Documents are written in unordered bulk operations of `write_batch_size` documents, up to
+        `max_concurrent_batches` of them running concurrently, so a document that can't be written doesn't prevent
+        the others from being written.
+
         :param documents: A list of Documents to write to the document store.
         :param policy: The duplicate policy to use when writing documents.
         :raises DuplicateDocumentError: If a document with the same ID already exists in the document store
              and the policy is set to DuplicatePolicy.FAIL (or not specified).
+        :raises DocumentStoreError: If some documents could not be written for other reasons.
         :raises ValueError: If the documents are not of type Document.
         :returns: The number of documents written to the document store.
         """
         await self._ensure_connection_setup_async()
+        policy, operations = self._prepare_write_operations(documents, policy)
 
+        semaphore = asyncio.Semaphore(self.max_concurrent_batches)
+
+        async def write_batch(batch: List[Union[UpdateOne, InsertOne, ReplaceOne]]) -> Mapping[str, Any]:
+            async with semaphore:
+                try:
+                    result = await self._collection_async.bulk_write(batch, ordered=False)  # type: ignore[union-attr]
+                    return result.bulk_api_result
+                except BulkWriteError as e:
+                    return e.details
+
+        tasks = [asyncio.create_task(write_batch(batch)) for batch in self._split_into_batches(operations)]
+        try:
+            results = await asyncio.gather(*tasks)
+        except BaseException:
+            # don't leave the other batches running in the background when one of them fails
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+
+        return self._process_bulk_write_results(list(results), policy)
+
+    def _split_into_batches(
+        self, operations: List[Union[UpdateOne, InsertOne, ReplaceOne]]
+    ) -> List[List[Union[UpdateOne, InsertOne, ReplaceOne]]]:
+        """
+        Splits the write operations into batches of `write_batch_size` operations.
+        """
+        return [operations[i : i + self.write_batch_size] for i in range(0, len(operations), self.write_batch_size)]
+
+    def _prepare_write_operations(
+        self, documents: List[Document], policy: DuplicatePolicy
+    ) -> Tuple[DuplicatePolicy, List[Union[UpdateOne, InsertOne, ReplaceOne]]]:
+        """
+        Converts the documents to the bulk write operations matching the duplicate policy.
+
+        :returns: The duplicate policy actually applied and the list of operations.
+        """
         if len(documents) > 0:
             if not isinstance(documents[0], Document):
                 msg = "param 'documents' must contain a list of objects of type Document"
@@ -409,24 +625,49 @@ class MongoDBAtlasDocumentStore:
                         "The `dataframe` field will soon be removed from Haystack Document.",
                         id=doc.id,
                     )
+            if doc_dict.get("embedding") is not None:
+                doc_dict["embedding"] = self._encode_embedding(doc_dict["embedding"])
             mongo_documents.append(doc_dict)
-        operations: List[Union[UpdateOne, InsertOne, ReplaceOne]]
-        written_docs = len(documents)
 
+        operations: List[Union[UpdateOne, InsertOne, ReplaceOne]]
         if policy == DuplicatePolicy.SKIP:
             operations = [UpdateOne({"id": doc["id"]}, {"$setOnInsert": doc}, upsert=True) for doc in mongo_documents]
-            existing_documents = self._collection.count_documents({"id": {"$in": [doc.id for doc in documents]}})  # type: ignore[union-attr]
-            written_docs -= existing_documents
         elif policy == DuplicatePolicy.FAIL:
             operations = [InsertOne(doc) for doc in mongo_documents]
         else:
             operations = [ReplaceOne({"id": doc["id"]}, upsert=True, replacement=doc) for doc in mongo_documents]
+        return policy, operations
 
-        try:
-            await self._collection_async.bulk_write(operations)  # type: ignore[union-attr]
-        except BulkWriteError as e:
-            msg = f"Duplicate documents found: {e.details['writeErrors']}"
-            raise DuplicateDocumentError(msg) from e
+    @staticmethod
+    def _process_bulk_write_results(results: List[Mapping[str, Any]], policy: DuplicatePolicy) -> int:
+        """
+        Counts the documents written by the bulk write batches and raises the errors of all of them at once.
+
+        :param results: The bulk write result of each batch, or the details of the error it raised.
+        :param policy: The duplicate policy used to write the documents.
+        :raises DuplicateDocumentError: If all the failed writes are caused by already existing document ids.
+        :raises DocumentStoreError: If some writes failed for other reasons.
+        :returns: The number of documents written.
+        """
+        written_docs = 0
+        write_errors = []
+        for result in results:
+            # Skipped documents are matched without being upserted, overwritten ones are matched and replaced
+            written_docs += result["nInserted"] + result["nUpserted"]
+            if policy == DuplicatePolicy.OVERWRITE:
+                written_docs += result["nMatched"]
+            write_errors.extend(result.get("writeErrors", []))
+
+        if write_errors:
+            error_messages = [error.get("errmsg") for error in write_errors]
+            if all(error.get("code") == DUPLICATE_KEY_ERROR_CODE for error in write_errors):
+                msg = f"Duplicate documents found: {error_messages}"
+                raise DuplicateDocumentError(msg)
+            msg = (
+                f"Failed to write {len(write_errors)} documents to MongoDB Atlas, "
+                f"{written_docs} documents were written. Errors: {error_messages}"
+            )
+            raise DocumentStoreError(msg)
 
         return written_docs
 
@@ -452,6 +693,34 @@ class MongoDBAtlasDocumentStore:
             return
         await self._collection_async.delete_many(filter={"id": {"$in": document_ids}})  # type: ignore[union-attr]
 
+    def delete_by_filter(self, filters: Dict[str, Any]) -> int:
+        """
+        Deletes all documents that match the provided filters, without fetching them first.
+
+        For a detailed specification of the filters,
+        refer to the Haystack [documentation](https://docs.haystack.deepset.ai/v2.0/docs/metadata-filtering).
+
+        :param filters: The filters to select the documents to delete.
+        :returns: The number of documents deleted.
+        """
+        self._ensure_connection_setup()
+        result = self._collection.delete_many(filter=_normalize_filters(filters))  # type: ignore[union-attr]
+        return result.deleted_count
+
+    async def delete_by_filter_async(self, filters: Dict[str, Any]) -> int:
+        """
+        Asynchronously deletes all documents that match the provided filters, without fetching them first.
+
+        For a detailed specification of the filters,
+        refer to the Haystack [documentation](https://docs.haystack.deepset.ai/v2.0/docs/metadata-filtering).
+
+        :param filters: The filters to select the documents to delete.
+        :returns: The number of documents deleted.
+        """
+        await self._ensure_connection_setup_async()
+        result = await self._collection_async.delete_many(filter=_normalize_filters(filters))  # type: ignore[union-attr]
+        return result.deleted_count
+
     def _embedding_retrieval(
         self,
         query_embedding: List[float],
@@ -480,7 +749,7 @@ class MongoDBAtlasDocumentStore:
                 "$vectorSearch": {
                     "index": self.vector_search_index,
                     "path": "embedding",
-                    "queryVector": query_embedding,
+                    "queryVector": self._encode_embedding(query_embedding),
                     "numCandidates": 100,
                     "limit": top_k,
                     "filter": filters,
@@ -537,7 +806,7 @@ class MongoDBAtlasDocumentStore:
                 "$vectorSearch": {
                     "index": self.vector_search_index,
                     "path": "embedding",
-                    "queryVector": query_embedding,
+                    "queryVector": self._encode_embedding(query_embedding),
                     "numCandidates": 100,
                     "limit": top_k,
                     "filter": filters,
@@ -770,6 +1039,219 @@ class MongoDBAtlasDocumentStore:
 
         return [self._mongo_doc_to_haystack_doc(doc) for doc in documents]
 
+    def _hybrid_retrieval(
+        self,
+        query: Union[str, List[str]],
+        query_embedding: List[float],
+        filters: Optional[Dict[str, Any]] = None,
+        top_k: int = 10,
+    ) -> List[Document]:
+        """
+        Retrieve documents using both a vector search and a full-text search, fused by reciprocal rank fusion.
+
+        Both searches run in a single aggregation: with `$rankFusion` where the server supports it and with
+        `$unionWith` and `$group` otherwise.
+
+        :param query: The query string or a list of query strings for the full-text search.
+        :param query_embedding: Embedding of the query for the vector search.
+        :param filters: Optional filters. The fields used in the filters must be included in the configuration of
+            both the `vector_search_index` and the `full_text_search_index`.
+        :param top_k: How many documents to return.
+        :returns: A list of Documents ranked by their fused score.
+        :raises ValueError: If `query` or `query_embedding` is empty.
+        :raises DocumentStoreError: If the retrieval of documents from MongoDB Atlas fails.
+        """
+        filters = self._prepare_hybrid_retrieval(query, query_embedding, filters)
+        self._ensure_connection_setup()
+
+        try:
+            if self._rank_fusion_supported is not False:
+                try:
+                    pipeline = self._build_rank_fusion_pipeline(query, query_embedding, filters, top_k)
+                    documents = list(self._collection.aggregate(pipeline))  # type: ignore[union-attr]
+                    self._rank_fusion_supported = True
+                except OperationFailure as e:
+                    if e.code != UNRECOGNIZED_PIPELINE_STAGE_ERROR_CODE:
+                        raise
+                    self._rank_fusion_supported = False
+            if self._rank_fusion_supported is False:
+                pipeline = self._build_union_with_fusion_pipeline(query, query_embedding, filters, top_k)
+                documents = list(self._collection.aggregate(pipeline))  # type: ignore[union-attr]
+        except Exception as e:
+            msg = f"Retrieval of documents from MongoDB Atlas failed: {e}"
+            if filters:
+                msg += (
+                    "\nMake sure that the fields used in the filters are included in the configuration of both "
+                    "the `vector_search_index` and the `full_text_search_index`"
+                )
+            raise DocumentStoreError(msg) from e
+
+        return [self._mongo_doc_to_haystack_doc(doc) for doc in documents]
+
+    async def _hybrid_retrieval_async(
+        self,
+        query: Union[str, List[str]],
+        query_embedding: List[float],
+        filters: Optional[Dict[str, Any]] = None,
+        top_k: int = 10,
+    ) -> List[Document]:
+        """
+        Asynchronously retrieve documents using both a vector search and a full-text search, fused by reciprocal
+        rank fusion.
+
+        :param query: The query string or a list of query strings for the full-text search.
+        :param query_embedding: Embedding of the query for the vector search.
+        :param filters: Optional filters. The fields used in the filters must be included in the configuration of
+            both the `vector_search_index` and the `full_text_search_index`.
+        :param top_k: How many documents to return.
+        :returns: A list of Documents ranked by their fused score.
+        :raises ValueError: If `query` or `query_embedding` is empty.
+        :raises DocumentStoreError: If the retrieval of documents from MongoDB Atlas fails.
+        """
+        filters = self._prepare_hybrid_retrieval(query, query_embedding, filters)
+        await self._ensure_connection_setup_async()
+
+        try:
+            if self._rank_fusion_supported is not False:
+                try:
+                    pipeline = self._build_rank_fusion_pipeline(query, query_embedding, filters, top_k)
+                    cursor = await self._collection_async.aggregate(pipeline)  # type: ignore[union-attr]
+                    documents = await cursor.to_list(length=None)
+                    self._rank_fusion_supported = True
+                except OperationFailure as e:
+                    if e.code != UNRECOGNIZED_PIPELINE_STAGE_ERROR_CODE:
+                        raise
+                    self._rank_fusion_supported = False
+            if self._rank_fusion_supported is False:
+                pipeline = self._build_union_with_fusion_pipeline(query, query_embedding, filters, top_k)
+                cursor = await self._collection_async.aggregate(pipeline)  # type: ignore[union-attr]
+                documents = await cursor.to_list(length=None)
+        except Exception as e:
+            msg = f"Retrieval of documents from MongoDB Atlas failed: {e}"
+            if filters:
+                msg += (
+                    "\nMake sure that the fields used in the filters are included in the configuration of both "
+                    "the `vector_search_index` and the `full_text_search_index`"
+                )
+            raise DocumentStoreError(msg) from e
+
+        return [self._mongo_doc_to_haystack_doc(doc) for doc in documents]
+
+    @staticmethod
+    def _prepare_hybrid_retrieval(
+        query: Union[str, List[str]], query_embedding: List[float], filters: Optional[Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        """
+        Validates the hybrid retrieval inputs and returns the normalized filters.
+        """
+        if not query:
+            msg = "Argument query must not be empty."
+            raise ValueError(msg)
+        if not query_embedding:
+            msg = "Query embedding must not be empty"
+            raise ValueError(msg)
+        return _normalize_filters(filters) if filters else {}
+
+    def _hybrid_search_stages(
+        self, query: Union[str, List[str]], query_embedding: List[float], filters: Dict[str, Any], top_k: int
+    ) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """
+        Builds the stages of the vector search and of the full-text search that are fused in a hybrid retrieval.
+        """
+        vector_search: List[Dict[str, Any]] = [
+            {
+                "$vectorSearch": {
+                    "index": self.vector_search_index,
+                    "path": "embedding",
+                    "queryVector": self._encode_embedding(query_embedding),
+                    "numCandidates": 100,
+                    "limit": top_k,
+                    "filter": filters,
+                }
+            }
+        ]
+        full_text_search: List[Dict[str, Any]] = [
+            {
+                "$search": {
+                    "index": self.full_text_search_index,
+                    "compound": {"must": [{"text": {"path": "content", "query": query}}]},
+                }
+            },
+            {"$match": filters},
+            {"$limit": top_k},
+        ]
+        return vector_search, full_text_search
+
+    def _build_rank_fusion_pipeline(
+        self, query: Union[str, List[str]], query_embedding: List[float], filters: Dict[str, Any], top_k: int
+    ) -> List[Dict[str, Any]]:
+        """
+        Builds a hybrid retrieval pipeline fusing the two searches with the `$rankFusion` stage.
+        """
+        vector_search, full_text_search = self._hybrid_search_stages(query, query_embedding, filters, top_k)
+        return [
+            {"$rankFusion": {"input": {"pipelines": {"vector": vector_search, "full_text": full_text_search}}}},
+            {"$limit": top_k},
+            {
+                "$project": {
+                    "_id": 0,
+                    "id": 1,
+                    "content": 1,
+                    "blob": 1,
+                    "meta": 1,
+                    "embedding": 1,
+                    "score": {"$meta": "score"},
+                }
+            },
+        ]
+
+    def _build_union_with_fusion_pipeline(
+        self, query: Union[str, List[str]], query_embedding: List[float], filters: Dict[str, Any], top_k: int
+    ) -> List[Dict[str, Any]]:
+        """
+        Builds a hybrid retrieval pipeline for servers without `$rankFusion`.
+
+        Each search ranks its results and scores them with `1 / (RRF_K + rank)`. The results of the full-text search
+        are appended with `$unionWith` and the scores of the same document are summed with `$group`.
+        """
+        vector_search, full_text_search = self._hybrid_search_stages(query, query_embedding, filters, top_k)
+
+        def rank_stages(score_field: str) -> List[Dict[str, Any]]:
+            return [
+                {"$group": {"_id": None, "docs": {"$push": "$$ROOT"}}},
+                {"$unwind": {"path": "$docs", "includeArrayIndex": "rank"}},
+                {"$addFields": {f"docs.{score_field}": {"$divide": [1.0, {"$add": ["$rank", RRF_K + 1]}]}}},
+                {"$replaceRoot": {"newRoot": "$docs"}},
+            ]
+
+        return [
+            *vector_search,
+            *rank_stages("vector_score"),
+            {
+                "$unionWith": {
+                    "coll": self.collection_name,
+                    "pipeline": [*full_text_search, *rank_stages("full_text_score")],
+                }
+            },
+            {
+                "$group": {
+                    "_id": "$_id",
+                    "doc": {"$first": "$$ROOT"},
+                    "vector_score": {"$max": "$vector_score"},
+                    "full_text_score": {"$max": "$full_text_score"},
+                }
+            },
+            {
+                "$addFields": {
+                    "score": {"$add": [{"$ifNull": ["$vector_score", 0]}, {"$ifNull": ["$full_text_score", 0]}]}
+                }
+            },
+            {"$sort": {"score": -1, "_id": 1}},
+            {"$limit": top_k},
+            {"$replaceRoot": {"newRoot": {"$mergeObjects": ["$doc", {"score": "$score"}]}}},
+            {"$project": {"_id": 0, "id": 1, "content": 1, "blob": 1, "meta": 1, "embedding": 1, "score": 1}},
+        ]
+
     @staticmethod
     def _mongo_doc_to_haystack_doc(mongo_doc: Dict[str, Any]) -> Document:
         """
@@ -779,4 +1261,30 @@ class MongoDBAtlasDocumentStore:
         :returns: A Haystack Document object
         """
         mongo_doc.pop("_id", None)
+        embedding = mongo_doc.get("embedding")
+        if isinstance(embedding, Binary) and embedding.subtype == VECTOR_SUBTYPE:
+            mongo_doc["embedding"] = [float(value) for value in embedding.as_vector().data]
         return Document.from_dict(mongo_doc)
+
+    def _encode_embedding(self, embedding: List[float]) -> Union[List[float], Binary]:
+        """
+        Encodes an embedding in the `embedding_format` of the document store.
+
+        :param embedding: The embedding to encode.
+        :returns: The embedding itself for the `"array"` format, otherwise a BSON binary vector.
+        :raises ValueError: If the embedding can't be encoded in an integer format.
+        """
+        if self.embedding_format == "array":
+            return embedding
+        dtype = BINARY_VECTOR_DTYPES[self.embedding_format]
+        if dtype == BinaryVectorDtype.FLOAT32:
+            return Binary.from_vector([float(value) for value in embedding], dtype)
+
+        low, high = (-128, 127) if dtype == BinaryVectorDtype.INT8 else (0, 255)
+        if not all(float(value).is_integer() and low <= value <= high for value in embedding):
+            msg = (
+                f"Embeddings stored in the '{self.embedding_format}' format must contain integers between "
+                f"{low} and {high}. Quantize the embeddings before writing or querying them."
+            )
+            raise ValueError(msg)
+        return Binary.from_vector([int(value) for value in embedding], dtype)
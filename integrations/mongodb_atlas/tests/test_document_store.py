@@ -2,17 +2,19 @@
 #
 # SPDX-License-Identifier: Apache-2.0
 import os
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 from uuid import uuid4
 
 import pytest
+from bson.binary import Binary, BinaryVectorDtype
 from haystack.dataclasses.document import ByteStream, Document
-from haystack.document_stores.errors import DuplicateDocumentError
+from haystack.document_stores.errors import DocumentStoreError, DuplicateDocumentError
 from haystack.document_stores.types import DuplicatePolicy
 from haystack.testing.document_store import DocumentStoreBaseTests
 from haystack.utils import Secret
-from pymongo import MongoClient
+from pymongo import InsertOne, MongoClient, ReplaceOne
 from pymongo.driver_info import DriverInfo
+from pymongo.errors import BulkWriteError
 
 from haystack_integrations.document_stores.mongodb_atlas import MongoDBAtlasDocumentStore
 
@@ -29,6 +31,234 @@ def test_init_is_lazy(_mock_client):
     _mock_client.assert_not_called()
 
 
+@patch.dict("haystack_integrations.document_stores.mongodb_atlas.document_store._clients", clear=True)
+@patch("haystack_integrations.document_stores.mongodb_atlas.document_store.MongoClient")
+def test_client_is_shared_between_stores(mock_client):
+    mock_client.return_value.__getitem__.return_value.list_collection_names.return_value = ["collection_name"]
+    stores = [
+        MongoDBAtlasDocumentStore(
+            mongo_connection_string=Secret.from_token("test"),
+            database_name="database_name",
+            collection_name="collection_name",
+            vector_search_index="cosine_index",
+            full_text_search_index="full_text_index",
+            max_pool_size=50,
+            compressors=["zstd", "zlib"],
+        )
+        for _ in range(2)
+    ]
+
+    for store in stores:
+        store._ensure_connection_setup()
+        store._ensure_connection_setup()
+
+    mock_client.assert_called_once_with(
+        "test", driver=DriverInfo(name="MongoDBAtlasHaystackIntegration"), maxPoolSize=50, compressors="zstd,zlib"
+    )
+    assert stores[0].connection is stores[1].connection
+    # the connection is only checked when each store is set up
+    assert mock_client.return_value.admin.command.call_count == 2
+
+    other_store = MongoDBAtlasDocumentStore(
+        mongo_connection_string=Secret.from_token("test"),
+        database_name="database_name",
+        collection_name="collection_name",
+        vector_search_index="cosine_index",
+        full_text_search_index="full_text_index",
+    )
+    other_store._ensure_connection_setup()
+    assert mock_client.call_count == 2
+    mock_client.assert_called_with("test", driver=DriverInfo(name="MongoDBAtlasHaystackIntegration"))
+
+
+@patch.object(MongoDBAtlasDocumentStore, "_ensure_connection_setup")
+def test_filter_documents_iter(_mock_ensure_connection_setup):
+    store = MongoDBAtlasDocumentStore(
+        mongo_connection_string=Secret.from_token("test"),
+        database_name="database_name",
+        collection_name="collection_name",
+        vector_search_index="cosine_index",
+        full_text_search_index="full_text_index",
+    )
+    store._collection = MagicMock()
+    store._collection.find.return_value = iter(
+        [{"id": "1", "content": "first", "meta": {"number": 1}}, {"id": "2", "content": "second"}]
+    )
+
+    documents = store.filter_documents_iter(
+        {"field": "meta.number", "operator": ">", "value": 0}, batch_size=50, return_embedding=False
+    )
+
+    # the query only runs when the iteration starts
+    store._collection.find.assert_not_called()
+    assert next(documents) == Document(id="1", content="first", meta={"number": 1})
+    store._collection.find.assert_called_once_with(
+        {"meta.number": {"$gt": 0}}, {"_id": 0, "embedding": 0}, batch_size=50
+    )
+    assert list(documents) == [Document(id="2", content="second")]
+
+    store._collection.find.return_value = iter([])
+    assert store.filter_documents() == []
+    store._collection.find.assert_called_with(None, {"_id": 0}, batch_size=0)
+
+
+def _bulk_write_result(n_inserted=0, n_upserted=0, n_matched=0, write_errors=None):
+    return {
+        "nInserted": n_inserted,
+        "nUpserted": n_upserted,
+        "nMatched": n_matched,
+        "nModified": n_matched,
+        "nRemoved": 0,
+        "writeErrors": write_errors or [],
+    }
+
+
+@patch.object(MongoDBAtlasDocumentStore, "_ensure_connection_setup")
+def test_write_documents_in_unordered_batches(_mock_ensure_connection_setup):
+    store = MongoDBAtlasDocumentStore(
+        mongo_connection_string=Secret.from_token("test"),
+        database_name="database_name",
+        collection_name="collection_name",
+        vector_search_index="cosine_index",
+        full_text_search_index="full_text_index",
+        write_batch_size=2,
+    )
+    store._collection = MagicMock()
+    store._collection.bulk_write.side_effect = [
+        MagicMock(bulk_api_result=_bulk_write_result(n_upserted=1, n_matched=1)),
+        MagicMock(bulk_api_result=_bulk_write_result(n_upserted=1)),
+    ]
+    docs = [Document(id=str(i), content=f"doc {i}") for i in range(3)]
+
+    assert store.write_documents(docs, policy=DuplicatePolicy.OVERWRITE) == 3
+
+    batches = [call.args[0] for call in store._collection.bulk_write.call_args_list]
+    assert [len(batch) for batch in batches] == [2, 1]
+    assert all(isinstance(operation, ReplaceOne) for batch in batches for operation in batch)
+    assert all(call.kwargs == {"ordered": False} for call in store._collection.bulk_write.call_args_list)
+
+    store._collection.bulk_write.reset_mock()
+    assert store.write_documents([]) == 0
+    store._collection.bulk_write.assert_not_called()
+
+
+@patch.object(MongoDBAtlasDocumentStore, "_ensure_connection_setup")
+def test_write_documents_aggregates_batch_errors(_mock_ensure_connection_setup):
+    store = MongoDBAtlasDocumentStore(
+        mongo_connection_string=Secret.from_token("test"),
+        database_name="database_name",
+        collection_name="collection_name",
+        vector_search_index="cosine_index",
+        full_text_search_index="full_text_index",
+        write_batch_size=2,
+    )
+    store._collection = MagicMock()
+    duplicate_error = {"index": 0, "code": 11000, "errmsg": "E11000 duplicate key error"}
+    store._collection.bulk_write.side_effect = [
+        BulkWriteError(_bulk_write_result(n_inserted=1, write_errors=[duplicate_error])),
+        BulkWriteError(_bulk_write_result(write_errors=[duplicate_error])),
+    ]
+    docs = [Document(id=str(i), content=f"doc {i}") for i in range(3)]
+
+    # every batch is written even if a previous one failed
+    with pytest.raises(DuplicateDocumentError, match="E11000"):
+        store.write_documents(docs)
+    assert store._collection.bulk_write.call_count == 2
+    assert isinstance(store._collection.bulk_write.call_args.args[0][0], InsertOne)
+
+    store._collection.bulk_write.side_effect = [
+        BulkWriteError(_bulk_write_result(n_inserted=1, write_errors=[duplicate_error])),
+        BulkWriteError(_bulk_write_result(write_errors=[{"index": 0, "code": 10334, "errmsg": "too large"}])),
+    ]
+    with pytest.raises(DocumentStoreError, match="Failed to write 2 documents"):
+        store.write_documents(docs)
+
+
+@patch.object(MongoDBAtlasDocumentStore, "_ensure_connection_setup")
+def test_delete_by_filter(_mock_ensure_connection_setup):
+    store = MongoDBAtlasDocumentStore(
+        mongo_connection_string=Secret.from_token("test"),
+        database_name="database_name",
+        collection_name="collection_name",
+        vector_search_index="cosine_index",
+        full_text_search_index="full_text_index",
+    )
+    store._collection = MagicMock()
+    store._collection.delete_many.return_value.deleted_count = 2
+
+    assert store.delete_by_filter({"field": "meta.number", "operator": "<", "value": 2}) == 2
+    store._collection.delete_many.assert_called_once_with(filter={"meta.number": {"$lt": 2}})
+
+
+def test_init_with_invalid_write_batch_size():
+    with pytest.raises(ValueError, match="write_batch_size"):
+        MongoDBAtlasDocumentStore(
+            mongo_connection_string=Secret.from_token("test"),
+            database_name="database_name",
+            collection_name="collection_name",
+            vector_search_index="cosine_index",
+            full_text_search_index="full_text_index",
+            write_batch_size=0,
+        )
+
+
+@patch.object(MongoDBAtlasDocumentStore, "_ensure_connection_setup")
+def test_binary_embedding_format(_mock_ensure_connection_setup):
+    store = MongoDBAtlasDocumentStore(
+        mongo_connection_string=Secret.from_token("test"),
+        database_name="database_name",
+        collection_name="collection_name",
+        vector_search_index="cosine_index",
+        full_text_search_index="full_text_index",
+        embedding_format="float32",
+    )
+    store._collection = MagicMock()
+    store._collection.bulk_write.return_value.bulk_api_result = _bulk_write_result(n_inserted=2)
+
+    store.write_documents([Document(id="1", embedding=[0.5, -0.25]), Document(id="2", content="no embedding")])
+
+    operations = store._collection.bulk_write.call_args.args[0]
+    assert operations[0]._doc["embedding"] == Binary.from_vector([0.5, -0.25], BinaryVectorDtype.FLOAT32)
+    assert operations[1]._doc["embedding"] is None
+
+    store._collection.aggregate.return_value = [{"id": "1", "embedding": operations[0]._doc["embedding"], "score": 1.0}]
+    documents = store._embedding_retrieval(query_embedding=[0.5, -0.25])
+    pipeline = store._collection.aggregate.call_args.args[0]
+    assert pipeline[0]["$vectorSearch"]["queryVector"] == Binary.from_vector([0.5, -0.25], BinaryVectorDtype.FLOAT32)
+    assert documents == [Document(id="1", embedding=[0.5, -0.25], score=1.0)]
+
+
+def test_integer_binary_embedding_formats():
+    store = MongoDBAtlasDocumentStore(
+        mongo_connection_string=Secret.from_token("test"),
+        database_name="database_name",
+        collection_name="collection_name",
+        vector_search_index="cosine_index",
+        full_text_search_index="full_text_index",
+        embedding_format="int8",
+    )
+    encoded = store._encode_embedding([-128.0, 0, 127])
+    assert encoded == Binary.from_vector([-128, 0, 127], BinaryVectorDtype.INT8)
+    assert store._mongo_doc_to_haystack_doc({"id": "1", "embedding": encoded}).embedding == [-128.0, 0.0, 127.0]
+    with pytest.raises(ValueError, match="integers between -128 and 127"):
+        store._encode_embedding([0.5, 1])
+
+    store.embedding_format = "packed_bit"
+    assert store._encode_embedding([255, 8]) == Binary.from_vector([255, 8], BinaryVectorDtype.PACKED_BIT)
+    with pytest.raises(ValueError, match="integers between 0 and 255"):
+        store._encode_embedding([256])
+
+    with pytest.raises(ValueError, match="Invalid embedding_format"):
+        MongoDBAtlasDocumentStore(
+            mongo_connection_string=Secret.from_token("test"),
+            database_name="database_name",
+            collection_name="collection_name",
+            vector_search_index="cosine_index",
+            full_text_search_index="full_text_index",
+            embedding_format="float16",
+        )
+
+
 @pytest.mark.skipif(
     not os.environ.get("MONGO_CONNECTION_STRING"),
     reason="No MongoDB Atlas connection string provided",
@@ -87,6 +317,13 @@ class TestDocumentStore(DocumentStoreBaseTests):
                 "database_name": "haystack_integration_test",
                 "vector_search_index": "cosine_index",
                 "full_text_search_index": "full_text_index",
+                "write_batch_size": 1000,
+                "max_concurrent_batches": 4,
+                "embedding_format": "array",
+                "max_pool_size": None,
+                "min_pool_size": None,
+                "max_idle_time_ms": None,
+                "compressors": None,
             },
         }
 
@@ -115,6 +352,21 @@ class TestDocumentStore(DocumentStoreBaseTests):
         assert docstore.vector_search_index == "cosine_index"
         assert docstore.full_text_search_index == "full_text_index"
 
+    def test_filter_documents_iter(self, document_store: MongoDBAtlasDocumentStore):
+        docs = [Document(content=f"doc {i}", embedding=[0.1, 0.2], meta={"number": i}) for i in range(5)]
+        document_store.write_documents(docs)
+
+        result = list(document_store.filter_documents_iter(batch_size=2, return_embedding=False))
+        assert sorted(doc.content for doc in result) == sorted(doc.content for doc in docs)
+        assert all(doc.embedding is None for doc in result)
+
+    def test_delete_by_filter(self, document_store: MongoDBAtlasDocumentStore):
+        docs = [Document(content=f"doc {i}", meta={"number": i}) for i in range(4)]
+        document_store.write_documents(docs)
+        deleted = document_store.delete_by_filter({"field": "meta.number", "operator": ">=", "value": 2})
+        assert deleted == 2
+        assert sorted(doc.meta["number"] for doc in document_store.filter_documents()) == [0, 1]
+
     def test_complex_filter(self, document_store, filterable_docs):
         document_store.write_documents(filterable_docs)
         filters = {
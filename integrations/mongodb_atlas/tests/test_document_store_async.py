@@ -1,8 +1,9 @@
 # SPDX-FileCopyrightText: 2023-present deepset GmbH <info@deepset.ai>
 #
 # SPDX-License-Identifier: Apache-2.0
+import asyncio
 import os
-from unittest.mock import patch
+from unittest.mock import AsyncMock, MagicMock, Mock, patch
 from uuid import uuid4
 
 import pytest
@@ -13,6 +14,7 @@ from haystack.testing.document_store import FilterableDocsFixtureMixin
 from haystack.utils import Secret
 from pymongo import MongoClient
 from pymongo.driver_info import DriverInfo
+from pymongo.errors import BulkWriteError
 
 from haystack_integrations.document_stores.mongodb_atlas import MongoDBAtlasDocumentStore
 
@@ -30,6 +32,233 @@ def test_init_is_lazy(_mock_client):
     _mock_client.assert_not_called()
 
 
+@patch("haystack_integrations.document_stores.mongodb_atlas.document_store.AsyncMongoClient")
+async def test_async_client_is_shared_between_stores(mock_client):
+    mock_client.return_value = MagicMock(admin=AsyncMock(), close=AsyncMock())
+    mock_client.return_value.__getitem__.return_value = AsyncMock(
+        list_collection_names=AsyncMock(return_value=["collection_name"])
+    )
+    stores = [
+        MongoDBAtlasDocumentStore(
+            mongo_connection_string=Secret.from_token("async_test"),
+            database_name="database_name",
+            collection_name="collection_name",
+            vector_search_index="cosine_index",
+            full_text_search_index="full_text_index",
+            min_pool_size=5,
+            max_idle_time_ms=60000,
+        )
+        for _ in range(2)
+    ]
+
+    await asyncio.gather(*(store._ensure_connection_setup_async() for store in stores))
+
+    mock_client.assert_called_once_with(
+        "async_test", driver=DriverInfo(name="MongoDBAtlasHaystackIntegration"), minPoolSize=5, maxIdleTimeMS=60000
+    )
+    assert stores[0].connection is stores[1].connection
+
+    # the shared client stays open while another store uses it
+    await stores[0].__aexit__(None, None, None)
+    mock_client.return_value.close.assert_not_awaited()
+    await stores[1]._ensure_connection_setup_async()
+    assert stores[1].connection is mock_client.return_value
+    assert mock_client.call_count == 1
+
+    # exiting the last store closes the shared client, so the next stores use a new one
+    await stores[1].__aexit__(None, None, None)
+    mock_client.return_value.close.assert_awaited_once()
+    await stores[0]._ensure_connection_setup_async()
+    assert mock_client.call_count == 2
+    await stores[0].__aexit__(None, None, None)
+
+
+@patch("haystack_integrations.document_stores.mongodb_atlas.document_store.AsyncMongoClient")
+async def test_async_client_stays_open_while_a_store_uses_it(mock_client):
+    mock_client.side_effect = lambda *_args, **_kwargs: MagicMock(
+        admin=AsyncMock(),
+        close=AsyncMock(),
+        __getitem__=Mock(return_value=AsyncMock(list_collection_names=AsyncMock(return_value=["collection_name"]))),
+    )
+    stores = [
+        MongoDBAtlasDocumentStore(
+            mongo_connection_string=Secret.from_token("shared_test"),
+            database_name="database_name",
+            collection_name="collection_name",
+            vector_search_index="cosine_index",
+            full_text_search_index="full_text_index",
+        )
+        for _ in range(3)
+    ]
+    await stores[0]._ensure_connection_setup_async()
+    await stores[1]._ensure_connection_setup_async()
+    client = stores[0].connection
+
+    # only one of the two stores sharing the client exits
+    await stores[0].__aexit__(None, None, None)
+
+    client.close.assert_not_awaited()
+    await stores[1]._ensure_connection_setup_async()
+    await stores[2]._ensure_connection_setup_async()
+    assert stores[1].connection is client
+    assert stores[2].connection is client
+    mock_client.assert_called_once()
+
+    await stores[1].__aexit__(None, None, None)
+    client.close.assert_not_awaited()
+    await stores[2].__aexit__(None, None, None)
+    client.close.assert_awaited_once()
+
+
+@patch.object(MongoDBAtlasDocumentStore, "_ensure_connection_setup_async")
+async def test_filter_documents_iter_async(_mock_ensure_connection_setup_async):
+    async def cursor():
+        yield {"id": "1", "content": "first", "embedding": [0.1, 0.2]}
+        yield {"id": "2", "content": "second", "embedding": [0.3, 0.4]}
+
+    store = MongoDBAtlasDocumentStore(
+        mongo_connection_string=Secret.from_token("test"),
+        database_name="database_name",
+        collection_name="collection_name",
+        vector_search_index="cosine_index",
+        full_text_search_index="full_text_index",
+    )
+    store._collection_async = MagicMock()
+    store._collection_async.find.side_effect = lambda *_args, **_kwargs: cursor()
+
+    documents = [doc async for doc in store.filter_documents_iter_async(batch_size=10)]
+
+    store._collection_async.find.assert_called_once_with(None, {"_id": 0}, batch_size=10)
+    assert documents == [
+        Document(id="1", content="first", embedding=[0.1, 0.2]),
+        Document(id="2", content="second", embedding=[0.3, 0.4]),
+    ]
+    assert await store.filter_documents_async() == documents
+
+
+@patch.object(MongoDBAtlasDocumentStore, "_ensure_connection_setup_async")
+async def test_write_documents_async_runs_batches_concurrently(_mock_ensure_connection_setup_async):
+    store = MongoDBAtlasDocumentStore(
+        mongo_connection_string=Secret.from_token("test"),
+        database_name="database_name",
+        collection_name="collection_name",
+        vector_search_index="cosine_index",
+        full_text_search_index="full_text_index",
+        write_batch_size=2,
+    )
+    running = 0
+    max_running = 0
+
+    async def bulk_write(operations, ordered):
+        nonlocal running, max_running
+        assert ordered is False
+        running += 1
+        max_running = max(max_running, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        if len(operations) == 1:
+            duplicate_error = {"index": 0, "code": 11000, "errmsg": "E11000 duplicate key error"}
+            raise BulkWriteError({"nInserted": 0, "nUpserted": 0, "nMatched": 1, "writeErrors": [duplicate_error]})
+        return MagicMock(bulk_api_result={"nInserted": 0, "nUpserted": 2, "nMatched": 0, "writeErrors": []})
+
+    store._collection_async = MagicMock()
+    store._collection_async.bulk_write.side_effect = bulk_write
+    docs = [Document(id=str(i), content=f"doc {i}") for i in range(5)]
+
+    assert await store.write_documents_async(docs[:4], policy=DuplicatePolicy.SKIP) == 4
+    assert max_running == 2
+
+    with pytest.raises(DuplicateDocumentError, match="E11000"):
+        await store.write_documents_async(docs)
+    assert store._collection_async.bulk_write.call_count == 5
+
+
+@patch.object(MongoDBAtlasDocumentStore, "_ensure_connection_setup_async")
+async def test_write_documents_async_limits_concurrent_batches(_mock_ensure_connection_setup_async):
+    store = MongoDBAtlasDocumentStore(
+        mongo_connection_string=Secret.from_token("test"),
+        database_name="database_name",
+        collection_name="collection_name",
+        vector_search_index="cosine_index",
+        full_text_search_index="full_text_index",
+        write_batch_size=1,
+        max_concurrent_batches=2,
+    )
+    running = 0
+    max_running = 0
+
+    async def bulk_write(operations, ordered):  # noqa: ARG001
+        nonlocal running, max_running
+        running += 1
+        max_running = max(max_running, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        return MagicMock(bulk_api_result={"nInserted": 1, "nUpserted": 0, "nMatched": 0, "writeErrors": []})
+
+    store._collection_async = MagicMock()
+    store._collection_async.bulk_write.side_effect = bulk_write
+    docs = [Document(id=str(i), content=f"doc {i}") for i in range(5)]
+
+    assert await store.write_documents_async(docs) == 5
+    assert store._collection_async.bulk_write.call_count == 5
+    assert max_running == 2
+
+
+@patch.object(MongoDBAtlasDocumentStore, "_ensure_connection_setup_async")
+async def test_write_documents_async_cancels_pending_batches_on_error(_mock_ensure_connection_setup_async):
+    store = MongoDBAtlasDocumentStore(
+        mongo_connection_string=Secret.from_token("test"),
+        database_name="database_name",
+        collection_name="collection_name",
+        vector_search_index="cosine_index",
+        full_text_search_index="full_text_index",
+        write_batch_size=1,
+        max_concurrent_batches=2,
+    )
+    started = []
+    cancelled = []
+
+    async def bulk_write(operations, ordered):  # noqa: ARG001
+        doc_id = operations[0]._doc["id"]
+        started.append(doc_id)
+        if doc_id == "0":
+            msg = "connection lost"
+            raise ConnectionError(msg)
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.append(doc_id)
+            raise
+        return MagicMock(bulk_api_result={"nInserted": 1, "nUpserted": 0, "nMatched": 0, "writeErrors": []})
+
+    store._collection_async = MagicMock()
+    store._collection_async.bulk_write.side_effect = bulk_write
+    docs = [Document(id=str(i), content=f"doc {i}") for i in range(4)]
+
+    with pytest.raises(ConnectionError, match="connection lost"):
+        await store.write_documents_async(docs)
+    # the batches that were already sent were cancelled, the remaining ones were never sent
+    assert "1" in cancelled
+    assert cancelled == started[1:]
+    assert len(started) < len(docs)
+
+
+@patch.object(MongoDBAtlasDocumentStore, "_ensure_connection_setup_async")
+async def test_delete_by_filter_async(_mock_ensure_connection_setup_async):
+    store = MongoDBAtlasDocumentStore(
+        mongo_connection_string=Secret.from_token("test"),
+        database_name="database_name",
+        collection_name="collection_name",
+        vector_search_index="cosine_index",
+        full_text_search_index="full_text_index",
+    )
+    store._collection_async = AsyncMock()
+    store._collection_async.delete_many.return_value = MagicMock(deleted_count=3)
+
+    assert await store.delete_by_filter_async({"field": "meta.type", "operator": "==", "value": "a"}) == 3
+    store._collection_async.delete_many.assert_awaited_once_with(filter={"meta.type": {"$eq": "a"}})
+
+
 @pytest.mark.skipif(not os.environ.get("MONGO_CONNECTION_STRING"), reason="No MongoDBAtlas connection string provided")
 @pytest.mark.integration
 class TestDocumentStoreAsync(FilterableDocsFixtureMixin):
@@ -62,8 +291,7 @@ class TestDocumentStoreAsync(FilterableDocsFixtureMixin):
             yield store
         finally:
             # Ensure async connection is closed before synchronous teardown
-            if store._connection_async:
-                await store.connection.close()
+            await store.__aexit__(None, None, None)
 
             # Synchronous teardown
             if sync_client:
@@ -122,6 +350,21 @@ class TestDocumentStoreAsync(FilterableDocsFixtureMixin):
         ]
         assert result == expected
 
+    async def test_filter_documents_iter_async(self, document_store: MongoDBAtlasDocumentStore):
+        docs = [Document(content=f"doc {i}", embedding=[0.1, 0.2]) for i in range(5)]
+        await document_store.write_documents_async(docs)
+
+        result = [doc async for doc in document_store.filter_documents_iter_async(batch_size=2, return_embedding=False)]
+        assert sorted(doc.content for doc in result) == sorted(doc.content for doc in docs)
+        assert all(doc.embedding is None for doc in result)
+
+    async def test_delete_by_filter_async(self, document_store: MongoDBAtlasDocumentStore):
+        docs = [Document(content=f"doc {i}", meta={"number": i}) for i in range(4)]
+        await document_store.write_documents_async(docs)
+        deleted = await document_store.delete_by_filter_async({"field": "meta.number", "operator": "<", "value": 1})
+        assert deleted == 1
+        assert await document_store.count_documents_async() == 3
+
     async def test_delete_documents_async(self, document_store: MongoDBAtlasDocumentStore):
         docs = [Document(id="1", content="some text")]
         await document_store.write_documents_async(docs)
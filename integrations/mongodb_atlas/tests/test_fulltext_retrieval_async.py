@@ -38,8 +38,8 @@ class AsyncDocumentStoreContext:
         return self.store
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        if self.store and self.store._connection_async:
-            await self.store._connection_async.close()
+        if self.store:
+            await self.store.__aexit__(exc_type, exc_val, exc_tb)
 
 
 @pytest.mark.skipif(
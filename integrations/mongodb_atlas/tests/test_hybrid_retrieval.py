@@ -0,0 +1,185 @@
+# SPDX-FileCopyrightText: 2023-present deepset GmbH <info@deepset.ai>
+#
+# SPDX-License-Identifier: Apache-2.0
+import os
+from time import sleep
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from haystack import Document
+from haystack.document_stores.errors import DocumentStoreError
+from haystack.utils import Secret
+from pymongo.errors import OperationFailure
+
+from haystack_integrations.document_stores.mongodb_atlas import MongoDBAtlasDocumentStore
+
+
+def get_document_store():
+    return MongoDBAtlasDocumentStore(
+        mongo_connection_string=Secret.from_env_var("MONGO_CONNECTION_STRING_2"),
+        database_name="haystack_test",
+        collection_name="test_collection",
+        vector_search_index="cosine_index",
+        full_text_search_index="full_text_index",
+    )
+
+
+@pytest.fixture
+def document_store():
+    with patch.object(MongoDBAtlasDocumentStore, "_ensure_connection_setup"):
+        store = get_document_store()
+        store._collection = MagicMock()
+        yield store
+
+
+def test_rank_fusion_pipeline(document_store):
+    document_store._collection.aggregate.return_value = [
+        {"id": "1", "content": "The fox was brown", "meta": {}, "score": 0.03}
+    ]
+
+    results = document_store._hybrid_retrieval(
+        query="fox",
+        query_embedding=[0.1, 0.2],
+        filters={"field": "meta.meta_field", "operator": "==", "value": "right_value"},
+        top_k=3,
+    )
+
+    pipeline = document_store._collection.aggregate.call_args[0][0]
+    assert pipeline == [
+        {
+            "$rankFusion": {
+                "input": {
+                    "pipelines": {
+                        "vector": [
+                            {
+                                "$vectorSearch": {
+                                    "index": "cosine_index",
+                                    "path": "embedding",
+                                    "queryVector": [0.1, 0.2],
+                                    "numCandidates": 100,
+                                    "limit": 3,
+                                    "filter": {"meta.meta_field": {"$eq": "right_value"}},
+                                }
+                            }
+                        ],
+                        "full_text": [
+                            {
+                                "$search": {
+                                    "index": "full_text_index",
+                                    "compound": {"must": [{"text": {"path": "content", "query": "fox"}}]},
+                                }
+                            },
+                            {"$match": {"meta.meta_field": {"$eq": "right_value"}}},
+                            {"$limit": 3},
+                        ],
+                    }
+                }
+            }
+        },
+        {"$limit": 3},
+        {
+            "$project": {
+                "_id": 0,
+                "id": 1,
+                "content": 1,
+                "blob": 1,
+                "meta": 1,
+                "embedding": 1,
+                "score": {"$meta": "score"},
+            }
+        },
+    ]
+    assert results == [Document(id="1", content="The fox was brown", score=0.03)]
+    assert document_store._rank_fusion_supported is True
+
+
+def test_union_with_fallback_when_rank_fusion_is_not_supported(document_store):
+    document_store._collection.aggregate.side_effect = [
+        OperationFailure("Unrecognized pipeline stage name: '$rankFusion'", code=40324),
+        [{"id": "1", "content": "The fox was brown", "meta": {}, "score": 0.03}],
+        [],
+    ]
+
+    results = document_store._hybrid_retrieval(query="fox", query_embedding=[0.1, 0.2], top_k=3)
+
+    assert results == [Document(id="1", content="The fox was brown", score=0.03)]
+    assert document_store._rank_fusion_supported is False
+    pipeline = document_store._collection.aggregate.call_args[0][0]
+    assert "$vectorSearch" in pipeline[0]
+    union_with = next(stage["$unionWith"] for stage in pipeline if "$unionWith" in stage)
+    assert union_with["coll"] == "test_collection"
+    assert "$search" in union_with["pipeline"][0]
+    assert {"$limit": 3} in pipeline
+
+    # the fallback is remembered and $rankFusion is not tried again
+    document_store._hybrid_retrieval(query="fox", query_embedding=[0.1, 0.2], top_k=3)
+    assert document_store._collection.aggregate.call_count == 3
+    assert "$unionWith" in str(document_store._collection.aggregate.call_args[0][0])
+
+
+def test_hybrid_retrieval_failure(document_store):
+    document_store._collection.aggregate.side_effect = OperationFailure("some failure", code=1)
+
+    with pytest.raises(DocumentStoreError):
+        document_store._hybrid_retrieval(query="fox", query_embedding=[0.1, 0.2])
+    assert document_store._rank_fusion_supported is None
+
+
+@pytest.mark.parametrize("query, query_embedding", [("", [0.1]), ([], [0.1]), ("fox", [])])
+def test_hybrid_retrieval_invalid_inputs(document_store, query, query_embedding):
+    with pytest.raises(ValueError):
+        document_store._hybrid_retrieval(query=query, query_embedding=query_embedding)
+
+
+@pytest.mark.asyncio
+async def test_hybrid_retrieval_async():
+    with patch.object(MongoDBAtlasDocumentStore, "_ensure_connection_setup_async"):
+        document_store = get_document_store()
+        cursor = MagicMock(to_list=AsyncMock(return_value=[{"id": "1", "content": "fox", "meta": {}, "score": 0.5}]))
+        document_store._collection_async = MagicMock(
+            aggregate=AsyncMock(side_effect=[OperationFailure("Unrecognized pipeline stage name", code=40324), cursor])
+        )
+
+        results = await document_store._hybrid_retrieval_async(query="fox", query_embedding=[0.1, 0.2], top_k=3)
+
+    assert results == [Document(id="1", content="fox", score=0.5)]
+    assert document_store._rank_fusion_supported is False
+
+
+@pytest.mark.skipif(
+    not os.environ.get("MONGO_CONNECTION_STRING_2"),
+    reason="No MongoDB Atlas connection string provided",
+)
+@pytest.mark.integration
+class TestHybridRetrieval:
+    @pytest.fixture(scope="class")
+    def document_store(self) -> MongoDBAtlasDocumentStore:
+        return get_document_store()
+
+    @pytest.fixture(autouse=True, scope="class")
+    def setup_teardown(self, document_store):
+        document_store._ensure_connection_setup()
+        document_store._collection.delete_many({})
+        document_store.write_documents(
+            [
+                Document(content="The quick brown fox chased the dog", embedding=[0.1] * 768),
+                Document(content="The fox was brown", embedding=[0.2] * 768),
+                Document(content="The lazy dog", embedding=[0.3] * 768),
+            ]
+        )
+
+        # Wait for documents to be indexed
+        sleep(5)
+
+        yield
+
+    def test_hybrid_retrieval(self, document_store: MongoDBAtlasDocumentStore):
+        results = document_store._hybrid_retrieval(query="fox", query_embedding=[0.2] * 768, top_k=2)
+        assert len(results) == 2
+        assert results[0].content == "The fox was brown"
+        assert results[0].score >= results[1].score
+
+    async def test_hybrid_retrieval_async(self, document_store: MongoDBAtlasDocumentStore):
+        results = await document_store._hybrid_retrieval_async(query="fox", query_embedding=[0.2] * 768, top_k=2)
+        assert len(results) == 2
+        assert results[0].content == "The fox was brown"
@@ -11,6 +11,7 @@ from haystack.utils.auth import EnvVarSecret
 from haystack_integrations.components.retrievers.mongodb_atlas import (
     MongoDBAtlasEmbeddingRetriever,
     MongoDBAtlasFullTextRetriever,
+    MongoDBAtlasHybridRetriever,
 )
 from haystack_integrations.document_stores.mongodb_atlas import MongoDBAtlasDocumentStore
 
@@ -95,6 +96,13 @@ class TestEmbeddingRetriever:
                         "collection_name": "test_embeddings_collection",
                         "vector_search_index": "cosine_index",
                         "full_text_search_index": "full_text_index",
+                        "write_batch_size": 1000,
+                        "max_concurrent_batches": 4,
+                        "embedding_format": "array",
+                        "max_pool_size": None,
+                        "min_pool_size": None,
+                        "max_idle_time_ms": None,
+                        "compressors": None,
                     },
                 },
                 "filters": {"field": "value"},
@@ -331,6 +339,13 @@ class TestFullTextRetriever:
                         "collection_name": "test_full_text_collection",
                         "vector_search_index": "cosine_index",
                         "full_text_search_index": "full_text_index",
+                        "write_batch_size": 1000,
+                        "max_concurrent_batches": 4,
+                        "embedding_format": "array",
+                        "max_pool_size": None,
+                        "min_pool_size": None,
+                        "max_idle_time_ms": None,
+                        "compressors": None,
                     },
                 },
                 "filters": {"field": "value"},
@@ -497,3 +512,104 @@ class TestFullTextRetriever:
         )
 
         assert res == {"documents": [doc]}
+
+
+class TestHybridRetriever:
+    @pytest.fixture
+    def mock_client(self):
+        with patch(
+            "haystack_integrations.document_stores.mongodb_atlas.document_store.MongoClient"
+        ) as mock_mongo_client:
+            mock_connection = MagicMock()
+            mock_database = MagicMock()
+            mock_collection_names = MagicMock(return_value=["test_embeddings_collection"])
+            mock_database.list_collection_names = mock_collection_names
+            mock_connection.__getitem__.return_value = mock_database
+            mock_mongo_client.return_value = mock_connection
+            yield mock_mongo_client
+
+    def test_init_default(self):
+        mock_store = Mock(spec=MongoDBAtlasDocumentStore)
+        retriever = MongoDBAtlasHybridRetriever(document_store=mock_store)
+        assert retriever.document_store == mock_store
+        assert retriever.filters == {}
+        assert retriever.top_k == 10
+        assert retriever.filter_policy == FilterPolicy.REPLACE
+
+        with pytest.raises(ValueError):
+            MongoDBAtlasHybridRetriever(document_store=mock_store, filter_policy="wrong_policy")
+
+        with pytest.raises(ValueError):
+            MongoDBAtlasHybridRetriever(document_store=Mock())
+
+    def test_to_dict_from_dict(self, mock_client, monkeypatch):  # noqa: ARG002  mock_client is required
+        monkeypatch.setenv("MONGO_CONNECTION_STRING", "test_conn_str")
+
+        document_store = MongoDBAtlasDocumentStore(
+            database_name="haystack_integration_test",
+            collection_name="test_embeddings_collection",
+            vector_search_index="cosine_index",
+            full_text_search_index="full_text_index",
+        )
+
+        retriever = MongoDBAtlasHybridRetriever(
+            document_store=document_store, filters={"field": "value"}, top_k=5, filter_policy="merge"
+        )
+        res = retriever.to_dict()
+        assert res == {
+            "type": "haystack_integrations.components.retrievers.mongodb_atlas.hybrid_retriever.MongoDBAtlasHybridRetriever",  # noqa: E501
+            "init_parameters": {
+                "document_store": document_store.to_dict(),
+                "filters": {"field": "value"},
+                "top_k": 5,
+                "filter_policy": "merge",
+            },
+        }
+
+        retriever = MongoDBAtlasHybridRetriever.from_dict(res)
+        assert isinstance(retriever.document_store, MongoDBAtlasDocumentStore)
+        assert isinstance(retriever.document_store.mongo_connection_string, EnvVarSecret)
+        assert retriever.document_store.collection_name == "test_embeddings_collection"
+        assert retriever.filters == {"field": "value"}
+        assert retriever.top_k == 5
+        assert retriever.filter_policy == FilterPolicy.MERGE
+
+    def test_run(self):
+        mock_store = Mock(spec=MongoDBAtlasDocumentStore)
+        doc = Document(content="Test doc", embedding=[0.1, 0.2])
+        mock_store._hybrid_retrieval.return_value = [doc]
+
+        retriever = MongoDBAtlasHybridRetriever(document_store=mock_store)
+        res = retriever.run(query="Lorem ipsum", query_embedding=[0.3, 0.5], top_k=3)
+
+        mock_store._hybrid_retrieval.assert_called_once_with(
+            query="Lorem ipsum", query_embedding=[0.3, 0.5], filters={}, top_k=3
+        )
+
+        assert res == {"documents": [doc]}
+
+    @pytest.mark.asyncio
+    async def test_run_async(self):
+        mock_store = Mock(spec=MongoDBAtlasDocumentStore)
+        doc = Document(content="Test doc", embedding=[0.1, 0.2])
+        mock_store._hybrid_retrieval_async.return_value = [doc]
+
+        retriever = MongoDBAtlasHybridRetriever(
+            document_store=mock_store,
+            filters={"field": "meta.some_field", "operator": "==", "value": "SomeValue"},
+            filter_policy=FilterPolicy.MERGE,
+        )
+        res = await retriever.run_async(
+            query="Lorem ipsum",
+            query_embedding=[0.3, 0.5],
+            filters={"field": "meta.some_field", "operator": "==", "value": "Test"},
+        )
+
+        mock_store._hybrid_retrieval_async.assert_called_once_with(
+            query="Lorem ipsum",
+            query_embedding=[0.3, 0.5],
+            filters={"field": "meta.some_field", "operator": "==", "value": "Test"},
+            top_k=10,
+        )
+
+        assert res == {"documents": [doc]}
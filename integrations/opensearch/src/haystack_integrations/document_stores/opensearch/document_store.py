@@ -2,6 +2,8 @@
 #
 # SPDX-License-Identifier: Apache-2.0
 
+import asyncio
+import time
 from math import exp
 from typing import Any, Dict, List, Mapping, Optional, Union
 
@@ -31,6 +33,8 @@ BM25_SCALING_FACTOR = 8
 
 DEFAULT_SETTINGS = {"index.knn": True}
 DEFAULT_MAX_CHUNK_BYTES = 100 * 1024 * 1024
+# interval in seconds between two status checks of a `_delete_by_query` or `_update_by_query` task
+DEFAULT_TASK_POLL_INTERVAL = 0.5
 
 
 class OpenSearchDocumentStore:
@@ -523,6 +527,167 @@ class OpenSearchDocumentStore:
 
         await async_bulk(**self._prepare_bulk_delete_request(document_ids=document_ids, is_async=True))
 
+    def _prepare_by_query_request(
+        self, *, filters: Dict[str, Any], meta: Optional[Dict[str, Any]] = None, slices: Union[int, str]
+    ) -> Dict[str, Any]:
+        if not filters:
+            msg = "filters must be a non-empty dictionary"
+            raise ValueError(msg)
+
+        body: Dict[str, Any] = {"query": {"bool": {"filter": normalize_filters(filters)}}}
+        if meta is not None:
+            if not meta:
+                msg = "meta must be a non-empty dictionary"
+                raise ValueError(msg)
+            # Documents are stored with their meta fields flattened into the top level of `_source`
+            body["script"] = {
+                "source": "for (entry in params.entrySet()) { ctx._source[entry.getKey()] = entry.getValue(); }",
+                "lang": "painless",
+                "params": meta,
+            }
+
+        # The request is submitted as a background task so that long-running operations on large indices
+        # are not bound by the HTTP timeout. The task is then polled until it completes.
+        return {
+            "index": self._index,
+            "body": body,
+            "slices": slices,
+            "conflicts": "proceed",
+            "refresh": True,
+            "wait_for_completion": False,
+        }
+
+    @staticmethod
+    def _process_by_query_task(task: Dict[str, Any], operation: str) -> Optional[int]:
+        """
+        Returns the number of affected documents of a completed `_delete_by_query` or `_update_by_query` task,
+        or None if the task is still running.
+        """
+        if not task.get("completed"):
+            return None
+
+        if "error" in task:
+            msg = f"Failed to {operation} documents in OpenSearch. Error:\n{task['error']}"
+            raise DocumentStoreError(msg)
+
+        response = task.get("response", {})
+        if failures := response.get("failures"):
+            msg = f"Failed to {operation} documents in OpenSearch. Errors:\n{failures}"
+            raise DocumentStoreError(msg)
+
+        return response["deleted"] if operation == "delete" else response["updated"]
+
+    def _wait_for_by_query_task(self, task_id: str, operation: str) -> int:
+        assert self._client is not None
+
+        while True:
+            result = self._process_by_query_task(self._client.tasks.get(task_id=task_id), operation)
+            if result is not None:
+                return result
+            time.sleep(DEFAULT_TASK_POLL_INTERVAL)
+
+    async def _wait_for_by_query_task_async(self, task_id: str, operation: str) -> int:
+        assert self._async_client is not None
+
+        while True:
+            result = self._process_by_query_task(await self._async_client.tasks.get(task_id=task_id), operation)
+            if result is not None:
+                return result
+            await asyncio.sleep(DEFAULT_TASK_POLL_INTERVAL)
+
+    def delete_by_filter(self, filters: Dict[str, Any], *, slices: Union[int, str] = "auto") -> int:
+        """
+        Deletes all documents that match the provided filters, without fetching them first.
+
+        The deletion runs server-side through OpenSearch's `_delete_by_query` API.
+        For a detailed specification of the filters,
+        refer to the [documentation](https://docs.haystack.deepset.ai/docs/metadata-filtering)
+
+        :param filters: The filters to select the documents to delete.
+        :param slices: The number of slices the deletion is split into to run in parallel.
+            Defaults to "auto", which lets OpenSearch choose one slice per shard.
+        :raises DocumentStoreError: If OpenSearch reports failures while deleting documents.
+        :returns: The number of documents deleted.
+        """
+        self._ensure_initialized()
+        assert self._client is not None
+
+        request = self._prepare_by_query_request(filters=filters, slices=slices)
+        task_id = self._client.delete_by_query(**request)["task"]
+        return self._wait_for_by_query_task(task_id, "delete")
+
+    async def delete_by_filter_async(self, filters: Dict[str, Any], *, slices: Union[int, str] = "auto") -> int:
+        """
+        Asynchronously deletes all documents that match the provided filters, without fetching them first.
+
+        The deletion runs server-side through OpenSearch's `_delete_by_query` API.
+        For a detailed specification of the filters,
+        refer to the [documentation](https://docs.haystack.deepset.ai/docs/metadata-filtering)
+
+        :param filters: The filters to select the documents to delete.
+        :param slices: The number of slices the deletion is split into to run in parallel.
+            Defaults to "auto", which lets OpenSearch choose one slice per shard.
+        :raises DocumentStoreError: If OpenSearch reports failures while deleting documents.
+        :returns: The number of documents deleted.
+        """
+        self._ensure_initialized()
+        assert self._async_client is not None
+
+        request = self._prepare_by_query_request(filters=filters, slices=slices)
+        task_id = (await self._async_client.delete_by_query(**request))["task"]
+        return await self._wait_for_by_query_task_async(task_id, "delete")
+
+    def update_by_filter(
+        self, filters: Dict[str, Any], meta: Dict[str, Any], *, slices: Union[int, str] = "auto"
+    ) -> int:
+        """
+        Updates the metadata of all documents that match the provided filters, without fetching them first.
+
+        The update runs server-side through OpenSearch's `_update_by_query` API.
+        The keys in `meta` are added to the documents' metadata, overwriting existing values.
+        For a detailed specification of the filters,
+        refer to the [documentation](https://docs.haystack.deepset.ai/docs/metadata-filtering)
+
+        :param filters: The filters to select the documents to update.
+        :param meta: The metadata fields to set on the matching documents.
+        :param slices: The number of slices the update is split into to run in parallel.
+            Defaults to "auto", which lets OpenSearch choose one slice per shard.
+        :raises DocumentStoreError: If OpenSearch reports failures while updating documents.
+        :returns: The number of documents updated.
+        """
+        self._ensure_initialized()
+        assert self._client is not None
+
+        request = self._prepare_by_query_request(filters=filters, meta=meta, slices=slices)
+        task_id = self._client.update_by_query(**request)["task"]
+        return self._wait_for_by_query_task(task_id, "update")
+
+    async def update_by_filter_async(
+        self, filters: Dict[str, Any], meta: Dict[str, Any], *, slices: Union[int, str] = "auto"
+    ) -> int:
+        """
+        Asynchronously updates the metadata of all documents that match the provided filters, without fetching them
+        first.
+
+        The update runs server-side through OpenSearch's `_update_by_query` API.
+        The keys in `meta` are added to the documents' metadata, overwriting existing values.
+        For a detailed specification of the filters,
+        refer to the [documentation](https://docs.haystack.deepset.ai/docs/metadata-filtering)
+
+        :param filters: The filters to select the documents to update.
+        :param meta: The metadata fields to set on the matching documents.
+        :param slices: The number of slices the update is split into to run in parallel.
+            Defaults to "auto", which lets OpenSearch choose one slice per shard.
+        :raises DocumentStoreError: If OpenSearch reports failures while updating documents.
+        :returns: The number of documents updated.
+        """
+        self._ensure_initialized()
+        assert self._async_client is not None
+
+        request = self._prepare_by_query_request(filters=filters, meta=meta, slices=slices)
+        task_id = (await self._async_client.update_by_query(**request))["task"]
+        return await self._wait_for_by_query_task_async(task_id, "update")
+
     def _prepare_bm25_search_request(
         self,
         *,
@@ -110,6 +110,59 @@ def test_get_default_mappings(_mock_opensearch_client):
     }
 
 
+@patch("haystack_integrations.document_stores.opensearch.document_store.OpenSearch")
+def test_delete_by_filter_polls_task(_mock_opensearch_client):
+    store = OpenSearchDocumentStore(hosts="testhost")
+    client = _mock_opensearch_client.return_value
+    client.delete_by_query.return_value = {"task": "node:1"}
+    client.tasks.get.side_effect = [
+        {"completed": False},
+        {"completed": True, "response": {"deleted": 3, "failures": []}},
+    ]
+
+    with patch("haystack_integrations.document_stores.opensearch.document_store.time.sleep"):
+        deleted = store.delete_by_filter({"field": "meta.source", "operator": "==", "value": "a"}, slices=2)
+
+    assert deleted == 3
+    assert client.tasks.get.call_count == 2
+    kwargs = client.delete_by_query.call_args.kwargs
+    assert kwargs["body"] == {"query": {"bool": {"filter": {"bool": {"must": {"term": {"source": "a"}}}}}}}
+    assert kwargs["slices"] == 2
+    assert kwargs["wait_for_completion"] is False
+
+
+@patch("haystack_integrations.document_stores.opensearch.document_store.OpenSearch")
+def test_update_by_filter_sets_meta_with_script(_mock_opensearch_client):
+    store = OpenSearchDocumentStore(hosts="testhost")
+    client = _mock_opensearch_client.return_value
+    client.update_by_query.return_value = {"task": "node:1"}
+    client.tasks.get.return_value = {"completed": True, "response": {"updated": 2, "failures": []}}
+
+    updated = store.update_by_filter({"field": "meta.source", "operator": "==", "value": "a"}, {"tenant": "b"})
+
+    assert updated == 2
+    script = client.update_by_query.call_args.kwargs["body"]["script"]
+    assert script["params"] == {"tenant": "b"}
+
+
+@patch("haystack_integrations.document_stores.opensearch.document_store.OpenSearch")
+def test_delete_by_filter_raises_on_failures(_mock_opensearch_client):
+    store = OpenSearchDocumentStore(hosts="testhost")
+    client = _mock_opensearch_client.return_value
+    client.delete_by_query.return_value = {"task": "node:1"}
+    client.tasks.get.return_value = {"completed": True, "response": {"deleted": 0, "failures": [{"cause": "x"}]}}
+
+    with pytest.raises(DocumentStoreError):
+        store.delete_by_filter({"field": "meta.source", "operator": "==", "value": "a"})
+
+
+@patch("haystack_integrations.document_stores.opensearch.document_store.OpenSearch")
+def test_delete_by_filter_requires_filters(_mock_opensearch_client):
+    store = OpenSearchDocumentStore(hosts="testhost")
+    with pytest.raises(ValueError):
+        store.delete_by_filter({})
+
+
 @pytest.mark.integration
 class TestDocumentStore(CountDocumentsTest, WriteDocumentsTest, DeleteDocumentsTest):
     """
@@ -387,6 +440,36 @@ class TestDocumentStore(CountDocumentsTest, WriteDocumentsTest, DeleteDocumentsT
         with pytest.raises(DocumentStoreError):
             document_store_embedding_dim_4_no_emb_returned.write_documents(docs)
 
+    def test_delete_by_filter(self, document_store: OpenSearchDocumentStore):
+        docs = [
+            Document(content="1", meta={"source": "a"}),
+            Document(content="2", meta={"source": "a"}),
+            Document(content="3", meta={"source": "b"}),
+        ]
+        document_store.write_documents(docs)
+
+        deleted = document_store.delete_by_filter({"field": "meta.source", "operator": "==", "value": "a"})
+
+        assert deleted == 2
+        assert document_store.count_documents() == 1
+        assert document_store.filter_documents()[0].meta["source"] == "b"
+
+    def test_update_by_filter(self, document_store: OpenSearchDocumentStore):
+        docs = [
+            Document(content="1", meta={"source": "a"}),
+            Document(content="2", meta={"source": "a"}),
+            Document(content="3", meta={"source": "b"}),
+        ]
+        document_store.write_documents(docs)
+
+        updated = document_store.update_by_filter(
+            {"field": "meta.source", "operator": "==", "value": "a"}, {"tenant": "x"}
+        )
+
+        assert updated == 2
+        results = document_store.filter_documents({"field": "meta.tenant", "operator": "==", "value": "x"})
+        assert sorted(doc.content for doc in results) == ["1", "2"]
+
     @patch("haystack_integrations.document_stores.opensearch.document_store.bulk")
     def test_write_documents_with_badly_formatted_bulk_errors(self, mock_bulk, document_store):
         error = {"some_key": "some_value"}
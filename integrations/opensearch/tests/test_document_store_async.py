@@ -242,3 +242,26 @@ class TestDocumentStoreAsync:
 
         await document_store.delete_documents_async([doc.id])
         assert await document_store.count_documents_async() == 0
+
+    @pytest.mark.asyncio
+    async def test_delete_by_filter(self, document_store: OpenSearchDocumentStore):
+        docs = [Document(content="1", meta={"source": "a"}), Document(content="2", meta={"source": "b"})]
+        await document_store.write_documents_async(docs)
+
+        deleted = await document_store.delete_by_filter_async({"field": "meta.source", "operator": "==", "value": "a"})
+
+        assert deleted == 1
+        assert await document_store.count_documents_async() == 1
+
+    @pytest.mark.asyncio
+    async def test_update_by_filter(self, document_store: OpenSearchDocumentStore):
+        docs = [Document(content="1", meta={"source": "a"}), Document(content="2", meta={"source": "b"})]
+        await document_store.write_documents_async(docs)
+
+        updated = await document_store.update_by_filter_async(
+            {"field": "meta.source", "operator": "==", "value": "a"}, {"tenant": "x"}
+        )
+
+        assert updated == 1
+        results = await document_store.filter_documents_async({"field": "meta.tenant", "operator": "==", "value": "x"})
+        assert [doc.content for doc in results] == ["1"]
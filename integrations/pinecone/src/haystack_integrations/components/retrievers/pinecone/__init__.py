@@ -1,3 +1,4 @@
 from .embedding_retriever import PineconeEmbeddingRetriever
+from .hybrid_retriever import PineconeHybridRetriever
 
-__all__ = ["PineconeEmbeddingRetriever"]
+__all__ = ["PineconeEmbeddingRetriever", "PineconeHybridRetriever"]
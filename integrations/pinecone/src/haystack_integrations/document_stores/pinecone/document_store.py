@@ -1,23 +1,31 @@
 # SPDX-FileCopyrightText: 2023-present deepset GmbH <info@deepset.ai>
 #
 # SPDX-License-Identifier: Apache-2.0
+import asyncio
+from collections import deque
 from copy import copy
-from typing import Any, Dict, List, Literal, Optional
+from typing import Any, AsyncIterator, Dict, Iterator, List, Literal, Optional, Tuple
 
 from haystack import default_from_dict, default_to_dict, logging
-from haystack.dataclasses import Document
+from haystack.dataclasses import Document, SparseEmbedding
 from haystack.document_stores.types import DuplicatePolicy
+from haystack.lazy_imports import LazyImport
 from haystack.utils import Secret, deserialize_secrets_inplace
 
 from pinecone import Pinecone, PineconeAsyncio, PodSpec, ServerlessSpec
 
-from .filters import _normalize_filters, _validate_filters
+with LazyImport("Run 'pip install \"pinecone-haystack[grpc]\"' to use the gRPC transport.") as grpc_import:
+    from pinecone.grpc import PineconeGRPC
+
+from .filters import _matches_filters, _normalize_filters, _validate_filters
 
 logger = logging.getLogger(__name__)
 
-# Pinecone has a limit of 1000 documents that can be returned in a query
-# with include_metadata=True or include_data=True
-# https://docs.pinecone.io/docs/limits
+# Pinecone returns at most 100 vector ids per page when listing the vectors of a namespace
+# https://docs.pinecone.io/guides/manage-data/list-record-ids
+LIST_PAGE_LIMIT = 100
+
+# Pod-based indexes can't list their vector ids, so they are filtered with a query, which returns at most 1000 results
 TOP_K_LIMIT = 1_000
 
 
@@ -40,6 +48,8 @@ class PineconeDocumentStore:
         dimension: int = 768,
         spec: Optional[Dict[str, Any]] = None,
         metric: Literal["cosine", "euclidean", "dotproduct"] = "cosine",
+        use_grpc: bool = False,
+        max_concurrent_batches: int = 4,
     ):
         """
         Creates a new PineconeDocumentStore instance.
@@ -59,8 +69,18 @@ class PineconeDocumentStore:
             If not provided, a default spec with serverless deployment in the `us-east-1` region will be used
             (compatible with the free tier).
         :param metric: The metric to use for similarity search. This parameter is only used when creating a new index.
+            Sparse embeddings can only be stored and used for hybrid retrieval with the `dotproduct` metric.
+        :param use_grpc: Whether to connect to the index with the gRPC client instead of the REST one.
+            The gRPC client requires the `grpc` extra of `pinecone-haystack` (`pip install "pinecone-haystack[grpc]"`)
+            and is only used by the synchronous methods.
+        :param max_concurrent_batches: The maximum number of batches upserted concurrently when writing documents.
+            Set it to 1 to upsert the batches one after another.
+        :raises ValueError: If `max_concurrent_batches` is lower than 1.
+        """
+        if max_concurrent_batches < 1:
+            msg = "max_concurrent_batches must be greater than 0"
+            raise ValueError(msg)
 
-        """
         self.api_key = api_key
         spec = spec or DEFAULT_STARTER_PLAN_SPEC
         self.namespace = namespace
@@ -69,16 +89,25 @@ class PineconeDocumentStore:
         self.spec = spec
         self.dimension = dimension
         self.index_name = index
+        self.use_grpc = use_grpc
+        self.max_concurrent_batches = max_concurrent_batches
 
         self._index = None
         self._async_index = None
         self._dummy_vector = [-10.0] * self.dimension
+        # the configuration of an existing index can differ from `metric` and `spec`, it's read on initialization
+        self._index_metric = metric
+        self._serverless_index = "serverless" in spec
 
     def _initialize_index(self):
         if self._index is not None:
             return self._index
 
-        client = Pinecone(api_key=self.api_key.resolve_value(), source_tag="haystack")
+        if self.use_grpc:
+            grpc_import.check()
+            client = PineconeGRPC(api_key=self.api_key.resolve_value(), source_tag="haystack")
+        else:
+            client = Pinecone(api_key=self.api_key.resolve_value(), source_tag="haystack")
 
         if self.index_name not in client.list_indexes().names():
             logger.info(f"Index {self.index_name} does not exist. Creating a new index.")
@@ -88,8 +117,13 @@ class PineconeDocumentStore:
             logger.info(
                 f"Connecting to existing index {self.index_name}. `dimension`, `spec`, and `metric` will be ignored."
             )
+            self._set_index_description(client.describe_index(self.index_name).to_dict())
 
-        self._index = client.Index(name=self.index_name)
+        if self.use_grpc:
+            self._index = client.Index(name=self.index_name)
+        else:
+            # the REST client runs the concurrent upsert requests in its thread pool
+            self._index = client.Index(name=self.index_name, pool_threads=self.max_concurrent_batches)
 
         actual_dimension = self._index.describe_index_stats().get("dimension")
         if actual_dimension and actual_dimension != self.dimension:
@@ -120,6 +154,8 @@ class PineconeDocumentStore:
                 f"Connecting to existing index {self.index_name}. `dimension`, `spec`, and `metric` will be ignored."
             )
             host = next((index["host"] for index in indexes if index["name"] == self.index_name), None)
+            index_description = await async_client.describe_index(self.index_name)
+            self._set_index_description(index_description.to_dict())
 
         self._async_index = async_client.IndexAsyncio(host=host)
 
@@ -136,6 +172,19 @@ class PineconeDocumentStore:
 
         await async_client.close()
 
+    @staticmethod
+    def _validate_list_batch_size(batch_size: int) -> None:
+        if not 1 <= batch_size <= LIST_PAGE_LIMIT:
+            msg = f"batch_size must be between 1 and {LIST_PAGE_LIMIT}, got {batch_size}."
+            raise ValueError(msg)
+
+    def _set_index_description(self, description: Dict[str, Any]) -> None:
+        """
+        Stores the metric and the deployment type of an existing index, as returned by `describe_index`.
+        """
+        self._index_metric = description.get("metric", self._index_metric)
+        self._serverless_index = "serverless" in (description.get("spec") or {})
+
     @staticmethod
     def _convert_dict_spec_to_pinecone_object(spec: Dict[str, Any]):
         """Convert the spec dictionary to a Pinecone spec object"""
@@ -180,6 +229,8 @@ class PineconeDocumentStore:
             namespace=self.namespace,
             batch_size=self.batch_size,
             metric=self.metric,
+            use_grpc=self.use_grpc,
+            max_concurrent_batches=self.max_concurrent_batches,
         )
 
     def count_documents(self) -> int:
@@ -223,14 +274,29 @@ class PineconeDocumentStore:
         assert self._index is not None, "Index is not initialized"
 
         documents_for_pinecone = self._prepare_documents_for_writing(documents, policy)
+        batches = self._split_into_batches(documents_for_pinecone)
+
+        written_docs = 0
+        # keep up to `max_concurrent_batches` upsert requests in flight, sending the next batch as soon as the oldest
+        # request completes
+        in_flight: deque = deque()
+        for batch in batches:
+            if len(in_flight) == self.max_concurrent_batches:
+                written_docs += self._get_upsert_result(in_flight.popleft())
+            in_flight.append(self._index.upsert(vectors=batch, namespace=self.namespace, async_req=True))
+        while in_flight:
+            written_docs += self._get_upsert_result(in_flight.popleft())
 
-        result = self._index.upsert(
-            vectors=documents_for_pinecone, namespace=self.namespace, batch_size=self.batch_size
-        )
-
-        written_docs = result["upserted_count"]
         return written_docs
 
+    def _get_upsert_result(self, request: Any) -> int:
+        """
+        Waits for an asynchronous upsert request and returns the number of upserted vectors.
+        """
+        # gRPC requests return futures, REST requests return thread pool results
+        result = request.result() if self.use_grpc else request.get()
+        return result.upserted_count
+
     async def write_documents_async(
         self, documents: List[Document], policy: DuplicatePolicy = DuplicatePolicy.NONE
     ) -> int:
@@ -247,14 +313,18 @@ class PineconeDocumentStore:
         assert self._async_index is not None, "Index is not initialized"
 
         documents_for_pinecone = self._prepare_documents_for_writing(documents, policy)
+        semaphore = asyncio.Semaphore(self.max_concurrent_batches)
 
-        result = await self._async_index.upsert(
-            vectors=documents_for_pinecone, namespace=self.namespace, batch_size=self.batch_size
-        )
-
-        written_docs = result["upserted_count"]
+        async def upsert_batch(batch: List[Dict[str, Any]]) -> int:
+            assert self._async_index is not None, "Index is not initialized"
+            async with semaphore:
+                result = await self._async_index.upsert(vectors=batch, namespace=self.namespace)
+            return result.upserted_count
 
-        return written_docs
+        written_docs = await asyncio.gather(
+            *(upsert_batch(batch) for batch in self._split_into_batches(documents_for_pinecone))
+        )
+        return sum(written_docs)
 
     def filter_documents(self, filters: Optional[Dict[str, Any]] = None) -> List[Document]:
         """
@@ -266,46 +336,109 @@ class PineconeDocumentStore:
         :param filters: The filters to apply to the document list.
         :returns: A list of Documents that match the given filters.
         """
+        return list(self.filter_documents_iter(filters))
 
-        _validate_filters(filters)
+    async def filter_documents_async(self, filters: Optional[Dict[str, Any]] = None) -> List[Document]:
+        """
+        Asynchronously returns the documents that match the filters provided.
 
-        # Pinecone only performs vector similarity search
-        # here we are querying with a dummy vector and the max compatible top_k
-        documents = self._embedding_retrieval(query_embedding=self._dummy_vector, filters=filters, top_k=TOP_K_LIMIT)
+        :param filters: The filters to apply to the document list.
+        :returns: A list of Documents that match the given filters.
+        """
+        return [doc async for doc in self.filter_documents_iter_async(filters)]
 
-        # when simply filtering, we don't want to return any scores
-        # furthermore, we are querying with a dummy vector, so the scores are meaningless
-        for doc in documents:
-            doc.score = None
+    def filter_documents_iter(
+        self,
+        filters: Optional[Dict[str, Any]] = None,
+        *,
+        prefix: Optional[str] = None,
+        batch_size: int = LIST_PAGE_LIMIT,
+    ) -> Iterator[Document]:
+        """
+        Iterates over all the documents in the namespace that match the filters provided.
 
-        if len(documents) == TOP_K_LIMIT:
-            logger.warning(
-                f"PineconeDocumentStore can return at most {TOP_K_LIMIT} documents and the query has hit this limit. "
-                f"It is likely that there are more matching documents in the document store. "
+        The vector ids are listed page by page and each page is fetched with a single request, so the documents
+        are streamed without any limit on their number. Since fetching by id does not support metadata filtering,
+        the filters are applied to each fetched page.
+
+        Listing vector ids is only supported by serverless indexes. Pod-based indexes are filtered with a single
+        query instead, which returns at most 1000 documents.
+
+        :param filters: The filters to apply to the documents.
+        :param prefix: If set, only the documents whose id starts with this prefix are returned.
+        :param batch_size: The number of documents to list and fetch in a single request.
+            Pinecone lists at most 100 ids per page.
+        :returns: An iterator over the Documents that match the given filters.
+        :raises ValueError: If `batch_size` is lower than 1 or greater than 100.
+        """
+        _validate_filters(filters)
+        self._validate_list_batch_size(batch_size)
+        self._initialize_index()
+        assert self._index is not None, "Index is not initialized"
+
+        if not self._serverless_index:
+            documents = self._embedding_retrieval(
+                query_embedding=self._dummy_vector, filters=filters, top_k=TOP_K_LIMIT
             )
-        return documents
+            yield from self._prepare_pod_filter_results(documents, prefix)
+            return
 
-    async def filter_documents_async(self, filters: Optional[Dict[str, Any]] = None) -> List[Document]:
+        pinecone_filters = _normalize_filters(filters) if filters else None
+        for ids in self._index.list(prefix=prefix, limit=batch_size, namespace=self.namespace):
+            result = self._index.fetch(ids=ids, namespace=self.namespace)
+            yield from self._convert_fetch_result_to_documents(result, ids, pinecone_filters)
+
+    async def filter_documents_iter_async(
+        self,
+        filters: Optional[Dict[str, Any]] = None,
+        *,
+        prefix: Optional[str] = None,
+        batch_size: int = LIST_PAGE_LIMIT,
+    ) -> AsyncIterator[Document]:
         """
-        Asynchronously returns the documents that match the filters provided.
+        Asynchronously iterates over all the documents in the namespace that match the filters provided.
 
-        :param filters: The filters to apply to the document list.
-        :returns: A list of Documents that match the given filters.
+        :param filters: The filters to apply to the documents.
+        :param prefix: If set, only the documents whose id starts with this prefix are returned.
+        :param batch_size: The number of documents to list and fetch in a single request.
+            Pinecone lists at most 100 ids per page.
+        :returns: An async iterator over the Documents that match the given filters.
+        :raises ValueError: If `batch_size` is lower than 1 or greater than 100.
         """
         _validate_filters(filters)
+        self._validate_list_batch_size(batch_size)
+        await self._initialize_async_index()
+        assert self._async_index is not None, "Index is not initialized"
 
-        documents = await self._embedding_retrieval_async(
-            query_embedding=self._dummy_vector, filters=filters, top_k=TOP_K_LIMIT
-        )
+        if not self._serverless_index:
+            documents = await self._embedding_retrieval_async(
+                query_embedding=self._dummy_vector, filters=filters, top_k=TOP_K_LIMIT
+            )
+            for doc in self._prepare_pod_filter_results(documents, prefix):
+                yield doc
+            return
+
+        pinecone_filters = _normalize_filters(filters) if filters else None
+        async for ids in self._async_index.list(prefix=prefix, limit=batch_size, namespace=self.namespace):
+            result = await self._async_index.fetch(ids=ids, namespace=self.namespace)
+            for doc in self._convert_fetch_result_to_documents(result, ids, pinecone_filters):
+                yield doc
 
+    def _prepare_pod_filter_results(self, documents: List[Document], prefix: Optional[str]) -> List[Document]:
+        """
+        Prepares the documents returned by the dummy vector query used to filter pod-based indexes.
+        """
+        # the documents were queried with a dummy vector, so the scores are meaningless
         for doc in documents:
             doc.score = None
 
         if len(documents) == TOP_K_LIMIT:
             logger.warning(
-                f"PineconeDocumentStore can return at most {TOP_K_LIMIT} documents and the query has hit this limit. "
-                f"It is likely that there are more matching documents in the document store. "
+                f"PineconeDocumentStore can return at most {TOP_K_LIMIT} documents from pod-based indexes and the "
+                "query has hit this limit. It is likely that there are more matching documents in the document store."
             )
+        if prefix:
+            documents = [doc for doc in documents if doc.id.startswith(prefix)]
         return documents
 
     def delete_documents(self, document_ids: List[str]) -> None:
@@ -410,6 +543,125 @@ class PineconeDocumentStore:
 
         return self._convert_query_result_to_documents(result)
 
+    def _hybrid_retrieval(
+        self,
+        query_embedding: List[float],
+        query_sparse_embedding: SparseEmbedding,
+        *,
+        namespace: Optional[str] = None,
+        filters: Optional[Dict[str, Any]] = None,
+        top_k: int = 10,
+        alpha: float = 0.5,
+    ) -> List[Document]:
+        """
+        Retrieves documents that are most similar to the query dense and sparse embeddings.
+
+        This method is not mean to be part of the public interface of
+        `PineconeDocumentStore` nor called directly.
+        `PineconeHybridRetriever` uses this method directly and is the public interface for it.
+
+        :param query_embedding: Dense embedding of the query.
+        :param query_sparse_embedding: Sparse embedding of the query.
+        :param namespace: Pinecone namespace to query. Defaults the namespace of the document store.
+        :param filters: Filters applied to the retrieved Documents.
+        :param top_k: Maximum number of Documents to return.
+        :param alpha: Weight of the dense embedding in the query, between 0 and 1.
+            The sparse embedding is weighted by `1 - alpha`.
+
+        :returns: List of Document that are most similar to the query embeddings.
+        """
+        dense_vector, sparse_vector = self._weight_hybrid_query(query_embedding, query_sparse_embedding, alpha)
+
+        _validate_filters(filters)
+        filters = _normalize_filters(filters) if filters else None
+        self._initialize_index()
+        assert self._index is not None, "Index is not initialized"
+
+        result = self._index.query(
+            vector=dense_vector,
+            sparse_vector=sparse_vector,
+            top_k=top_k,
+            namespace=namespace or self.namespace,
+            filter=filters,
+            include_values=True,
+            include_metadata=True,
+        )
+
+        return self._convert_query_result_to_documents(result)
+
+    async def _hybrid_retrieval_async(
+        self,
+        query_embedding: List[float],
+        query_sparse_embedding: SparseEmbedding,
+        *,
+        namespace: Optional[str] = None,
+        filters: Optional[Dict[str, Any]] = None,
+        top_k: int = 10,
+        alpha: float = 0.5,
+    ) -> List[Document]:
+        """
+        Asynchronously retrieves documents that are most similar to the query dense and sparse embeddings.
+
+        :param query_embedding: Dense embedding of the query.
+        :param query_sparse_embedding: Sparse embedding of the query.
+        :param namespace: Pinecone namespace to query. Defaults the namespace of the document store.
+        :param filters: Filters applied to the retrieved Documents.
+        :param top_k: Maximum number of Documents to return.
+        :param alpha: Weight of the dense embedding in the query, between 0 and 1.
+            The sparse embedding is weighted by `1 - alpha`.
+
+        :returns: List of Document that are most similar to the query embeddings.
+        """
+        dense_vector, sparse_vector = self._weight_hybrid_query(query_embedding, query_sparse_embedding, alpha)
+
+        _validate_filters(filters)
+        filters = _normalize_filters(filters) if filters else None
+
+        await self._initialize_async_index()
+        assert self._async_index is not None, "Index is not initialized"
+
+        result = await self._async_index.query(
+            vector=dense_vector,
+            sparse_vector=sparse_vector,
+            top_k=top_k,
+            namespace=namespace or self.namespace,
+            filter=filters,
+            include_values=True,
+            include_metadata=True,
+        )
+
+        return self._convert_query_result_to_documents(result)
+
+    @staticmethod
+    def _weight_hybrid_query(
+        query_embedding: List[float], query_sparse_embedding: SparseEmbedding, alpha: float
+    ) -> Tuple[List[float], Dict[str, Any]]:
+        """
+        Weights the dense and sparse query embeddings for a hybrid query.
+
+        Pinecone scores hybrid queries with the dot product of the concatenated dense and sparse vectors,
+        so scaling the query vectors by `alpha` and `1 - alpha` gives a convex combination of the two scores.
+        """
+        if not query_embedding:
+            msg = "query_embedding must be a non-empty list of floats"
+            raise ValueError(msg)
+        if not 0 <= alpha <= 1:
+            msg = "alpha must be between 0 and 1"
+            raise ValueError(msg)
+
+        dense_vector = [value * alpha for value in query_embedding]
+        sparse_vector = {
+            "indices": query_sparse_embedding.indices,
+            "values": [value * (1 - alpha) for value in query_sparse_embedding.values],
+        }
+        return dense_vector, sparse_vector
+
+    @staticmethod
+    def _convert_sparse_values_to_sparse_embedding(sparse_values: Any) -> Optional[SparseEmbedding]:
+        if not sparse_values:
+            return None
+        return SparseEmbedding(indices=list(sparse_values["indices"]), values=list(sparse_values["values"]))
+
     @staticmethod
     def _convert_meta_to_int(metadata: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -440,12 +692,50 @@ class PineconeDocumentStore:
                 content=content,
                 meta=self._convert_meta_to_int(pinecone_doc["metadata"]),
                 embedding=embedding,
+                sparse_embedding=self._convert_sparse_values_to_sparse_embedding(pinecone_doc.get("sparse_values")),
                 score=pinecone_doc["score"],
             )
             documents.append(doc)
 
         return documents
 
+    def _convert_fetch_result_to_documents(
+        self, fetch_result: Any, ids: List[str], filters: Optional[Dict[str, Any]]
+    ) -> List[Document]:
+        """
+        Converts the vectors fetched by id to Documents, keeping the listing order and only those matching the
+        normalized filters.
+        """
+        documents = []
+        for vector_id in ids:
+            # vectors deleted between listing and fetching are not returned
+            vector = fetch_result.vectors.get(vector_id)
+            if vector is None:
+                continue
+
+            metadata = dict(getattr(vector, "metadata", None) or {})
+            if not _matches_filters(metadata, filters):
+                continue
+
+            content = metadata.pop("content", None)
+            embedding = None
+            if vector.values and list(vector.values) != self._dummy_vector:
+                embedding = list(vector.values)
+
+            documents.append(
+                Document(
+                    id=vector.id,
+                    content=content,
+                    meta=self._convert_meta_to_int(metadata),
+                    embedding=embedding,
+                    sparse_embedding=self._convert_sparse_values_to_sparse_embedding(
+                        getattr(vector, "sparse_values", None)
+                    ),
+                )
+            )
+
+        return documents
+
     @staticmethod
     def _discard_invalid_meta(document: Document):
         """
@@ -504,17 +794,30 @@ class PineconeDocumentStore:
                     "objects in Pinecone is not supported. "
                     "The content of the `blob` field will be ignored."
                 )
-            if hasattr(document, "sparse_embedding") and document.sparse_embedding is not None:
-                logger.warning(
-                    "Document %s has the `sparse_embedding` field set,"
-                    "but storing sparse embeddings in Pinecone is not currently supported."
-                    "The `sparse_embedding` field will be ignored.",
-                    document.id,
-                )
+            # sparse values can only be stored in indexes using the `dotproduct` metric
+            if document.sparse_embedding is not None:
+                if self._index_metric == "dotproduct":
+                    doc_for_pinecone["sparse_values"] = {
+                        "indices": document.sparse_embedding.indices,
+                        "values": document.sparse_embedding.values,
+                    }
+                else:
+                    logger.warning(
+                        "Document {document_id} has the `sparse_embedding` field set, "
+                        "but sparse embeddings can only be stored in Pinecone indexes using the `dotproduct` metric. "
+                        "The `sparse_embedding` field will be ignored.",
+                        document_id=document.id,
+                    )
 
             documents_for_pinecone.append(doc_for_pinecone)
         return documents_for_pinecone
 
+    def _split_into_batches(self, documents_for_pinecone: List[Dict[str, Any]]) -> List[List[Dict[str, Any]]]:
+        return [
+            documents_for_pinecone[i : i + self.batch_size]
+            for i in range(0, len(documents_for_pinecone), self.batch_size)
+        ]
+
     def _prepare_documents_for_writing(
         self, documents: List[Document], policy: DuplicatePolicy
     ) -> List[Dict[str, Any]]:
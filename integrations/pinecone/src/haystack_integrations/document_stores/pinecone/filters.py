@@ -191,3 +191,53 @@ def _validate_filters(filters: Optional[Dict[str, Any]]) -> None:
     if filters and "operator" not in filters and "conditions" not in filters:
         msg = "Invalid filter syntax. See https://docs.haystack.deepset.ai/docs/metadata-filtering for details."
         raise ValueError(msg)
+
+
+def _matches_filters(metadata: Dict[str, Any], filters: Optional[Dict[str, Any]]) -> bool:
+    """
+    Checks if the metadata of a Pinecone vector matches the given normalized filters.
+
+    This is used to filter vectors fetched by id, as `fetch` does not support metadata filtering.
+    It follows Pinecone's semantics: a list field matches `$eq` and `$in` if any of its values matches
+    and `$ne` and `$nin` only if none of them do, while a missing field only matches `$ne` and `$nin`.
+    """
+    if not filters:
+        return True
+
+    for key, condition in filters.items():
+        if key == "$and":
+            if not all(_matches_filters(metadata, c) for c in condition):
+                return False
+        elif key == "$or":
+            if not any(_matches_filters(metadata, c) for c in condition):
+                return False
+        elif not all(_matches_comparison(metadata.get(key), operator, value) for operator, value in condition.items()):
+            return False
+    return True
+
+
+def _matches_comparison(field_value: Any, operator: str, value: Any) -> bool:
+    field_values = field_value if isinstance(field_value, list) else [field_value]
+    if operator == "$ne":
+        return all(v != value for v in field_values)
+    if operator == "$nin":
+        return all(v not in value for v in field_values)
+    if field_value is None:
+        return False
+    if operator == "$eq":
+        return any(v == value for v in field_values)
+    if operator == "$in":
+        return any(v in value for v in field_values)
+
+    # range comparisons are only supported for numbers
+    if isinstance(field_value, bool) or not isinstance(field_value, (int, float)):
+        return False
+    return RANGE_OPERATORS[operator](field_value, value)
+
+
+RANGE_OPERATORS = {
+    "$gt": lambda a, b: a > b,
+    "$gte": lambda a, b: a >= b,
+    "$lt": lambda a, b: a < b,
+    "$lte": lambda a, b: a <= b,
+}
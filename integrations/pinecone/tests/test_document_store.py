@@ -1,12 +1,14 @@
+import asyncio
 import os
 import time
-from unittest.mock import patch
+from unittest.mock import AsyncMock, Mock, patch
 
 import numpy as np
 import pytest
 from haystack import Document
 from haystack.components.preprocessors import DocumentSplitter
 from haystack.components.retrievers import SentenceWindowRetriever
+from haystack.dataclasses import SparseEmbedding
 from haystack.testing.document_store import CountDocumentsTest, DeleteDocumentsTest, WriteDocumentsTest
 from haystack.utils import Secret
 from pinecone import Pinecone, PodSpec, ServerlessSpec
@@ -95,6 +97,8 @@ def test_to_from_dict(mock_pinecone, monkeypatch):
             "batch_size": 50,
             "metric": "euclidean",
             "spec": {"serverless": {"region": "us-east-1", "cloud": "aws"}},
+            "use_grpc": False,
+            "max_concurrent_batches": 4,
         },
     }
     assert document_store.to_dict() == dict_output
@@ -107,6 +111,8 @@ def test_to_from_dict(mock_pinecone, monkeypatch):
     assert document_store.dimension == 60
     assert document_store.metric == "euclidean"
     assert document_store.spec == {"serverless": {"region": "us-east-1", "cloud": "aws"}}
+    assert document_store.use_grpc is False
+    assert document_store.max_concurrent_batches == 4
 
 
 def test_init_fails_wo_api_key(monkeypatch):
@@ -117,6 +123,24 @@ def test_init_fails_wo_api_key(monkeypatch):
         )._initialize_index()
 
 
+def test_init_fails_with_invalid_max_concurrent_batches():
+    with pytest.raises(ValueError):
+        PineconeDocumentStore(api_key=Secret.from_token("fake-api-key"), max_concurrent_batches=0)
+
+
+@patch("haystack_integrations.document_stores.pinecone.document_store.PineconeGRPC")
+@patch("haystack_integrations.document_stores.pinecone.document_store.Pinecone")
+def test_init_with_grpc(mock_pinecone, mock_pinecone_grpc):
+    mock_pinecone_grpc.return_value.Index.return_value.describe_index_stats.return_value = {"dimension": 30}
+
+    document_store = PineconeDocumentStore(api_key=Secret.from_token("fake-api-key"), dimension=30, use_grpc=True)
+    document_store._initialize_index()
+
+    mock_pinecone.assert_not_called()
+    mock_pinecone_grpc.assert_called_with(api_key="fake-api-key", source_tag="haystack")
+    assert document_store._index == mock_pinecone_grpc.return_value.Index.return_value
+
+
 def test_convert_dict_spec_to_pinecone_object_serverless():
     dict_spec = {"serverless": {"region": "us-east-1", "cloud": "aws"}}
     pinecone_object = PineconeDocumentStore._convert_dict_spec_to_pinecone_object(dict_spec)
@@ -211,6 +235,333 @@ def test_convert_meta_to_int():
     assert PineconeDocumentStore._convert_meta_to_int(meta_data) == {}
 
 
+@patch("haystack_integrations.document_stores.pinecone.document_store.Pinecone")
+def test_write_documents_upserts_batches_concurrently(mock_pinecone):
+    mock_index = mock_pinecone.return_value.Index.return_value
+    mock_index.describe_index_stats.return_value = {"dimension": 2}
+    mock_index.upsert.side_effect = lambda vectors, **_kwargs: Mock(
+        get=Mock(return_value=Mock(upserted_count=len(vectors)))
+    )
+
+    document_store = PineconeDocumentStore(
+        api_key=Secret.from_token("fake-api-key"), dimension=2, batch_size=2, max_concurrent_batches=2
+    )
+    docs = [Document(content=f"doc {i}", embedding=[0.1, 0.2]) for i in range(5)]
+
+    assert document_store.write_documents(docs) == 5
+    mock_pinecone.return_value.Index.assert_called_once_with(name="default", pool_threads=2)
+    assert [len(c.kwargs["vectors"]) for c in mock_index.upsert.call_args_list] == [2, 2, 1]
+    assert all(c.kwargs["async_req"] for c in mock_index.upsert.call_args_list)
+
+
+@patch("haystack_integrations.document_stores.pinecone.document_store.Pinecone")
+def test_write_documents_keeps_a_sliding_window_of_requests(mock_pinecone):
+    events = []
+
+    def upsert(vectors, **_kwargs):
+        batch = vectors[0]["metadata"]["content"]
+        events.append(f"send {batch}")
+
+        def get():
+            events.append(f"wait {batch}")
+            return Mock(upserted_count=len(vectors))
+
+        return Mock(get=get)
+
+    mock_index = mock_pinecone.return_value.Index.return_value
+    mock_index.describe_index_stats.return_value = {"dimension": 2}
+    mock_index.upsert.side_effect = upsert
+
+    document_store = PineconeDocumentStore(
+        api_key=Secret.from_token("fake-api-key"), dimension=2, batch_size=1, max_concurrent_batches=2
+    )
+    docs = [Document(content=str(i), embedding=[0.1, 0.2]) for i in range(4)]
+
+    assert document_store.write_documents(docs) == 4
+    # the next batch is sent as soon as the oldest request completes, without waiting for the other one
+    assert events == ["send 0", "send 1", "wait 0", "send 2", "wait 1", "send 3", "wait 2", "wait 3"]
+
+
+@patch("haystack_integrations.document_stores.pinecone.document_store.PineconeGRPC")
+def test_write_documents_with_grpc(mock_pinecone_grpc):
+    mock_index = mock_pinecone_grpc.return_value.Index.return_value
+    mock_index.describe_index_stats.return_value = {"dimension": 2}
+    mock_index.upsert.side_effect = lambda vectors, **_kwargs: Mock(
+        result=Mock(return_value=Mock(upserted_count=len(vectors)))
+    )
+
+    document_store = PineconeDocumentStore(
+        api_key=Secret.from_token("fake-api-key"), dimension=2, batch_size=2, use_grpc=True
+    )
+    docs = [Document(content=f"doc {i}", embedding=[0.1, 0.2]) for i in range(3)]
+
+    assert document_store.write_documents(docs) == 3
+    assert mock_index.upsert.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_write_documents_async_limits_concurrent_batches():
+    in_flight = 0
+    max_in_flight = 0
+
+    async def upsert(vectors, **_kwargs):
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return Mock(upserted_count=len(vectors))
+
+    document_store = PineconeDocumentStore(
+        api_key=Secret.from_token("fake-api-key"), dimension=2, batch_size=2, max_concurrent_batches=2
+    )
+    document_store._async_index = Mock(upsert=AsyncMock(side_effect=upsert))
+    docs = [Document(content=f"doc {i}", embedding=[0.1, 0.2]) for i in range(9)]
+
+    assert await document_store.write_documents_async(docs) == 9
+    assert document_store._async_index.upsert.call_count == 5
+    assert max_in_flight == 2
+
+
+def _fetch_response(vectors):
+    return Mock(vectors={v["id"]: Mock(**{"sparse_values": None, **v}) for v in vectors})
+
+
+@patch("haystack_integrations.document_stores.pinecone.document_store.Pinecone")
+def test_filter_documents_iter(mock_pinecone):
+    mock_index = mock_pinecone.return_value.Index.return_value
+    mock_index.describe_index_stats.return_value = {"dimension": 2}
+    mock_index.list.return_value = iter([["1", "2"], ["3"]])
+    mock_index.fetch.side_effect = [
+        _fetch_response(
+            [
+                {"id": "1", "values": [0.1, 0.2], "metadata": {"content": "doc 1", "page_number": 1.0}},
+                {"id": "2", "values": [-10.0, -10.0], "metadata": {"content": "doc 2", "page_number": 2.0}},
+            ]
+        ),
+        # the vector with id "3" was deleted after being listed
+        _fetch_response([]),
+    ]
+
+    document_store = PineconeDocumentStore(api_key=Secret.from_token("fake-api-key"), namespace="test", dimension=2)
+    documents = list(document_store.filter_documents_iter(prefix="doc", batch_size=2))
+
+    mock_index.list.assert_called_once_with(prefix="doc", limit=2, namespace="test")
+    assert mock_index.fetch.call_count == 2
+    mock_index.fetch.assert_any_call(ids=["1", "2"], namespace="test")
+    assert documents == [
+        Document(id="1", content="doc 1", meta={"page_number": 1}, embedding=[0.1, 0.2]),
+        Document(id="2", content="doc 2", meta={"page_number": 2}),
+    ]
+
+
+@pytest.mark.parametrize("batch_size", [0, 101])
+@patch("haystack_integrations.document_stores.pinecone.document_store.Pinecone")
+def test_filter_documents_iter_invalid_batch_size(mock_pinecone, batch_size):
+    mock_index = mock_pinecone.return_value.Index.return_value
+    mock_index.describe_index_stats.return_value = {"dimension": 2}
+
+    document_store = PineconeDocumentStore(api_key=Secret.from_token("fake-api-key"), dimension=2)
+    with pytest.raises(ValueError, match="batch_size must be between 1 and 100"):
+        list(document_store.filter_documents_iter(batch_size=batch_size))
+    mock_index.list.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_filter_documents_iter_async_invalid_batch_size():
+    document_store = PineconeDocumentStore(api_key=Secret.from_token("fake-api-key"), dimension=2)
+    with pytest.raises(ValueError, match="batch_size must be between 1 and 100"):
+        async for _ in document_store.filter_documents_iter_async(batch_size=0):
+            pass
+
+
+@patch("haystack_integrations.document_stores.pinecone.document_store.Pinecone")
+def test_filter_documents_applies_filters_to_fetched_pages(mock_pinecone):
+    mock_index = mock_pinecone.return_value.Index.return_value
+    mock_index.describe_index_stats.return_value = {"dimension": 2}
+    mock_index.list.return_value = iter([["1", "2", "3"]])
+    mock_index.fetch.return_value = _fetch_response(
+        [
+            {"id": "1", "values": [0.1, 0.2], "metadata": {"content": "doc 1", "number": 1.0}},
+            {"id": "2", "values": [0.1, 0.2], "metadata": {"content": "doc 2", "number": 5.0}},
+            {"id": "3", "values": [0.1, 0.2], "metadata": {"content": "doc 3"}},
+        ]
+    )
+
+    document_store = PineconeDocumentStore(api_key=Secret.from_token("fake-api-key"), dimension=2)
+    documents = document_store.filter_documents(filters={"field": "meta.number", "operator": ">", "value": 2})
+
+    assert [doc.id for doc in documents] == ["2"]
+    assert documents[0].score is None
+
+
+@patch("haystack_integrations.document_stores.pinecone.document_store.Pinecone")
+def test_filter_documents_iter_pod_index_falls_back_to_query(mock_pinecone):
+    mock_client = mock_pinecone.return_value
+    mock_client.list_indexes.return_value.names.return_value = ["default"]
+    mock_client.describe_index.return_value.to_dict.return_value = {
+        "metric": "cosine",
+        "spec": {"pod": {"environment": "us-west1-gcp", "pod_type": "p1.x1"}},
+    }
+    mock_index = mock_client.Index.return_value
+    mock_index.describe_index_stats.return_value = {"dimension": 2}
+    mock_index.query.return_value = {
+        "matches": [
+            {"id": "doc-1", "values": [0.1, 0.2], "metadata": {"content": "doc 1"}, "score": 0.9},
+            {"id": "other-2", "values": [0.1, 0.2], "metadata": {"content": "doc 2"}, "score": 0.8},
+        ]
+    }
+
+    document_store = PineconeDocumentStore(api_key=Secret.from_token("fake-api-key"), namespace="test", dimension=2)
+    documents = list(document_store.filter_documents_iter(prefix="doc"))
+
+    mock_index.list.assert_not_called()
+    mock_index.query.assert_called_once()
+    assert mock_index.query.call_args.kwargs["top_k"] == 1000
+    assert documents == [Document(id="doc-1", content="doc 1", embedding=[0.1, 0.2])]
+    assert documents[0].score is None
+
+
+@pytest.mark.asyncio
+@patch("haystack_integrations.document_stores.pinecone.document_store.PineconeAsyncio")
+async def test_filter_documents_iter_async(mock_pinecone_asyncio):
+    async def list_pages(**_kwargs):
+        yield ["1"]
+        yield ["2"]
+
+    mock_client = mock_pinecone_asyncio.return_value
+    mock_client.list_indexes = AsyncMock(return_value=Mock(names=Mock(return_value=["default"])))
+    mock_client.list_indexes.return_value.__iter__ = Mock(return_value=iter([{"name": "default", "host": "host"}]))
+    mock_client.describe_index = AsyncMock(
+        return_value=Mock(to_dict=Mock(return_value={"metric": "cosine", "spec": {"serverless": {}}}))
+    )
+    mock_client.close = AsyncMock()
+    mock_index = mock_client.IndexAsyncio.return_value
+    mock_index.describe_index_stats = AsyncMock(return_value={"dimension": 2})
+    mock_index.list = Mock(side_effect=list_pages)
+    vectors = {
+        "1": {"id": "1", "values": [0.1, 0.2], "metadata": {"content": "doc 1", "tag": ["a", "b"]}},
+        "2": {"id": "2", "values": [-10.0, -10.0], "metadata": {"content": "doc 2", "tag": ["c"]}},
+    }
+    mock_index.fetch = AsyncMock(side_effect=lambda ids, **_kwargs: _fetch_response([vectors[i] for i in ids]))
+
+    document_store = PineconeDocumentStore(api_key=Secret.from_token("fake-api-key"), dimension=2)
+    filters = {"field": "meta.tag", "operator": "in", "value": ["b"]}
+    documents = [doc async for doc in document_store.filter_documents_iter_async(filters)]
+
+    assert [doc.id for doc in documents] == ["1"]
+    assert await document_store.filter_documents_async() == [
+        Document(id="1", content="doc 1", meta={"tag": ["a", "b"]}, embedding=[0.1, 0.2]),
+        Document(id="2", content="doc 2", meta={"tag": ["c"]}),
+    ]
+
+
+def test_convert_documents_to_pinecone_format_with_sparse_embedding():
+    document_store = PineconeDocumentStore(api_key=Secret.from_token("fake-api-key"), dimension=2, metric="dotproduct")
+    doc = Document(
+        id="1", content="doc", embedding=[0.1, 0.2], sparse_embedding=SparseEmbedding(indices=[0, 5], values=[0.3, 0.4])
+    )
+
+    assert document_store._convert_documents_to_pinecone_format([doc]) == [
+        {
+            "id": "1",
+            "values": [0.1, 0.2],
+            "metadata": {"content": "doc"},
+            "sparse_values": {"indices": [0, 5], "values": [0.3, 0.4]},
+        }
+    ]
+
+
+def test_convert_documents_to_pinecone_format_drops_sparse_embedding_for_cosine_index(caplog):
+    document_store = PineconeDocumentStore(api_key=Secret.from_token("fake-api-key"), dimension=2, metric="cosine")
+    doc = Document(
+        id="1", content="doc", embedding=[0.1, 0.2], sparse_embedding=SparseEmbedding(indices=[0, 5], values=[0.3, 0.4])
+    )
+
+    assert document_store._convert_documents_to_pinecone_format([doc]) == [
+        {"id": "1", "values": [0.1, 0.2], "metadata": {"content": "doc"}}
+    ]
+    assert "sparse embeddings can only be stored" in caplog.text
+
+
+@patch("haystack_integrations.document_stores.pinecone.document_store.Pinecone")
+def test_write_documents_sparse_embedding_uses_existing_index_metric(mock_pinecone):
+    mock_client = mock_pinecone.return_value
+    mock_client.list_indexes.return_value.names.return_value = ["default"]
+    mock_client.describe_index.return_value.to_dict.return_value = {"metric": "cosine", "spec": {"serverless": {}}}
+    mock_index = mock_client.Index.return_value
+    mock_index.describe_index_stats.return_value = {"dimension": 2}
+    mock_index.upsert.return_value.get.return_value = Mock(upserted_count=1)
+
+    # the configured metric is ignored, the existing index uses cosine
+    document_store = PineconeDocumentStore(api_key=Secret.from_token("fake-api-key"), dimension=2, metric="dotproduct")
+    doc = Document(id="1", content="doc", embedding=[0.1, 0.2], sparse_embedding=SparseEmbedding([0], [0.3]))
+    document_store.write_documents([doc])
+
+    assert "sparse_values" not in mock_index.upsert.call_args.kwargs["vectors"][0]
+
+
+def test_convert_query_result_to_documents_with_sparse_values():
+    document_store = PineconeDocumentStore(api_key=Secret.from_token("fake-api-key"), dimension=2)
+    query_result = {
+        "matches": [
+            {
+                "id": "1",
+                "values": [0.1, 0.2],
+                "sparse_values": {"indices": [0, 5], "values": [0.3, 0.4]},
+                "metadata": {"content": "doc"},
+                "score": 0.9,
+            }
+        ]
+    }
+
+    documents = document_store._convert_query_result_to_documents(query_result)
+    assert documents[0].sparse_embedding == SparseEmbedding(indices=[0, 5], values=[0.3, 0.4])
+    assert documents[0].score == 0.9
+
+
+def test_weight_hybrid_query():
+    dense_vector, sparse_vector = PineconeDocumentStore._weight_hybrid_query(
+        [1.0, 2.0], SparseEmbedding(indices=[3, 7], values=[1.0, 0.5]), alpha=0.75
+    )
+    assert dense_vector == [0.75, 1.5]
+    assert sparse_vector == {"indices": [3, 7], "values": [0.25, 0.125]}
+
+    with pytest.raises(ValueError):
+        PineconeDocumentStore._weight_hybrid_query([1.0], SparseEmbedding(indices=[0], values=[1.0]), alpha=1.5)
+    with pytest.raises(ValueError):
+        PineconeDocumentStore._weight_hybrid_query([], SparseEmbedding(indices=[0], values=[1.0]), alpha=0.5)
+
+
+@patch("haystack_integrations.document_stores.pinecone.document_store.Pinecone")
+def test_hybrid_retrieval(mock_pinecone):
+    mock_index = mock_pinecone.return_value.Index.return_value
+    mock_index.describe_index_stats.return_value = {"dimension": 2}
+    mock_index.query.return_value = {
+        "matches": [{"id": "1", "values": [0.1, 0.2], "metadata": {"content": "doc"}, "score": 0.9}]
+    }
+
+    document_store = PineconeDocumentStore(api_key=Secret.from_token("fake-api-key"), namespace="test", dimension=2)
+    documents = document_store._hybrid_retrieval(
+        query_embedding=[1.0, 1.0],
+        query_sparse_embedding=SparseEmbedding(indices=[1], values=[2.0]),
+        filters={"field": "meta.number", "operator": "==", "value": 1},
+        top_k=5,
+        alpha=0.5,
+    )
+
+    mock_index.query.assert_called_once_with(
+        vector=[0.5, 0.5],
+        sparse_vector={"indices": [1], "values": [1.0]},
+        top_k=5,
+        namespace="test",
+        filter={"number": {"$eq": 1}},
+        include_values=True,
+        include_metadata=True,
+    )
+    assert documents == [Document(id="1", content="doc", embedding=[0.1, 0.2], score=0.9)]
+
+
 @pytest.mark.integration
 @pytest.mark.skipif(not os.environ.get("PINECONE_API_KEY"), reason="PINECONE_API_KEY not set")
 def test_serverless_index_creation_from_scratch(sleep_time):
@@ -57,6 +57,8 @@ def test_to_dict(mock_pinecone, monkeypatch):
                     "dimension": 512,
                     "spec": {"serverless": {"region": "us-east-1", "cloud": "aws"}},
                     "metric": "cosine",
+                    "use_grpc": False,
+                    "max_concurrent_batches": 4,
                 },
                 "type": "haystack_integrations.document_stores.pinecone.document_store.PineconeDocumentStore",
             },
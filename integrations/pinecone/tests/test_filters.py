@@ -7,6 +7,8 @@ from haystack.testing.document_store import (
     FilterDocumentsTest,
 )
 
+from haystack_integrations.document_stores.pinecone.filters import _matches_filters
+
 
 @pytest.mark.integration
 @pytest.mark.skipif(not os.environ.get("PINECONE_API_KEY"), reason="PINECONE_API_KEY not set")
@@ -73,3 +75,25 @@ class TestFilters(FilterDocumentsTest):
         reason="Pinecone has inconsistent behavior with respect to other Document Stores with the $or operator"
     )
     def test_or_operator(self, document_store, filterable_docs): ...
+
+
+def test_matches_filters():
+    metadata = {"number": 5.0, "name": "doc", "tags": ["a", "b"]}
+
+    assert _matches_filters(metadata, None)
+    assert _matches_filters(metadata, {"number": {"$gte": 5}})
+    assert not _matches_filters(metadata, {"number": {"$lt": 5}})
+    assert not _matches_filters(metadata, {"name": {"$gt": 1}})
+    assert _matches_filters(metadata, {"tags": {"$eq": "a"}})
+    assert _matches_filters(metadata, {"tags": {"$in": ["b", "c"]}})
+    assert not _matches_filters(metadata, {"tags": {"$ne": "a"}})
+    assert not _matches_filters(metadata, {"tags": {"$nin": ["b"]}})
+    assert _matches_filters(metadata, {"$and": [{"number": {"$eq": 5}}, {"name": {"$in": ["doc"]}}]})
+    assert _matches_filters(metadata, {"$or": [{"number": {"$eq": 1}}, {"name": {"$eq": "doc"}}]})
+    assert not _matches_filters(metadata, {"$or": [{"number": {"$eq": 1}}, {"name": {"$eq": "other"}}]})
+
+    # missing fields only match negative comparisons
+    assert _matches_filters(metadata, {"missing": {"$ne": "doc"}})
+    assert _matches_filters(metadata, {"missing": {"$nin": ["doc"]}})
+    assert not _matches_filters(metadata, {"missing": {"$eq": "doc"}})
+    assert not _matches_filters(metadata, {"missing": {"$gt": 1}})
@@ -0,0 +1,93 @@
+# SPDX-FileCopyrightText: 2023-present deepset GmbH <info@deepset.ai>
+#
+# SPDX-License-Identifier: Apache-2.0
+from unittest.mock import Mock, patch
+
+import pytest
+from haystack.dataclasses import Document, SparseEmbedding
+from haystack.document_stores.types import FilterPolicy
+from haystack.utils import Secret
+
+from haystack_integrations.components.retrievers.pinecone import PineconeHybridRetriever
+from haystack_integrations.document_stores.pinecone import PineconeDocumentStore
+
+
+def test_init_default():
+    mock_store = Mock(spec=PineconeDocumentStore)
+    retriever = PineconeHybridRetriever(document_store=mock_store)
+    assert retriever.document_store == mock_store
+    assert retriever.filters == {}
+    assert retriever.top_k == 10
+    assert retriever.alpha == 0.5
+    assert retriever.filter_policy == FilterPolicy.REPLACE
+
+    with pytest.raises(ValueError):
+        PineconeHybridRetriever(document_store=mock_store, filter_policy="invalid")
+
+
+def test_init_invalid_parameters():
+    with pytest.raises(ValueError):
+        PineconeHybridRetriever(document_store=Mock())
+    with pytest.raises(ValueError):
+        PineconeHybridRetriever(document_store=Mock(spec=PineconeDocumentStore), alpha=-0.1)
+
+
+@patch("haystack_integrations.document_stores.pinecone.document_store.Pinecone")
+def test_to_dict_from_dict(_mock_pinecone, monkeypatch):
+    monkeypatch.setenv("PINECONE_API_KEY", "env-api-key")
+    document_store = PineconeDocumentStore(index="default", namespace="test-namespace", dimension=512)
+    retriever = PineconeHybridRetriever(document_store=document_store, top_k=5, alpha=0.3, filter_policy="merge")
+
+    data = retriever.to_dict()
+    assert data == {
+        "type": "haystack_integrations.components.retrievers.pinecone.hybrid_retriever.PineconeHybridRetriever",
+        "init_parameters": {
+            "document_store": document_store.to_dict(),
+            "filters": {},
+            "top_k": 5,
+            "alpha": 0.3,
+            "filter_policy": "merge",
+        },
+    }
+
+    retriever = PineconeHybridRetriever.from_dict(data)
+    assert retriever.document_store.index_name == "default"
+    assert retriever.document_store.namespace == "test-namespace"
+    assert retriever.document_store.api_key == Secret.from_env_var("PINECONE_API_KEY", strict=True)
+    assert retriever.top_k == 5
+    assert retriever.alpha == 0.3
+    assert retriever.filter_policy == FilterPolicy.MERGE
+
+
+def test_run():
+    mock_store = Mock(spec=PineconeDocumentStore)
+    mock_store._hybrid_retrieval.return_value = [Document(content="Test doc", embedding=[0.1, 0.2])]
+    retriever = PineconeHybridRetriever(document_store=mock_store, alpha=0.8)
+    sparse_embedding = SparseEmbedding(indices=[0, 4], values=[0.5, 0.6])
+    res = retriever.run(query_embedding=[0.5, 0.7], query_sparse_embedding=sparse_embedding, top_k=3)
+    mock_store._hybrid_retrieval.assert_called_once_with(
+        query_embedding=[0.5, 0.7],
+        query_sparse_embedding=sparse_embedding,
+        filters={},
+        top_k=3,
+        alpha=0.8,
+    )
+    assert len(res["documents"]) == 1
+    assert res["documents"][0].content == "Test doc"
+
+
+@pytest.mark.asyncio
+async def test_run_async():
+    mock_store = Mock(spec=PineconeDocumentStore)
+    mock_store._hybrid_retrieval_async.return_value = [Document(content="Test doc", embedding=[0.1, 0.2])]
+    retriever = PineconeHybridRetriever(document_store=mock_store, filters={"some": "filter"})
+    sparse_embedding = SparseEmbedding(indices=[0, 4], values=[0.5, 0.6])
+    res = await retriever.run_async(query_embedding=[0.5, 0.7], query_sparse_embedding=sparse_embedding)
+    mock_store._hybrid_retrieval_async.assert_called_once_with(
+        query_embedding=[0.5, 0.7],
+        query_sparse_embedding=sparse_embedding,
+        filters={"some": "filter"},
+        top_k=10,
+        alpha=0.5,
+    )
+    assert res["documents"][0].content == "Test doc"
@@ -89,7 +89,14 @@ class WeaviateBM25Retriever:
         return default_from_dict(cls, data)
 
     @component.output_types(documents=List[Document])
-    def run(self, query: str, filters: Optional[Dict[str, Any]] = None, top_k: Optional[int] = None):
+    def run(
+        self,
+        query: str,
+        filters: Optional[Dict[str, Any]] = None,
+        top_k: Optional[int] = None,
+        *,
+        tenant: Optional[str] = None,
+    ):
         """
         Retrieves documents from Weaviate using the BM25 algorithm.
 
@@ -100,9 +107,41 @@ class WeaviateBM25Retriever:
                         details.
         :param top_k:
             The maximum number of documents to return.
+        :param tenant:
+            The tenant to retrieve the documents from. Only used with multi-tenancy.
         """
         filters = apply_filter_policy(self._filter_policy, self._filters, filters)
 
         top_k = top_k or self._top_k
-        documents = self._document_store._bm25_retrieval(query=query, filters=filters, top_k=top_k)
+        documents = self._document_store._bm25_retrieval(query=query, filters=filters, top_k=top_k, tenant=tenant)
+        return {"documents": documents}
+
+    @component.output_types(documents=List[Document])
+    async def run_async(
+        self,
+        query: str,
+        filters: Optional[Dict[str, Any]] = None,
+        top_k: Optional[int] = None,
+        *,
+        tenant: Optional[str] = None,
+    ):
+        """
+        Asynchronously retrieves documents from Weaviate using the BM25 algorithm.
+
+        :param query:
+            The query text.
+        :param filters: Filters applied to the retrieved Documents. The way runtime filters are applied depends on
+                        the `filter_policy` chosen at retriever initialization. See init method docstring for more
+                        details.
+        :param top_k:
+            The maximum number of documents to return.
+        :param tenant:
+            The tenant to retrieve the documents from. Only used with multi-tenancy.
+        """
+        filters = apply_filter_policy(self._filter_policy, self._filters, filters)
+
+        top_k = top_k or self._top_k
+        documents = await self._document_store._bm25_retrieval_async(
+            query=query, filters=filters, top_k=top_k, tenant=tenant
+        )
         return {"documents": documents}
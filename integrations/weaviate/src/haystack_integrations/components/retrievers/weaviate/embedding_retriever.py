@@ -15,6 +15,10 @@ from haystack_integrations.document_stores.weaviate import WeaviateDocumentStore
 class WeaviateEmbeddingRetriever:
     """
     A retriever that uses Weaviate's vector search to find similar documents based on the embeddings of the query.
+
+    The vector index and its compression are configured when creating the `WeaviateDocumentStore`, as Weaviate doesn't
+    support changing them per query. When the store is created with `ef=-1`, the `top_k` of each query also sets how
+    many candidates the `hnsw` index explores.
     """
 
     def __init__(
@@ -106,6 +110,8 @@ class WeaviateEmbeddingRetriever:
         top_k: Optional[int] = None,
         distance: Optional[float] = None,
         certainty: Optional[float] = None,
+        *,
+        tenant: Optional[str] = None,
     ):
         """
         Retrieves documents from Weaviate using the vector search.
@@ -121,6 +127,8 @@ class WeaviateEmbeddingRetriever:
             The maximum allowed distance between Documents' embeddings.
         :param certainty:
             Normalized distance between the result item and the search vector.
+        :param tenant:
+            The tenant to retrieve the documents from. Only used with multi-tenancy.
         :raises ValueError:
             If both `distance` and `certainty` are provided.
             See https://weaviate.io/developers/weaviate/api/graphql/search-operators#variables to learn more about
@@ -141,5 +149,57 @@ class WeaviateEmbeddingRetriever:
             top_k=top_k,
             distance=distance,
             certainty=certainty,
+            tenant=tenant,
+        )
+        return {"documents": documents}
+
+    @component.output_types(documents=List[Document])
+    async def run_async(
+        self,
+        query_embedding: List[float],
+        filters: Optional[Dict[str, Any]] = None,
+        top_k: Optional[int] = None,
+        distance: Optional[float] = None,
+        certainty: Optional[float] = None,
+        *,
+        tenant: Optional[str] = None,
+    ):
+        """
+        Asynchronously retrieves documents from Weaviate using the vector search.
+
+        :param query_embedding:
+            Embedding of the query.
+        :param filters: Filters applied to the retrieved Documents. The way runtime filters are applied depends on
+                        the `filter_policy` chosen at retriever initialization. See init method docstring for more
+                        details.
+        :param top_k:
+            The maximum number of documents to return.
+        :param distance:
+            The maximum allowed distance between Documents' embeddings.
+        :param certainty:
+            Normalized distance between the result item and the search vector.
+        :param tenant:
+            The tenant to retrieve the documents from. Only used with multi-tenancy.
+        :raises ValueError:
+            If both `distance` and `certainty` are provided.
+            See https://weaviate.io/developers/weaviate/api/graphql/search-operators#variables to learn more about
+            `distance` and `certainty` parameters.
+        """
+        filters = apply_filter_policy(self._filter_policy, self._filters, filters)
+        top_k = top_k or self._top_k
+
+        distance = distance or self._distance
+        certainty = certainty or self._certainty
+        if distance is not None and certainty is not None:
+            msg = "Can't use 'distance' and 'certainty' parameters together"
+            raise ValueError(msg)
+
+        documents = await self._document_store._embedding_retrieval_async(
+            query_embedding=query_embedding,
+            filters=filters,
+            top_k=top_k,
+            distance=distance,
+            certainty=certainty,
+            tenant=tenant,
         )
         return {"documents": documents}
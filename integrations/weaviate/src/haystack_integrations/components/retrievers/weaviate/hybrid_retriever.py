@@ -0,0 +1,206 @@
+# SPDX-FileCopyrightText: 2023-present deepset GmbH <info@deepset.ai>
+#
+# SPDX-License-Identifier: Apache-2.0
+
+from typing import Any, Dict, List, Optional, Union
+
+from haystack import Document, component, default_from_dict, default_to_dict
+from haystack.document_stores.types import FilterPolicy
+from haystack.document_stores.types.filter_policy import apply_filter_policy
+
+from haystack_integrations.document_stores.weaviate import WeaviateDocumentStore
+from weaviate.collections.classes.grpc import HybridFusion
+
+
+@component
+class WeaviateHybridRetriever:
+    """
+    A retriever that uses Weaviate's hybrid search to find similar documents based on both the query text and its
+    embedding.
+
+    The keyword and vector searches are run and fused by Weaviate in a single request.
+    """
+
+    def __init__(
+        self,
+        *,
+        document_store: WeaviateDocumentStore,
+        filters: Optional[Dict[str, Any]] = None,
+        top_k: int = 10,
+        alpha: Optional[float] = None,
+        fusion_type: Optional[Union[str, HybridFusion]] = None,
+        max_vector_distance: Optional[float] = None,
+        filter_policy: Union[str, FilterPolicy] = FilterPolicy.REPLACE,
+    ):
+        """
+        Creates a new instance of WeaviateHybridRetriever.
+
+        :param document_store:
+            Instance of WeaviateDocumentStore that will be used from this retriever.
+        :param filters:
+            Custom filters applied when running the retriever.
+        :param top_k:
+            Maximum number of documents to return.
+        :param alpha:
+            Weight of the vector search in the fused score, between 0 and 1.
+            0 is a pure keyword search, 1 is a pure vector search.
+            If not set, Weaviate's default is used.
+        :param fusion_type:
+            How the keyword and vector search results are fused, either `HybridFusion.RANKED` or
+            `HybridFusion.RELATIVE_SCORE`. Their names (`"ranked"`, `"relative_score"`, in any case) and values
+            (`"FUSION_TYPE_RANKED"`, `"FUSION_TYPE_RELATIVE_SCORE"`) are accepted too.
+            If not set, Weaviate's default is used.
+        :param max_vector_distance:
+            The maximum allowed distance between the query embedding and the Documents' embeddings for the vector
+            search results.
+        :param filter_policy:
+            Policy to determine how filters are applied.
+        :raises ValueError:
+            If `alpha` is not between 0 and 1 or `fusion_type` is not valid.
+            See https://weaviate.io/developers/weaviate/search/hybrid to learn more about the hybrid search
+            parameters.
+        """
+        if alpha is not None and not 0 <= alpha <= 1:
+            msg = "'alpha' must be between 0 and 1"
+            raise ValueError(msg)
+
+        self._document_store = document_store
+        self._filters = filters or {}
+        self._top_k = top_k
+        self._alpha = alpha
+        self._fusion_type = self._parse_fusion_type(fusion_type) if fusion_type is not None else None
+        self._max_vector_distance = max_vector_distance
+        self._filter_policy = (
+            filter_policy if isinstance(filter_policy, FilterPolicy) else FilterPolicy.from_str(filter_policy)
+        )
+
+    @staticmethod
+    def _parse_fusion_type(fusion_type: Union[str, HybridFusion]) -> HybridFusion:
+        """
+        Converts a fusion type given as enum, enum name or enum value into a `HybridFusion`.
+
+        :raises ValueError: If `fusion_type` is not a valid fusion type.
+        """
+        if isinstance(fusion_type, HybridFusion):
+            return fusion_type
+        for member in HybridFusion:
+            if fusion_type.upper() in (member.name, member.value):
+                return member
+        accepted = [member.name.lower() for member in HybridFusion] + [member.value for member in HybridFusion]
+        msg = f"Invalid fusion_type '{fusion_type}'. Accepted values are: {accepted}"
+        raise ValueError(msg)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Serializes the component to a dictionary.
+
+        :returns:
+            Dictionary with serialized data.
+        """
+        return default_to_dict(
+            self,
+            filters=self._filters,
+            top_k=self._top_k,
+            alpha=self._alpha,
+            fusion_type=self._fusion_type.value if self._fusion_type is not None else None,
+            max_vector_distance=self._max_vector_distance,
+            filter_policy=self._filter_policy.value,
+            document_store=self._document_store.to_dict(),
+        )
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "WeaviateHybridRetriever":
+        """
+        Deserializes the component from a dictionary.
+
+        :param data:
+            Dictionary to deserialize from.
+        :returns:
+            Deserialized component.
+        """
+        data["init_parameters"]["document_store"] = WeaviateDocumentStore.from_dict(
+            data["init_parameters"]["document_store"]
+        )
+
+        if filter_policy := data["init_parameters"].get("filter_policy"):
+            data["init_parameters"]["filter_policy"] = FilterPolicy.from_str(filter_policy)
+
+        return default_from_dict(cls, data)
+
+    @component.output_types(documents=List[Document])
+    def run(
+        self,
+        query: str,
+        query_embedding: List[float],
+        filters: Optional[Dict[str, Any]] = None,
+        top_k: Optional[int] = None,
+        *,
+        tenant: Optional[str] = None,
+    ):
+        """
+        Retrieves documents from Weaviate using the hybrid search.
+
+        :param query:
+            The query text.
+        :param query_embedding:
+            Embedding of the query.
+        :param filters: Filters applied to the retrieved Documents. The way runtime filters are applied depends on
+                        the `filter_policy` chosen at retriever initialization. See init method docstring for more
+                        details.
+        :param top_k:
+            The maximum number of documents to return.
+        :param tenant:
+            The tenant to retrieve the documents from. Only used with multi-tenancy.
+        """
+        filters = apply_filter_policy(self._filter_policy, self._filters, filters)
+
+        documents = self._document_store._hybrid_retrieval(
+            query=query,
+            query_embedding=query_embedding,
+            filters=filters,
+            top_k=top_k or self._top_k,
+            alpha=self._alpha,
+            fusion_type=self._fusion_type,
+            max_vector_distance=self._max_vector_distance,
+            tenant=tenant,
+        )
+        return {"documents": documents}
+
+    @component.output_types(documents=List[Document])
+    async def run_async(
+        self,
+        query: str,
+        query_embedding: List[float],
+        filters: Optional[Dict[str, Any]] = None,
+        top_k: Optional[int] = None,
+        *,
+        tenant: Optional[str] = None,
+    ):
+        """
+        Asynchronously retrieves documents from Weaviate using the hybrid search.
+
+        :param query:
+            The query text.
+        :param query_embedding:
+            Embedding of the query.
+        :param filters: Filters applied to the retrieved Documents. The way runtime filters are applied depends on
+                        the `filter_policy` chosen at retriever initialization. See init method docstring for more
+                        details.
+        :param top_k:
+            The maximum number of documents to return.
+        :param tenant:
+            The tenant to retrieve the documents from. Only used with multi-tenancy.
+        """
+        filters = apply_filter_policy(self._filter_policy, self._filters, filters)
+
+        documents = await self._document_store._hybrid_retrieval_async(
+            query=query,
+            query_embedding=query_embedding,
+            filters=filters,
+            top_k=top_k or self._top_k,
+            alpha=self._alpha,
+            fusion_type=self._fusion_type,
+            max_vector_distance=self._max_vector_distance,
+            tenant=tenant,
+        )
+        return {"documents": documents}
@@ -5,7 +5,7 @@ import base64
 import datetime
 import json
 from dataclasses import asdict
-from typing import Any, Dict, List, Optional
+from typing import Any, AsyncGenerator, Dict, Generator, List, Literal, Optional, Set, Tuple
 
 from haystack import logging
 from haystack.core.serialization import default_from_dict, default_to_dict
@@ -14,7 +14,12 @@ from haystack.document_stores.errors import DocumentStoreError, DuplicateDocumen
 from haystack.document_stores.types.policy import DuplicatePolicy
 
 import weaviate
+from weaviate.classes.config import Configure
+from weaviate.classes.tenants import Tenant
+from weaviate.collections.classes.batch import ErrorObject
 from weaviate.collections.classes.data import DataObject
+from weaviate.collections.classes.filters import Filter, FilterReturn
+from weaviate.collections.classes.grpc import HybridFusion, Sort
 from weaviate.config import AdditionalConfig
 from weaviate.embedded import EmbeddedOptions
 from weaviate.util import generate_uuid5
@@ -36,23 +41,27 @@ logger = logging.getLogger(__name__)
 # We recommend the user to create a proper collection with the correct meta properties for their use case.
 # We mostly rely on these defaults for testing purposes using Weaviate automatic schema generation, but that's not
 # recommended for production use.
+#
+# `_original_id` uses the `field` tokenization so that it's indexed as a single token. This makes filters on the id
+# exact and lets us paginate over it, see WeaviateDocumentStore._scan().
 DOCUMENT_COLLECTION_PROPERTIES = [
-    {"name": "_original_id", "dataType": ["text"]},
+    {"name": "_original_id", "dataType": ["text"], "tokenization": "field"},
     {"name": "content", "dataType": ["text"]},
     {"name": "blob_data", "dataType": ["blob"]},
     {"name": "blob_mime_type", "dataType": ["text"]},
     {"name": "score", "dataType": ["number"]},
 ]
 
-# This is the default limit used when querying documents with WeaviateDocumentStore.
-#
-# We picked this as QUERY_MAXIMUM_RESULTS defaults to 10000, trying to get that many
-# documents at once will fail, even if the query is paginated.
-# This value will ensure we get the most documents possible without hitting that limit, it would
-# still fail if the user lowers the QUERY_MAXIMUM_RESULTS environment variable for their Weaviate instance.
+# This is the default number of documents fetched per request when scanning the collection.
 #
-# See WeaviateDocumentStore._query_with_filters() for more information.
-DEFAULT_QUERY_LIMIT = 9999
+# Filtered scans paginate with a keyset on `_original_id` rather than with limit and offset, so they are not
+# restricted by the QUERY_MAXIMUM_RESULTS environment variable of the Weaviate instance.
+# See WeaviateDocumentStore._scan() for more information.
+DEFAULT_SCAN_BATCH_SIZE = 1_000
+
+# This is the default number of objects sent to Weaviate per `insert_many` request when writing documents
+# with the async client or with the SKIP and FAIL policies.
+DEFAULT_WRITE_BATCH_SIZE = 1_000
 
 
 class WeaviateDocumentStore:
@@ -93,6 +102,14 @@ class WeaviateDocumentStore:
         additional_config: Optional[AdditionalConfig] = None,
         grpc_port: int = 50051,
         grpc_secure: bool = False,
+        vector_index_type: Optional[Literal["hnsw", "flat", "dynamic"]] = None,
+        quantization: Optional[Literal["pq", "bq", "sq"]] = None,
+        rescore_limit: Optional[int] = None,
+        ef: Optional[int] = None,
+        ef_construction: Optional[int] = None,
+        multi_tenancy: bool = False,
+        auto_tenant_creation: bool = True,
+        auto_tenant_activation: bool = True,
     ):
         """
         Create a new instance of WeaviateDocumentStore and connects to the Weaviate instance.
@@ -136,6 +153,44 @@ class WeaviateDocumentStore:
             The port to use for the gRPC connection.
         :param grpc_secure:
             Whether to use a secure channel for the underlying gRPC API.
+        :param vector_index_type:
+            The type of vector index used when the collection is created: `hnsw`, `flat` or `dynamic`.
+            A `dynamic` index starts as a `flat` one and switches to `hnsw` once the collection grows.
+            If `None` and no other vector index parameter is set, the `collection_settings` are used as they are.
+            Otherwise it defaults to `hnsw`.
+            The vector index parameters are only used when the collection is created and override the
+            `vectorIndexType` and `vectorIndexConfig` of `collection_settings`. Only the `distance` of its
+            `vectorIndexConfig` is kept.
+            See the official
+            `Weaviate documentation<https://weaviate.io/developers/weaviate/config-refs/schema/vector-index>`_
+            for more information on vector indexes and compression.
+        :param quantization:
+            The vector compression used when the collection is created: `pq` (product quantization),
+            `bq` (binary quantization) or `sq` (scalar quantization). A `flat` index only supports `bq`.
+            For a `dynamic` index it applies to its `hnsw` index, and to its `flat` index too if it's `bq`.
+        :param rescore_limit:
+            The number of compressed candidates rescored with the full vectors in each query.
+            Only supported with `bq` and `sq` quantization.
+        :param ef:
+            The size of the candidate list used by `hnsw` queries. Set it to `-1` to let Weaviate pick it
+            from the number of requested Documents.
+        :param ef_construction:
+            The size of the candidate list used when building the `hnsw` index.
+        :param multi_tenancy:
+            Whether the collection is created with multi-tenancy enabled. Each tenant's Documents are stored in their
+            own shard, which can be deactivated or offloaded when not used.
+            Pass a `tenant` to the document store methods and retrievers to scope them to a tenant.
+            See the official `Weaviate documentation<https://weaviate.io/developers/weaviate/manage-data/multi-tenancy>`_
+            for more information on multi-tenancy.
+            Writing to a tenant and the automatic tenant creation and activation require Weaviate 1.25 or later.
+        :param auto_tenant_creation:
+            Whether tenants that don't exist yet are created when writing Documents to them.
+            Only used if `multi_tenancy` is `True`.
+        :param auto_tenant_activation:
+            Whether inactive tenants are activated by Weaviate when they're accessed.
+            Only used if `multi_tenancy` is `True`.
+        :raises ValueError:
+            If the vector index parameters are not valid together.
         """
         self._url = url
         self._auth_client_secret = auth_client_secret
@@ -144,8 +199,23 @@ class WeaviateDocumentStore:
         self._additional_config = additional_config
         self._grpc_port = grpc_port
         self._grpc_secure = grpc_secure
+        self._vector_index_type = vector_index_type
+        self._quantization = quantization
+        self._rescore_limit = rescore_limit
+        self._ef = ef
+        self._ef_construction = ef_construction
+        # We build the vector index config right away so invalid parameters are reported on init
+        self._vector_index_settings = self._build_vector_index_settings()
+        self._multi_tenancy = multi_tenancy
+        self._auto_tenant_creation = auto_tenant_creation
+        self._auto_tenant_activation = auto_tenant_activation
+        # The tenants we know exist, so we don't check them again on every write
+        self._tenants: Set[str] = set()
         self._client = None
         self._collection = None
+        self._async_client: Optional[weaviate.WeaviateAsyncClient] = None
+        self._async_collection: Any = None
+        self._collection_properties: Optional[List[str]] = None
         # Store the connection settings dictionary
         self._collection_settings = collection_settings or {
             "class": "Default",
@@ -164,6 +234,73 @@ class WeaviateDocumentStore:
             "properties", DOCUMENT_COLLECTION_PROPERTIES
         )
 
+    def _build_vector_index_settings(self) -> Dict[str, Any]:
+        """
+        Builds the `vectorIndexType` and `vectorIndexConfig` collection settings from the vector index parameters.
+        """
+        params = (self._vector_index_type, self._quantization, self._rescore_limit, self._ef, self._ef_construction)
+        if all(param is None for param in params):
+            return {}
+
+        index_type = self._vector_index_type or "hnsw"
+        if index_type not in ("hnsw", "flat", "dynamic"):
+            msg = f"Invalid vector index type '{index_type}'. Supported types are 'hnsw', 'flat' and 'dynamic'."
+            raise ValueError(msg)
+        if self._quantization not in (None, "pq", "bq", "sq"):
+            msg = f"Invalid quantization '{self._quantization}'. Supported quantizations are 'pq', 'bq' and 'sq'."
+            raise ValueError(msg)
+        if self._rescore_limit is not None and self._quantization not in ("bq", "sq"):
+            msg = "'rescore_limit' is only supported with 'bq' and 'sq' quantization."
+            raise ValueError(msg)
+        if index_type == "flat" and self._quantization not in (None, "bq"):
+            msg = "A 'flat' vector index only supports 'bq' quantization."
+            raise ValueError(msg)
+        if index_type == "flat" and (self._ef is not None or self._ef_construction is not None):
+            msg = "'ef' and 'ef_construction' are not supported by a 'flat' vector index."
+            raise ValueError(msg)
+
+        quantizer: Any = None
+        if self._quantization == "pq":
+            quantizer = Configure.VectorIndex.Quantizer.pq()
+        elif self._quantization == "bq":
+            quantizer = Configure.VectorIndex.Quantizer.bq(rescore_limit=self._rescore_limit)
+        elif self._quantization == "sq":
+            quantizer = Configure.VectorIndex.Quantizer.sq(rescore_limit=self._rescore_limit)
+
+        if index_type == "flat":
+            flat = Configure.VectorIndex.flat(quantizer=quantizer)
+            return {"vectorIndexType": index_type, "vectorIndexConfig": flat._to_dict()}
+
+        hnsw = Configure.VectorIndex.hnsw(ef=self._ef, ef_construction=self._ef_construction, quantizer=quantizer)
+        if index_type == "dynamic":
+            # The flat index of a dynamic index only supports binary quantization
+            flat = Configure.VectorIndex.flat(quantizer=quantizer if self._quantization == "bq" else None)
+            dynamic = Configure.VectorIndex.dynamic(hnsw=hnsw, flat=flat)
+            return {"vectorIndexType": index_type, "vectorIndexConfig": dynamic._to_dict()}
+
+        return {"vectorIndexType": index_type, "vectorIndexConfig": hnsw._to_dict()}
+
+    def _get_collection_create_settings(self) -> Dict[str, Any]:
+        """
+        Returns the settings used to create the collection, including the vector index and multi-tenancy configuration.
+        """
+        settings = {**self._collection_settings}
+        if self._vector_index_settings:
+            settings["vectorIndexType"] = self._vector_index_settings["vectorIndexType"]
+            settings["vectorIndexConfig"] = {**self._vector_index_settings["vectorIndexConfig"]}
+            # the other keys of the configured index can be specific to its type, only the distance metric is kept
+            distance = self._collection_settings.get("vectorIndexConfig", {}).get("distance")
+            if distance is not None:
+                settings["vectorIndexConfig"]["distance"] = distance
+        if self._multi_tenancy:
+            multi_tenancy = Configure.multi_tenancy(
+                enabled=True,
+                auto_tenant_creation=self._auto_tenant_creation,
+                auto_tenant_activation=self._auto_tenant_activation,
+            )
+            settings["multiTenancyConfig"] = multi_tenancy._to_dict()
+        return settings
+
     @property
     def client(self):
         if self._client:
@@ -203,7 +340,7 @@ class WeaviateDocumentStore:
         # Test connection, it will raise an exception if it fails.
         self._client.collections.list_all(simple=True)
         if not self._client.collections.exists(self._collection_settings["class"]):
-            self._client.collections.create_from_dict(self._collection_settings)
+            self._client.collections.create_from_dict(self._get_collection_create_settings())
 
         return self._client
 
@@ -216,6 +353,96 @@ class WeaviateDocumentStore:
         self._collection = client.collections.get(self._collection_settings["class"])
         return self._collection
 
+    def _get_collection(self, tenant: Optional[str] = None):
+        """
+        Returns the collection, scoped to `tenant` if it's set.
+        """
+        return self.collection.with_tenant(tenant) if tenant is not None else self.collection
+
+    def _ensure_tenant(self, tenant: Optional[str]) -> None:
+        """
+        Creates `tenant` if it doesn't exist yet and tenants must be created automatically.
+        """
+        if tenant is None or not (self._multi_tenancy and self._auto_tenant_creation) or tenant in self._tenants:
+            return
+
+        if not self.collection.tenants.exists(tenant):
+            self.collection.tenants.create(Tenant(name=tenant))
+        self._tenants.add(tenant)
+
+    async def _get_async_client(self) -> weaviate.WeaviateAsyncClient:
+        """
+        Returns the async client, connecting to Weaviate and creating the collection the first time it's called.
+        """
+        if self._async_client:
+            return self._async_client
+
+        if self._url and self._url.endswith((".weaviate.network", ".weaviate.cloud")):
+            async_client = weaviate.use_async_with_weaviate_cloud(
+                self._url,
+                auth_credentials=self._auth_client_secret.resolve_value() if self._auth_client_secret else None,
+                headers=self._additional_headers,
+                additional_config=self._additional_config,
+            )
+        else:
+            async_client = weaviate.WeaviateAsyncClient(
+                connection_params=(
+                    weaviate.connect.base.ConnectionParams.from_url(
+                        url=self._url, grpc_port=self._grpc_port, grpc_secure=self._grpc_secure
+                    )
+                    if self._url
+                    else None
+                ),
+                auth_client_secret=self._auth_client_secret.resolve_value() if self._auth_client_secret else None,
+                additional_config=self._additional_config,
+                additional_headers=self._additional_headers,
+                embedded_options=self._embedded_options,
+                skip_init_checks=False,
+            )
+
+        await async_client.connect()
+
+        # Test connection, it will raise an exception if it fails.
+        await async_client.collections.list_all(simple=True)
+        if not await async_client.collections.exists(self._collection_settings["class"]):
+            await async_client.collections.create_from_dict(self._get_collection_create_settings())
+
+        self._async_client = async_client
+        return self._async_client
+
+    async def _get_async_collection(self, tenant: Optional[str] = None):
+        """
+        Returns the collection used by the async methods, scoped to `tenant` if it's set.
+        """
+        if not self._async_collection:
+            async_client = await self._get_async_client()
+            self._async_collection = async_client.collections.get(self._collection_settings["class"])
+
+        return self._async_collection.with_tenant(tenant) if tenant is not None else self._async_collection
+
+    async def close_async(self) -> None:
+        """
+        Closes the async client, if it's open.
+
+        The async methods open a new client the next time they're called.
+        """
+        if self._async_client is not None:
+            await self._async_client.close()
+        self._async_client = None
+        self._async_collection = None
+
+    async def _ensure_tenant_async(self, tenant: Optional[str]) -> None:
+        """
+        Asynchronously creates `tenant` if it doesn't exist yet and tenants must be created automatically.
+        """
+        if tenant is None or not (self._multi_tenancy and self._auto_tenant_creation) or tenant in self._tenants:
+            return
+
+        collection = await self._get_async_collection()
+        if not await collection.tenants.exists(tenant):
+            await collection.tenants.create(Tenant(name=tenant))
+        self._tenants.add(tenant)
+
     def to_dict(self) -> Dict[str, Any]:
         """
         Serializes the component to a dictionary.
@@ -236,6 +463,14 @@ class WeaviateDocumentStore:
             additional_headers=self._additional_headers,
             embedded_options=embedded_options,
             additional_config=additional_config,
+            vector_index_type=self._vector_index_type,
+            quantization=self._quantization,
+            rescore_limit=self._rescore_limit,
+            ef=self._ef,
+            ef_construction=self._ef_construction,
+            multi_tenancy=self._multi_tenancy,
+            auto_tenant_creation=self._auto_tenant_creation,
+            auto_tenant_activation=self._auto_tenant_activation,
         )
 
     @classmethod
@@ -259,11 +494,23 @@ class WeaviateDocumentStore:
             data,
         )
 
-    def count_documents(self) -> int:
+    def count_documents(self, *, tenant: Optional[str] = None) -> int:
         """
         Returns the number of documents present in the DocumentStore.
+
+        :param tenant: The tenant to count the documents of. Only used with multi-tenancy.
         """
-        total = self.collection.aggregate.over_all(total_count=True).total_count
+        total = self._get_collection(tenant).aggregate.over_all(total_count=True).total_count
+        return total if total else 0
+
+    async def count_documents_async(self, *, tenant: Optional[str] = None) -> int:
+        """
+        Asynchronously returns the number of documents present in the DocumentStore.
+
+        :param tenant: The tenant to count the documents of. Only used with multi-tenancy.
+        """
+        collection = await self._get_async_collection(tenant)
+        total = (await collection.aggregate.over_all(total_count=True)).total_count
         return total if total else 0
 
     def _to_data_object(self, document: Document) -> Dict[str, Any]:
@@ -334,7 +581,7 @@ class WeaviateDocumentStore:
 
         if weaviate_meta := getattr(data, "metadata", None):
             # Depending on the type of retrieval we get score from different fields.
-            # score is returned when using BM25 retrieval.
+            # score is returned when using BM25 or hybrid retrieval.
             # certainty is returned when using embedding retrieval.
             if weaviate_meta.score is not None:
                 document_data["score"] = weaviate_meta.score
@@ -343,47 +590,194 @@ class WeaviateDocumentStore:
 
         return Document.from_dict(document_data)
 
-    def _query(self) -> List[Dict[str, Any]]:
-        properties = [p.name for p in self.collection.config.get().properties]
+    def _get_collection_properties(self) -> List[str]:
+        """
+        Returns the names of the collection properties.
+
+        They're cached to avoid fetching the collection config on every query. The cache is cleared after each write,
+        as Weaviate automatic schema generation might have added new properties.
+        """
+        if self._collection_properties is None:
+            self._collection_properties = [p.name for p in self.collection.config.get().properties]
+        return self._collection_properties
+
+    async def _get_collection_properties_async(self) -> List[str]:
+        """
+        Asynchronously returns the names of the collection properties, sharing the cache with the sync methods.
+        """
+        if self._collection_properties is None:
+            collection = await self._get_async_collection()
+            self._collection_properties = [p.name for p in (await collection.config.get()).properties]
+        return self._collection_properties
+
+    def _scan(
+        self,
+        filters: Optional[Dict[str, Any]],
+        *,
+        batch_size: int,
+        return_embedding: bool,
+        tenant: Optional[str] = None,
+    ) -> Generator[DataObject[Dict[str, Any], None], None, None]:
+        """
+        Lazily yields the objects matching the filters, fetching `batch_size` of them per request.
+        """
+        collection = self._get_collection(tenant)
+        properties = self._get_collection_properties()
         try:
-            result = self.collection.iterator(include_vector=True, return_properties=properties)
+            if not filters:
+                yield from collection.iterator(
+                    include_vector=return_embedding, return_properties=properties, cache_size=batch_size
+                )
+                return
+
+            # The cursor API with `after` can't be used with filters. See the official docs:
+            # https://weaviate.io/developers/weaviate/api/graphql/additional-operators#cursor-with-after
+            #
+            # Paginating with limit and offset is inefficient and restricted by the QUERY_MAXIMUM_RESULTS environment
+            # variable, so instead we sort by `_original_id` and ask for the objects following the last one we got.
+            weaviate_filters = convert_filters(filters)
+            last_id = None
+            while True:
+                query = self._prepare_scan_page_query(
+                    weaviate_filters,
+                    last_id,
+                    batch_size=batch_size,
+                    return_embedding=return_embedding,
+                    properties=properties,
+                )
+                objects = collection.query.fetch_objects(**query).objects
+                new_objects = self._new_scan_page_objects(objects, last_id, batch_size)
+                if len(objects) < batch_size:
+                    yield from new_objects
+                    break
+                # Converting the objects to Documents changes their properties, so we get the id beforehand
+                last_id = new_objects[-1].properties["_original_id"]
+                yield from new_objects
         except weaviate.exceptions.WeaviateQueryError as e:
             msg = f"Failed to query documents in Weaviate. Error: {e.message}"
             raise DocumentStoreError(msg) from e
-        return result
-
-    def _query_with_filters(self, filters: Dict[str, Any]) -> List[Dict[str, Any]]:
-        properties = [p.name for p in self.collection.config.get().properties]
-        # When querying with filters we need to paginate using limit and offset as using
-        # a cursor with after is not possible. See the official docs:
-        # https://weaviate.io/developers/weaviate/api/graphql/additional-operators#cursor-with-after
-        #
-        # Nonetheless there's also another issue, paginating with limit and offset is not efficient
-        # and it's still restricted by the QUERY_MAXIMUM_RESULTS environment variable.
-        # If the sum of limit and offest is greater than QUERY_MAXIMUM_RESULTS an error is raised.
-        # See the official docs for more:
-        # https://weaviate.io/developers/weaviate/api/graphql/additional-operators#performance-considerations
-        offset = 0
-        partial_result = None
-        result = []
-        # Keep querying until we get all documents matching the filters
-        while partial_result is None or len(partial_result.objects) == DEFAULT_QUERY_LIMIT:
-            try:
-                partial_result = self.collection.query.fetch_objects(
-                    filters=convert_filters(filters),
-                    include_vector=True,
-                    limit=DEFAULT_QUERY_LIMIT,
-                    offset=offset,
-                    return_properties=properties,
+
+    async def _scan_async(
+        self,
+        filters: Optional[Dict[str, Any]],
+        *,
+        batch_size: int,
+        return_embedding: bool,
+        tenant: Optional[str] = None,
+    ) -> AsyncGenerator[DataObject[Dict[str, Any], None], None]:
+        """
+        Asynchronously and lazily yields the objects matching the filters, fetching `batch_size` of them per request.
+
+        See `_scan` for details on how results are paginated.
+        """
+        collection = await self._get_async_collection(tenant)
+        properties = await self._get_collection_properties_async()
+        try:
+            if not filters:
+                async for obj in collection.iterator(
+                    include_vector=return_embedding, return_properties=properties, cache_size=batch_size
+                ):
+                    yield obj
+                return
+
+            weaviate_filters = convert_filters(filters)
+            last_id = None
+            while True:
+                query = self._prepare_scan_page_query(
+                    weaviate_filters,
+                    last_id,
+                    batch_size=batch_size,
+                    return_embedding=return_embedding,
+                    properties=properties,
                 )
-            except weaviate.exceptions.WeaviateQueryError as e:
-                msg = f"Failed to query documents in Weaviate. Error: {e.message}"
-                raise DocumentStoreError(msg) from e
-            result.extend(partial_result.objects)
-            offset += DEFAULT_QUERY_LIMIT
-        return result
+                objects = (await collection.query.fetch_objects(**query)).objects
+                new_objects = self._new_scan_page_objects(objects, last_id, batch_size)
+                if len(objects) == batch_size:
+                    # Converting the objects to Documents changes their properties, so we get the id beforehand
+                    last_id = new_objects[-1].properties["_original_id"]
+                for obj in new_objects:
+                    yield obj
+                if len(objects) < batch_size:
+                    break
+        except weaviate.exceptions.WeaviateQueryError as e:
+            msg = f"Failed to query documents in Weaviate. Error: {e.message}"
+            raise DocumentStoreError(msg) from e
+
+    @staticmethod
+    def _prepare_scan_page_query(
+        weaviate_filters: FilterReturn,
+        last_id: Optional[str],
+        *,
+        batch_size: int,
+        return_embedding: bool,
+        properties: List[str],
+    ) -> Dict[str, Any]:
+        """
+        Prepares the `fetch_objects` arguments to get the page of objects following the one ending with `last_id`.
+        """
+        page_filters = weaviate_filters
+        if last_id is not None:
+            page_filters = weaviate_filters & Filter.by_property("_original_id").greater_than(last_id)
+        return {
+            "filters": page_filters,
+            "sort": Sort.by_property("_original_id"),
+            "include_vector": return_embedding,
+            "limit": batch_size,
+            "return_properties": properties,
+        }
+
+    @staticmethod
+    def _new_scan_page_objects(
+        objects: List[DataObject[Dict[str, Any], None]], last_id: Optional[str], batch_size: int
+    ) -> List[DataObject[Dict[str, Any], None]]:
+        """
+        Returns the objects of a scan page that have not been returned by previous pages.
 
-    def filter_documents(self, filters: Optional[Dict[str, Any]] = None) -> List[Document]:
+        Collections created with a word tokenized `_original_id` might match ids preceding the last one, as the filter
+        is applied to each of their tokens. We drop them as they've already been returned.
+        """
+        new_objects = [obj for obj in objects if last_id is None or obj.properties["_original_id"] > last_id]
+        if len(objects) == batch_size and not new_objects:
+            msg = (
+                "Failed to paginate over the documents matching the filters. "
+                "Use the `field` tokenization for the `_original_id` property or a larger batch size."
+            )
+            raise DocumentStoreError(msg)
+        return new_objects
+
+    def filter_documents_iter(
+        self,
+        filters: Optional[Dict[str, Any]] = None,
+        *,
+        batch_size: int = DEFAULT_SCAN_BATCH_SIZE,
+        return_embedding: bool = True,
+        tenant: Optional[str] = None,
+    ) -> Generator[Document, None, None]:
+        """
+        Lazily yields the documents that match the filters provided.
+
+        Documents are fetched from Weaviate in batches of `batch_size`, so memory usage stays bounded and there is
+        no limit on the number of documents that can be returned.
+
+        For a detailed specification of the filters, refer to the
+        DocumentStore.filter_documents() protocol documentation.
+
+        :param filters: The filters to apply to the document list.
+        :param batch_size: The number of documents fetched from Weaviate per request.
+        :param return_embedding: Whether to fetch the embeddings of the documents.
+        :param tenant: The tenant to get the documents from. Only used with multi-tenancy.
+        :returns: A generator of Documents that match the given filters.
+        """
+        if filters and "operator" not in filters and "conditions" not in filters:
+            msg = "Invalid filter syntax. See https://docs.haystack.deepset.ai/docs/metadata-filtering for details."
+            raise ValueError(msg)
+
+        for obj in self._scan(filters, batch_size=batch_size, return_embedding=return_embedding, tenant=tenant):
+            yield self._to_document(obj)
+
+    def filter_documents(
+        self, filters: Optional[Dict[str, Any]] = None, *, tenant: Optional[str] = None
+    ) -> List[Document]:
         """
         Returns the documents that match the filters provided.
 
@@ -391,20 +785,59 @@ class WeaviateDocumentStore:
         DocumentStore.filter_documents() protocol documentation.
 
         :param filters: The filters to apply to the document list.
+        :param tenant: The tenant to get the documents from. Only used with multi-tenancy.
         :returns: A list of Documents that match the given filters.
         """
+        return list(self.filter_documents_iter(filters, tenant=tenant))
+
+    async def filter_documents_iter_async(
+        self,
+        filters: Optional[Dict[str, Any]] = None,
+        *,
+        batch_size: int = DEFAULT_SCAN_BATCH_SIZE,
+        return_embedding: bool = True,
+        tenant: Optional[str] = None,
+    ) -> AsyncGenerator[Document, None]:
+        """
+        Asynchronously and lazily yields the documents that match the filters provided.
+
+        Documents are fetched from Weaviate in batches of `batch_size`, so memory usage stays bounded and there is
+        no limit on the number of documents that can be returned.
+
+        For a detailed specification of the filters, refer to the
+        DocumentStore.filter_documents() protocol documentation.
+
+        :param filters: The filters to apply to the document list.
+        :param batch_size: The number of documents fetched from Weaviate per request.
+        :param return_embedding: Whether to fetch the embeddings of the documents.
+        :param tenant: The tenant to get the documents from. Only used with multi-tenancy.
+        :returns: An async generator of Documents that match the given filters.
+        """
         if filters and "operator" not in filters and "conditions" not in filters:
             msg = "Invalid filter syntax. See https://docs.haystack.deepset.ai/docs/metadata-filtering for details."
             raise ValueError(msg)
 
-        result = []
-        if filters:
-            result = self._query_with_filters(filters)
-        else:
-            result = self._query()
-        return [self._to_document(doc) for doc in result]
+        async for obj in self._scan_async(
+            filters, batch_size=batch_size, return_embedding=return_embedding, tenant=tenant
+        ):
+            yield self._to_document(obj)
 
-    def _batch_write(self, documents: List[Document]) -> int:
+    async def filter_documents_async(
+        self, filters: Optional[Dict[str, Any]] = None, *, tenant: Optional[str] = None
+    ) -> List[Document]:
+        """
+        Asynchronously returns the documents that match the filters provided.
+
+        For a detailed specification of the filters, refer to the
+        DocumentStore.filter_documents() protocol documentation.
+
+        :param filters: The filters to apply to the document list.
+        :param tenant: The tenant to get the documents from. Only used with multi-tenancy.
+        :returns: A list of Documents that match the given filters.
+        """
+        return [doc async for doc in self.filter_documents_iter_async(filters, tenant=tenant)]
+
+    def _batch_write(self, documents: List[Document], tenant: Optional[str] = None) -> int:
         """
         Writes document to Weaviate in batches.
         Documents with the same id will be overwritten.
@@ -422,102 +855,285 @@ class WeaviateDocumentStore:
                     collection=self.collection.name,
                     uuid=generate_uuid5(doc.id),
                     vector=doc.embedding,
+                    tenant=tenant,
                 )
         if failed_objects := self.client.batch.failed_objects:
-            # We fallback to use the UUID if the _original_id is not present, this is just to be
-            mapped_objects = {}
-            for obj in failed_objects:
-                properties = obj.object_.properties or {}
-                # We get the object uuid just in case the _original_id is not present.
-                # That's extremely unlikely to happen but let's stay on the safe side.
-                id_ = properties.get("_original_id", obj.object_.uuid)
-                mapped_objects[id_] = obj.message
-
-            msg = "\n".join(
-                [
-                    f"Failed to write object with id '{id_}'. Error: '{message}'"
-                    for id_, message in mapped_objects.items()
-                ]
-            )
-            raise DocumentStoreError(msg)
+            self._raise_for_failed_objects(failed_objects)
 
         # If the document already exists we get no status message back from Weaviate.
         # So we assume that all Documents were written.
         return len(documents)
 
-    def _write(self, documents: List[Document], policy: DuplicatePolicy) -> int:
+    async def _batch_write_async(self, documents: List[Document], tenant: Optional[str] = None) -> int:
         """
-        Writes documents to Weaviate using the specified policy.
-        This doesn't uses the batch API, so it's slower than _batch_write.
-        If policy is set to SKIP it will skip any document that already exists.
-        If policy is set to FAIL it will raise an exception if any of the documents already exists.
+        Asynchronously writes document to Weaviate in batches using `insert_many`.
+        Documents with the same id will be overwritten.
+        Raises in case of errors.
         """
-        written = 0
-        duplicate_errors_ids = []
+        collection = await self._get_async_collection(tenant)
+
+        objects = self._to_data_objects(documents)
+        failed_objects: List[ErrorObject] = []
+        for i in range(0, len(objects), DEFAULT_WRITE_BATCH_SIZE):
+            result = await collection.data.insert_many(objects[i : i + DEFAULT_WRITE_BATCH_SIZE])
+            failed_objects.extend(result.errors.values())
+        if failed_objects:
+            self._raise_for_failed_objects(failed_objects)
+
+        return len(documents)
+
+    def _to_data_objects(self, documents: List[Document]) -> List[DataObject[Dict[str, Any], None]]:
+        """
+        Converts Documents to the objects passed to `insert_many`, raising if any of them is not a Document.
+        """
+        objects = []
         for doc in documents:
             if not isinstance(doc, Document):
                 msg = f"Expected a Document, got '{type(doc)}' instead."
                 raise ValueError(msg)
 
-            if policy == DuplicatePolicy.SKIP and self.collection.data.exists(uuid=generate_uuid5(doc.id)):
-                # This Document already exists, we skip it
+            objects.append(
+                DataObject(properties=self._to_data_object(doc), uuid=generate_uuid5(doc.id), vector=doc.embedding)
+            )
+        return objects
+
+    @staticmethod
+    def _prepare_existing_objects_query(objects: List[DataObject[Dict[str, Any], None]]) -> Dict[str, Any]:
+        """
+        Prepares the `fetch_objects` arguments to find which of the objects are already stored.
+        Only the uuids are returned.
+        """
+        return {
+            "filters": Filter.by_id().contains_any([str(obj.uuid) for obj in objects]),
+            "limit": len(objects),
+            "include_vector": False,
+            "return_properties": [],
+        }
+
+    @staticmethod
+    def _split_new_objects(
+        objects: List[DataObject[Dict[str, Any], None]], existing_uuids: Set[str], seen_uuids: Set[str]
+    ) -> Tuple[List[DataObject[Dict[str, Any], None]], List[str]]:
+        """
+        Splits the objects in the ones that must be inserted and the ids of the duplicate ones.
+
+        An object is a duplicate if it's already stored or if an object with the same id comes earlier in the
+        written Documents. `seen_uuids` is updated with the uuids of the new objects.
+        """
+        new_objects = []
+        duplicate_ids = []
+        for obj in objects:
+            if obj.uuid in existing_uuids or obj.uuid in seen_uuids:
+                duplicate_ids.append(obj.properties["_original_id"])
                 continue
+            seen_uuids.add(str(obj.uuid))
+            new_objects.append(obj)
+        return new_objects, duplicate_ids
 
-            try:
-                self.collection.data.insert(
-                    uuid=generate_uuid5(doc.id),
-                    properties=self._to_data_object(doc),
-                    vector=doc.embedding,
-                )
+    @staticmethod
+    def _raise_for_failed_objects(failed_objects: List[ErrorObject]) -> None:
+        """
+        Raises a DocumentStoreError listing the objects that failed to be written in a batch.
+        """
+        mapped_objects = {}
+        for obj in failed_objects:
+            properties = obj.object_.properties or {}
+            # We get the object uuid just in case the _original_id is not present.
+            # That's extremely unlikely to happen but let's stay on the safe side.
+            id_ = properties.get("_original_id", obj.object_.uuid)
+            mapped_objects[id_] = obj.message
+
+        msg = "\n".join(
+            [f"Failed to write object with id '{id_}'. Error: '{message}'" for id_, message in mapped_objects.items()]
+        )
+        raise DocumentStoreError(msg)
+
+    def _write(self, documents: List[Document], policy: DuplicatePolicy, tenant: Optional[str] = None) -> int:
+        """
+        Writes documents to Weaviate using the specified policy.
+        For each batch of `DEFAULT_WRITE_BATCH_SIZE` Documents the ones already existing are looked up with a
+        single query, then only the new ones are inserted with `insert_many`.
+        If policy is set to SKIP it will skip any document that already exists.
+        If policy is set to FAIL it will raise an exception if any of the documents already exists.
+        """
+        collection = self._get_collection(tenant)
+        objects = self._to_data_objects(documents)
 
-                written += 1
-            except weaviate.exceptions.UnexpectedStatusCodeError:
-                if policy == DuplicatePolicy.FAIL:
-                    duplicate_errors_ids.append(doc.id)
-        if duplicate_errors_ids:
+        written = 0
+        duplicate_errors_ids: List[str] = []
+        failed_objects: List[ErrorObject] = []
+        seen_uuids: Set[str] = set()
+        for i in range(0, len(objects), DEFAULT_WRITE_BATCH_SIZE):
+            batch = objects[i : i + DEFAULT_WRITE_BATCH_SIZE]
+            existing = collection.query.fetch_objects(**self._prepare_existing_objects_query(batch))
+            new_objects, duplicate_ids = self._split_new_objects(
+                batch, {str(obj.uuid) for obj in existing.objects}, seen_uuids
+            )
+            duplicate_errors_ids.extend(duplicate_ids)
+            if new_objects:
+                result = collection.data.insert_many(new_objects)
+                failed_objects.extend(result.errors.values())
+                written += len(new_objects) - len(result.errors)
+
+        if failed_objects:
+            self._raise_for_failed_objects(failed_objects)
+        if policy == DuplicatePolicy.FAIL and duplicate_errors_ids:
+            msg = f"IDs '{', '.join(duplicate_errors_ids)}' already exist in the document store."
+            raise DuplicateDocumentError(msg)
+        return written
+
+    async def _write_async(
+        self, documents: List[Document], policy: DuplicatePolicy, tenant: Optional[str] = None
+    ) -> int:
+        """
+        Asynchronously writes documents to Weaviate using the specified policy.
+        See `_write` for details.
+        """
+        collection = await self._get_async_collection(tenant)
+        objects = self._to_data_objects(documents)
+
+        written = 0
+        duplicate_errors_ids: List[str] = []
+        failed_objects: List[ErrorObject] = []
+        seen_uuids: Set[str] = set()
+        for i in range(0, len(objects), DEFAULT_WRITE_BATCH_SIZE):
+            batch = objects[i : i + DEFAULT_WRITE_BATCH_SIZE]
+            existing = await collection.query.fetch_objects(**self._prepare_existing_objects_query(batch))
+            new_objects, duplicate_ids = self._split_new_objects(
+                batch, {str(obj.uuid) for obj in existing.objects}, seen_uuids
+            )
+            duplicate_errors_ids.extend(duplicate_ids)
+            if new_objects:
+                result = await collection.data.insert_many(new_objects)
+                failed_objects.extend(result.errors.values())
+                written += len(new_objects) - len(result.errors)
+
+        if failed_objects:
+            self._raise_for_failed_objects(failed_objects)
+        if policy == DuplicatePolicy.FAIL and duplicate_errors_ids:
             msg = f"IDs '{', '.join(duplicate_errors_ids)}' already exist in the document store."
             raise DuplicateDocumentError(msg)
         return written
 
-    def write_documents(self, documents: List[Document], policy: DuplicatePolicy = DuplicatePolicy.NONE) -> int:
+    def write_documents(
+        self,
+        documents: List[Document],
+        policy: DuplicatePolicy = DuplicatePolicy.NONE,
+        *,
+        tenant: Optional[str] = None,
+    ) -> int:
         """
         Writes documents to Weaviate using the specified policy.
-        We recommend using a OVERWRITE policy as it's faster than other policies for Weaviate since it uses
-        the batch API.
-        We can't use the batch API for other policies as it doesn't return any information whether the document
-        already exists or not. That prevents us from returning errors when using the FAIL policy or skipping a
-        Document when using the SKIP policy.
+        We recommend using a OVERWRITE policy as it's the fastest policy for Weaviate since it uses the batch API
+        without any further check.
+        The batch API doesn't return any information whether the document already exists or not. So with the SKIP
+        and FAIL policies the existing Documents are looked up first, one query per batch, and only the new ones
+        are written.
+
+        :param documents: The Documents to write.
+        :param policy: The policy to use when a Document already exists.
+        :param tenant: The tenant to write the Documents to. Only used with multi-tenancy.
+        :returns: The number of Documents written.
+        """
+        # New properties might be created by Weaviate automatic schema generation
+        self._collection_properties = None
+        self._ensure_tenant(tenant)
+
+        if policy in [DuplicatePolicy.NONE, DuplicatePolicy.OVERWRITE]:
+            return self._batch_write(documents, tenant)
+
+        return self._write(documents, policy, tenant)
+
+    async def write_documents_async(
+        self,
+        documents: List[Document],
+        policy: DuplicatePolicy = DuplicatePolicy.NONE,
+        *,
+        tenant: Optional[str] = None,
+    ) -> int:
+        """
+        Asynchronously writes documents to Weaviate using the specified policy.
+        Documents are written in batches with `insert_many`.
+        See `write_documents` for details on the policies.
+
+        :param documents: The Documents to write.
+        :param policy: The policy to use when a Document already exists.
+        :param tenant: The tenant to write the Documents to. Only used with multi-tenancy.
+        :returns: The number of Documents written.
         """
+        # New properties might be created by Weaviate automatic schema generation
+        self._collection_properties = None
+        await self._ensure_tenant_async(tenant)
+
         if policy in [DuplicatePolicy.NONE, DuplicatePolicy.OVERWRITE]:
-            return self._batch_write(documents)
+            return await self._batch_write_async(documents, tenant)
 
-        return self._write(documents, policy)
+        return await self._write_async(documents, policy, tenant)
 
-    def delete_documents(self, document_ids: List[str]) -> None:
+    def delete_documents(self, document_ids: List[str], *, tenant: Optional[str] = None) -> None:
         """
         Deletes all documents with matching document_ids from the DocumentStore.
 
         :param document_ids: The object_ids to delete.
+        :param tenant: The tenant to delete the documents from. Only used with multi-tenancy.
         """
         weaviate_ids = [generate_uuid5(doc_id) for doc_id in document_ids]
-        self.collection.data.delete_many(where=weaviate.classes.query.Filter.by_id().contains_any(weaviate_ids))
+        self._get_collection(tenant).data.delete_many(
+            where=weaviate.classes.query.Filter.by_id().contains_any(weaviate_ids)
+        )
+
+    async def delete_documents_async(self, document_ids: List[str], *, tenant: Optional[str] = None) -> None:
+        """
+        Asynchronously deletes all documents with matching document_ids from the DocumentStore.
+
+        :param document_ids: The object_ids to delete.
+        :param tenant: The tenant to delete the documents from. Only used with multi-tenancy.
+        """
+        collection = await self._get_async_collection(tenant)
+        weaviate_ids = [generate_uuid5(doc_id) for doc_id in document_ids]
+        await collection.data.delete_many(where=weaviate.classes.query.Filter.by_id().contains_any(weaviate_ids))
 
     def _bm25_retrieval(
-        self, query: str, filters: Optional[Dict[str, Any]] = None, top_k: Optional[int] = None
+        self,
+        query: str,
+        filters: Optional[Dict[str, Any]] = None,
+        top_k: Optional[int] = None,
+        *,
+        tenant: Optional[str] = None,
     ) -> List[Document]:
-        properties = [p.name for p in self.collection.config.get().properties]
-        result = self.collection.query.bm25(
-            query=query,
-            filters=convert_filters(filters) if filters else None,
-            limit=top_k,
-            include_vector=True,
-            query_properties=["content"],
-            return_properties=properties,
-            return_metadata=["score"],
-        )
+        properties = self._get_collection_properties()
+        result = self._get_collection(tenant).query.bm25(**self._prepare_bm25_query(query, filters, top_k, properties))
+
+        return [self._to_document(doc) for doc in result.objects]
+
+    async def _bm25_retrieval_async(
+        self,
+        query: str,
+        filters: Optional[Dict[str, Any]] = None,
+        top_k: Optional[int] = None,
+        *,
+        tenant: Optional[str] = None,
+    ) -> List[Document]:
+        collection = await self._get_async_collection(tenant)
+        properties = await self._get_collection_properties_async()
+        result = await collection.query.bm25(**self._prepare_bm25_query(query, filters, top_k, properties))
 
         return [self._to_document(doc) for doc in result.objects]
 
+    @staticmethod
+    def _prepare_bm25_query(
+        query: str, filters: Optional[Dict[str, Any]], top_k: Optional[int], properties: List[str]
+    ) -> Dict[str, Any]:
+        return {
+            "query": query,
+            "filters": convert_filters(filters) if filters else None,
+            "limit": top_k,
+            "include_vector": True,
+            "query_properties": ["content"],
+            "return_properties": properties,
+            "return_metadata": ["score"],
+        }
+
     def _embedding_retrieval(
         self,
         query_embedding: List[float],
@@ -525,21 +1141,130 @@ class WeaviateDocumentStore:
         top_k: Optional[int] = None,
         distance: Optional[float] = None,
         certainty: Optional[float] = None,
+        *,
+        tenant: Optional[str] = None,
+    ) -> List[Document]:
+        query = self._prepare_embedding_query(query_embedding, filters, top_k, distance, certainty)
+        query["return_properties"] = self._get_collection_properties()
+        result = self._get_collection(tenant).query.near_vector(**query)
+
+        return [self._to_document(doc) for doc in result.objects]
+
+    async def _embedding_retrieval_async(
+        self,
+        query_embedding: List[float],
+        filters: Optional[Dict[str, Any]] = None,
+        top_k: Optional[int] = None,
+        distance: Optional[float] = None,
+        certainty: Optional[float] = None,
+        *,
+        tenant: Optional[str] = None,
     ) -> List[Document]:
+        query = self._prepare_embedding_query(query_embedding, filters, top_k, distance, certainty)
+        collection = await self._get_async_collection(tenant)
+        query["return_properties"] = await self._get_collection_properties_async()
+        result = await collection.query.near_vector(**query)
+
+        return [self._to_document(doc) for doc in result.objects]
+
+    @staticmethod
+    def _prepare_embedding_query(
+        query_embedding: List[float],
+        filters: Optional[Dict[str, Any]],
+        top_k: Optional[int],
+        distance: Optional[float],
+        certainty: Optional[float],
+    ) -> Dict[str, Any]:
         if distance is not None and certainty is not None:
             msg = "Can't use 'distance' and 'certainty' parameters together"
             raise ValueError(msg)
 
-        properties = [p.name for p in self.collection.config.get().properties]
-        result = self.collection.query.near_vector(
-            near_vector=query_embedding,
-            distance=distance,
-            certainty=certainty,
-            include_vector=True,
-            filters=convert_filters(filters) if filters else None,
-            limit=top_k,
-            return_properties=properties,
-            return_metadata=["certainty"],
+        return {
+            "near_vector": query_embedding,
+            "distance": distance,
+            "certainty": certainty,
+            "include_vector": True,
+            "filters": convert_filters(filters) if filters else None,
+            "limit": top_k,
+            "return_metadata": ["certainty"],
+        }
+
+    def _hybrid_retrieval(
+        self,
+        query: str,
+        query_embedding: List[float],
+        *,
+        filters: Optional[Dict[str, Any]] = None,
+        top_k: Optional[int] = None,
+        alpha: Optional[float] = None,
+        fusion_type: Optional[HybridFusion] = None,
+        max_vector_distance: Optional[float] = None,
+        tenant: Optional[str] = None,
+    ) -> List[Document]:
+        query_kwargs = self._prepare_hybrid_query(
+            query,
+            query_embedding,
+            filters=filters,
+            top_k=top_k,
+            alpha=alpha,
+            fusion_type=fusion_type,
+            max_vector_distance=max_vector_distance,
+        )
+        query_kwargs["return_properties"] = self._get_collection_properties()
+        result = self._get_collection(tenant).query.hybrid(**query_kwargs)
+
+        return [self._to_document(doc) for doc in result.objects]
+
+    async def _hybrid_retrieval_async(
+        self,
+        query: str,
+        query_embedding: List[float],
+        *,
+        filters: Optional[Dict[str, Any]] = None,
+        top_k: Optional[int] = None,
+        alpha: Optional[float] = None,
+        fusion_type: Optional[HybridFusion] = None,
+        max_vector_distance: Optional[float] = None,
+        tenant: Optional[str] = None,
+    ) -> List[Document]:
+        query_kwargs = self._prepare_hybrid_query(
+            query,
+            query_embedding,
+            filters=filters,
+            top_k=top_k,
+            alpha=alpha,
+            fusion_type=fusion_type,
+            max_vector_distance=max_vector_distance,
         )
+        collection = await self._get_async_collection(tenant)
+        query_kwargs["return_properties"] = await self._get_collection_properties_async()
+        result = await collection.query.hybrid(**query_kwargs)
 
         return [self._to_document(doc) for doc in result.objects]
+
+    @staticmethod
+    def _prepare_hybrid_query(
+        query: str,
+        query_embedding: List[float],
+        *,
+        filters: Optional[Dict[str, Any]],
+        top_k: Optional[int],
+        alpha: Optional[float],
+        fusion_type: Optional[HybridFusion],
+        max_vector_distance: Optional[float],
+    ) -> Dict[str, Any]:
+        query_kwargs = {
+            "query": query,
+            "vector": query_embedding,
+            "fusion_type": fusion_type,
+            "max_vector_distance": max_vector_distance,
+            "filters": convert_filters(filters) if filters else None,
+            "limit": top_k,
+            "include_vector": True,
+            "query_properties": ["content"],
+            "return_metadata": ["score"],
+        }
+        # Weaviate applies its own default alpha when it's not set
+        if alpha is not None:
+            query_kwargs["alpha"] = alpha
+        return query_kwargs
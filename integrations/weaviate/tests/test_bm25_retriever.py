@@ -5,6 +5,7 @@
 from unittest.mock import Mock, patch
 
 import pytest
+from haystack.dataclasses import Document
 from haystack.document_stores.types import FilterPolicy
 
 from haystack_integrations.components.retrievers.weaviate import WeaviateBM25Retriever
@@ -44,7 +45,7 @@ def test_to_dict(_mock_weaviate):
                         "class": "Default",
                         "invertedIndexConfig": {"indexNullState": True},
                         "properties": [
-                            {"name": "_original_id", "dataType": ["text"]},
+                            {"name": "_original_id", "dataType": ["text"], "tokenization": "field"},
                             {"name": "content", "dataType": ["text"]},
                             {"name": "blob_data", "dataType": ["blob"]},
                             {"name": "blob_mime_type", "dataType": ["text"]},
@@ -55,6 +56,14 @@ def test_to_dict(_mock_weaviate):
                     "additional_headers": None,
                     "embedded_options": None,
                     "additional_config": None,
+                    "vector_index_type": None,
+                    "quantization": None,
+                    "rescore_limit": None,
+                    "ef": None,
+                    "ef_construction": None,
+                    "multi_tenancy": False,
+                    "auto_tenant_creation": True,
+                    "auto_tenant_activation": True,
                 },
             },
         },
@@ -143,4 +152,19 @@ def test_run(mock_document_store):
     query = "some query"
     filters = {"field": "content", "operator": "==", "value": "Some text"}
     retriever.run(query=query, filters=filters, top_k=5)
-    mock_document_store._bm25_retrieval.assert_called_once_with(query=query, filters=filters, top_k=5)
+    mock_document_store._bm25_retrieval.assert_called_once_with(query=query, filters=filters, top_k=5, tenant=None)
+
+
+@pytest.mark.asyncio
+async def test_run_async():
+    mock_document_store = Mock(spec=WeaviateDocumentStore)
+    mock_document_store._bm25_retrieval_async.return_value = [Document(content="test document")]
+    retriever = WeaviateBM25Retriever(
+        document_store=mock_document_store, filters={"some": "filter"}, filter_policy=FilterPolicy.MERGE
+    )
+    filters = {"field": "content", "operator": "==", "value": "Some text"}
+    res = await retriever.run_async(query="some query", filters=filters, top_k=5, tenant="tenant_a")
+    mock_document_store._bm25_retrieval_async.assert_called_once_with(
+        query="some query", filters=filters, top_k=5, tenant="tenant_a"
+    )
+    assert res["documents"][0].content == "test document"
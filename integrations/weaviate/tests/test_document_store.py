@@ -5,13 +5,15 @@
 import base64
 import os
 from typing import List
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import UUID
 
 import pytest
 from dateutil import parser
 from haystack.dataclasses.byte_stream import ByteStream
 from haystack.dataclasses.document import Document
-from haystack.document_stores.errors import DocumentStoreError
+from haystack.document_stores.errors import DocumentStoreError, DuplicateDocumentError
+from haystack.document_stores.types import DuplicatePolicy
 from haystack.testing.document_store import (
     CountDocumentsTest,
     DeleteDocumentsTest,
@@ -23,7 +25,10 @@ from haystack.utils.auth import Secret
 from numpy import array as np_array
 from numpy import array_equal as np_array_equal
 from numpy import float32 as np_float32
+from weaviate.collections.classes.config import VectorIndexType
 from weaviate.collections.classes.data import DataObject
+from weaviate.collections.classes.filters import Filter
+from weaviate.collections.classes.grpc import HybridFusion
 from weaviate.config import AdditionalConfig, ConnectionConfig, Proxies, Timeout
 from weaviate.embedded import (
     DEFAULT_BINARY_PATH,
@@ -32,7 +37,9 @@ from weaviate.embedded import (
     DEFAULT_PORT,
     EmbeddedOptions,
 )
+from weaviate.util import generate_uuid5
 
+from haystack_integrations.document_stores.weaviate._filters import convert_filters
 from haystack_integrations.document_stores.weaviate.auth import AuthApiKey
 from haystack_integrations.document_stores.weaviate.document_store import (
     DOCUMENT_COLLECTION_PROPERTIES,
@@ -46,6 +53,264 @@ def test_init_is_lazy(_mock_client):
     _mock_client.assert_not_called()
 
 
+def _data_object(id_: str) -> DataObject:
+    return DataObject(properties={"_original_id": id_, "content": f"Content {id_}"}, vector={}, uuid=None)
+
+
+def test_filter_documents_iter_paginates_with_keyset():
+    document_store = WeaviateDocumentStore()
+    document_store._collection = MagicMock()
+    document_store._collection.config.get.return_value.properties = [MagicMock(), MagicMock()]
+    document_store._collection.query.fetch_objects.side_effect = [
+        MagicMock(objects=[_data_object("a"), _data_object("b")]),
+        MagicMock(objects=[_data_object("c"), _data_object("d")]),
+        MagicMock(objects=[_data_object("e")]),
+    ]
+    filters = {"field": "content", "operator": "==", "value": "foo"}
+
+    result = list(document_store.filter_documents_iter(filters, batch_size=2, return_embedding=False))
+
+    assert [doc.id for doc in result] == ["a", "b", "c", "d", "e"]
+    calls = document_store._collection.query.fetch_objects.call_args_list
+    assert len(calls) == 3
+    assert all(call.kwargs["limit"] == 2 and call.kwargs["include_vector"] is False for call in calls)
+    assert calls[0].kwargs["filters"] == convert_filters(filters)
+    for call, last_id in zip(calls[1:], ["b", "d"]):
+        assert call.kwargs["filters"].filters == [
+            convert_filters(filters),
+            Filter.by_property("_original_id").greater_than(last_id),
+        ]
+    # The collection properties are fetched only once
+    document_store._collection.config.get.assert_called_once()
+
+
+def test_filter_documents_iter_drops_already_returned_objects():
+    document_store = WeaviateDocumentStore()
+    document_store._collection = MagicMock()
+    document_store._collection.query.fetch_objects.side_effect = [
+        MagicMock(objects=[_data_object("a"), _data_object("b")]),
+        MagicMock(objects=[_data_object("a"), _data_object("c")]),
+        MagicMock(objects=[_data_object("b"), _data_object("a")]),
+    ]
+    filters = {"field": "content", "operator": "==", "value": "foo"}
+
+    iterator = document_store.filter_documents_iter(filters, batch_size=2)
+    assert [next(iterator).id for _ in range(3)] == ["a", "b", "c"]
+    with pytest.raises(DocumentStoreError):
+        next(iterator)
+
+
+def test_filter_documents_iter_without_filters_uses_cursor():
+    document_store = WeaviateDocumentStore()
+    document_store._collection = MagicMock()
+    document_store._collection.iterator.return_value = iter([_data_object("a")])
+
+    assert [doc.id for doc in document_store.filter_documents_iter(batch_size=50)] == ["a"]
+    document_store._collection.iterator.assert_called_once_with(
+        include_vector=True, return_properties=document_store._collection_properties, cache_size=50
+    )
+
+
+@pytest.mark.asyncio
+async def test_close_async():
+    document_store = WeaviateDocumentStore()
+    async_client = MagicMock(close=AsyncMock())
+    document_store._async_client = async_client
+    document_store._async_collection = MagicMock()
+
+    await document_store.close_async()
+
+    async_client.close.assert_awaited_once()
+    assert document_store._async_client is None
+    assert document_store._async_collection is None
+    # closing again is a no-op
+    await document_store.close_async()
+    async_client.close.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_filter_documents_iter_async_paginates_with_keyset():
+    document_store = WeaviateDocumentStore()
+    document_store._async_collection = MagicMock()
+    document_store._async_collection.config.get = AsyncMock(return_value=MagicMock(properties=[]))
+    document_store._async_collection.query.fetch_objects = AsyncMock(
+        side_effect=[
+            MagicMock(objects=[_data_object("a"), _data_object("b")]),
+            MagicMock(objects=[_data_object("c")]),
+        ]
+    )
+    filters = {"field": "content", "operator": "==", "value": "foo"}
+
+    result = [doc async for doc in document_store.filter_documents_iter_async(filters, batch_size=2)]
+
+    assert [doc.id for doc in result] == ["a", "b", "c"]
+    calls = document_store._async_collection.query.fetch_objects.call_args_list
+    assert len(calls) == 2
+    assert calls[1].kwargs["filters"].filters == [
+        convert_filters(filters),
+        Filter.by_property("_original_id").greater_than("b"),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_write_documents_async_batches_insert_many():
+    document_store = WeaviateDocumentStore()
+    document_store._async_collection = MagicMock()
+    document_store._async_collection.data.insert_many = AsyncMock(return_value=MagicMock(errors={}))
+    docs = [Document(content=f"doc {i}") for i in range(1_500)]
+
+    assert await document_store.write_documents_async(docs, policy=DuplicatePolicy.OVERWRITE) == 1_500
+
+    calls = document_store._async_collection.data.insert_many.call_args_list
+    assert [len(call.args[0]) for call in calls] == [1_000, 500]
+
+
+def test_write_documents_skip_looks_up_existing_documents_per_batch():
+    document_store = WeaviateDocumentStore()
+    document_store._collection = MagicMock()
+    existing_doc, new_doc = Document(content="existing"), Document(content="new")
+    document_store._collection.query.fetch_objects.return_value = MagicMock(
+        objects=[MagicMock(uuid=UUID(generate_uuid5(existing_doc.id)))]
+    )
+    document_store._collection.data.insert_many.return_value = MagicMock(errors={})
+
+    written = document_store.write_documents([existing_doc, new_doc, new_doc], policy=DuplicatePolicy.SKIP)
+
+    assert written == 1
+    document_store._collection.query.fetch_objects.assert_called_once()
+    fetch_kwargs = document_store._collection.query.fetch_objects.call_args.kwargs
+    assert fetch_kwargs["limit"] == 3
+    assert fetch_kwargs["return_properties"] == []
+    inserted = document_store._collection.data.insert_many.call_args.args[0]
+    assert [obj.uuid for obj in inserted] == [generate_uuid5(new_doc.id)]
+
+
+def test_write_documents_fail_writes_new_documents_and_raises():
+    document_store = WeaviateDocumentStore()
+    document_store._collection = MagicMock()
+    existing_doc, new_doc = Document(content="existing"), Document(content="new")
+    document_store._collection.query.fetch_objects.return_value = MagicMock(
+        objects=[MagicMock(uuid=UUID(generate_uuid5(existing_doc.id)))]
+    )
+    document_store._collection.data.insert_many.return_value = MagicMock(errors={})
+
+    with pytest.raises(DuplicateDocumentError, match=existing_doc.id):
+        document_store.write_documents([existing_doc, new_doc], policy=DuplicatePolicy.FAIL)
+    document_store._collection.data.insert_many.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_write_documents_async_skip_looks_up_existing_documents_per_batch():
+    document_store = WeaviateDocumentStore()
+    document_store._async_collection = MagicMock()
+    docs = [Document(content=f"doc {i}") for i in range(1_500)]
+    document_store._async_collection.query.fetch_objects = AsyncMock(
+        return_value=MagicMock(objects=[MagicMock(uuid=UUID(generate_uuid5(docs[0].id)))])
+    )
+    document_store._async_collection.data.insert_many = AsyncMock(return_value=MagicMock(errors={}))
+
+    assert await document_store.write_documents_async(docs, policy=DuplicatePolicy.SKIP) == 1_499
+
+    assert document_store._async_collection.query.fetch_objects.await_count == 2
+    calls = document_store._async_collection.data.insert_many.call_args_list
+    assert [len(call.args[0]) for call in calls] == [999, 500]
+
+
+def test_vector_index_settings():
+    document_store = WeaviateDocumentStore(
+        collection_settings={"class": "Test", "vectorIndexConfig": {"distance": "dot"}},
+        quantization="bq",
+        rescore_limit=100,
+        ef=-1,
+        ef_construction=256,
+    )
+    settings = document_store._get_collection_create_settings()
+    assert settings["vectorIndexType"] == "hnsw"
+    assert settings["vectorIndexConfig"] == {
+        "distance": "dot",
+        "ef": -1,
+        "efConstruction": 256,
+        "bq": {"enabled": True, "rescoreLimit": 100},
+    }
+    # The collection settings are left untouched
+    assert "vectorIndexType" not in document_store._collection_settings
+
+    # Only the distance of the configured vector index is kept, the other keys can be specific to its type
+    document_store = WeaviateDocumentStore(
+        collection_settings={"class": "Test", "vectorIndexConfig": {"distance": "dot", "efConstruction": 128}},
+        vector_index_type="flat",
+    )
+    settings = document_store._get_collection_create_settings()
+    assert settings["vectorIndexType"] == "flat"
+    assert settings["vectorIndexConfig"]["distance"] == "dot"
+    assert "efConstruction" not in settings["vectorIndexConfig"]
+
+    document_store = WeaviateDocumentStore(vector_index_type="dynamic", quantization="pq")
+    settings = document_store._get_collection_create_settings()
+    assert settings["vectorIndexType"] == "dynamic"
+    assert settings["vectorIndexConfig"]["hnsw"]["pq"]["enabled"]
+    assert "bq" not in settings["vectorIndexConfig"]["flat"]
+
+    document_store = WeaviateDocumentStore()
+    assert document_store._get_collection_create_settings() == document_store._collection_settings
+
+
+def test_multi_tenancy_settings():
+    document_store = WeaviateDocumentStore(multi_tenancy=True, auto_tenant_creation=False)
+    settings = document_store._get_collection_create_settings()
+    assert settings["multiTenancyConfig"] == {
+        "enabled": True,
+        "autoTenantCreation": False,
+        "autoTenantActivation": True,
+    }
+    assert "multiTenancyConfig" not in document_store._collection_settings
+
+
+def test_write_documents_with_tenant_creates_the_tenant_once():
+    document_store = WeaviateDocumentStore(multi_tenancy=True)
+    document_store._collection = MagicMock()
+    document_store._collection.tenants.exists.return_value = False
+    tenant_collection = document_store._collection.with_tenant.return_value
+    tenant_collection.query.fetch_objects.return_value = MagicMock(objects=[])
+    tenant_collection.data.insert_many.return_value = MagicMock(errors={})
+
+    for _ in range(2):
+        document_store.write_documents([Document(content="test")], policy=DuplicatePolicy.SKIP, tenant="tenant_a")
+
+    document_store._collection.tenants.create.assert_called_once()
+    assert document_store._collection.tenants.create.call_args.args[0].name == "tenant_a"
+    document_store._collection.with_tenant.assert_called_with("tenant_a")
+    assert tenant_collection.data.insert_many.call_count == 2
+    document_store._collection.data.insert_many.assert_not_called()
+
+
+def test_filter_documents_with_tenant():
+    document_store = WeaviateDocumentStore(multi_tenancy=True)
+    document_store._collection = MagicMock()
+    tenant_collection = document_store._collection.with_tenant.return_value
+    tenant_collection.iterator.return_value = iter([_data_object("a")])
+
+    assert [doc.id for doc in document_store.filter_documents(tenant="tenant_a")] == ["a"]
+    document_store._collection.with_tenant.assert_called_once_with("tenant_a")
+    document_store._collection.iterator.assert_not_called()
+
+
+@pytest.mark.parametrize(
+    "params",
+    [
+        {"vector_index_type": "ivf"},
+        {"quantization": "rq"},
+        {"quantization": "pq", "rescore_limit": 100},
+        {"rescore_limit": 100},
+        {"vector_index_type": "flat", "quantization": "sq"},
+        {"vector_index_type": "flat", "ef": 64},
+    ],
+)
+def test_vector_index_settings_invalid(params):
+    with pytest.raises(ValueError):
+        WeaviateDocumentStore(**params)
+
+
 @pytest.mark.integration
 class TestWeaviateDocumentStore(CountDocumentsTest, WriteDocumentsTest, DeleteDocumentsTest, FilterDocumentsTest):
     @pytest.fixture
@@ -174,6 +439,9 @@ class TestWeaviateDocumentStore(CountDocumentsTest, WriteDocumentsTest, DeleteDo
                 trust_env=False,
                 proxies={"http": "http://proxy:1234"},
             ),
+            quantization="sq",
+            rescore_limit=200,
+            ef_construction=256,
         )
         assert document_store.to_dict() == {
             "type": "haystack_integrations.document_stores.weaviate.document_store.WeaviateDocumentStore",
@@ -183,7 +451,7 @@ class TestWeaviateDocumentStore(CountDocumentsTest, WriteDocumentsTest, DeleteDo
                     "class": "Default",
                     "invertedIndexConfig": {"indexNullState": True},
                     "properties": [
-                        {"name": "_original_id", "dataType": ["text"]},
+                        {"name": "_original_id", "dataType": ["text"], "tokenization": "field"},
                         {"name": "content", "dataType": ["text"]},
                         {"name": "blob_data", "dataType": ["blob"]},
                         {"name": "blob_mime_type", "dataType": ["text"]},
@@ -217,6 +485,14 @@ class TestWeaviateDocumentStore(CountDocumentsTest, WriteDocumentsTest, DeleteDo
                     "timeout": [30, 90],
                     "trust_env": False,
                 },
+                "vector_index_type": None,
+                "quantization": "sq",
+                "rescore_limit": 200,
+                "ef": None,
+                "ef_construction": 256,
+                "multi_tenancy": False,
+                "auto_tenant_creation": True,
+                "auto_tenant_activation": True,
             },
         }
 
@@ -255,6 +531,8 @@ class TestWeaviateDocumentStore(CountDocumentsTest, WriteDocumentsTest, DeleteDo
                         "timeout": [10, 60],
                         "trust_env": False,
                     },
+                    "vector_index_type": "flat",
+                    "quantization": "bq",
                 },
             }
         )
@@ -264,7 +542,7 @@ class TestWeaviateDocumentStore(CountDocumentsTest, WriteDocumentsTest, DeleteDo
             "class": "Default",
             "invertedIndexConfig": {"indexNullState": True},
             "properties": [
-                {"name": "_original_id", "dataType": ["text"]},
+                {"name": "_original_id", "dataType": ["text"], "tokenization": "field"},
                 {"name": "content", "dataType": ["text"]},
                 {"name": "blob_data", "dataType": ["blob"]},
                 {"name": "blob_mime_type", "dataType": ["text"]},
@@ -286,6 +564,8 @@ class TestWeaviateDocumentStore(CountDocumentsTest, WriteDocumentsTest, DeleteDo
         assert document_store._additional_config.connection.session_pool_connections == 20
         assert document_store._additional_config.connection.session_pool_maxsize == 20
         assert document_store._additional_config.connection.session_pool_timeout == 5
+        assert document_store._vector_index_type == "flat"
+        assert document_store._quantization == "bq"
 
     def test_to_data_object(self, document_store, test_files_path):
         doc = Document(content="test doc")
@@ -597,6 +877,72 @@ class TestWeaviateDocumentStore(CountDocumentsTest, WriteDocumentsTest, DeleteDo
         assert results[1].content == "Another document"
         assert results[1].score > 0.0
 
+    def test_collection_created_with_vector_index_config(self, request):
+        collection_settings = {"class": f"{request.node.name}", "properties": DOCUMENT_COLLECTION_PROPERTIES}
+        store = WeaviateDocumentStore(
+            url="http://localhost:8080",
+            collection_settings=collection_settings,
+            vector_index_type="flat",
+            quantization="bq",
+            rescore_limit=50,
+        )
+        try:
+            config = store.collection.config.get()
+            assert config.vector_index_type == VectorIndexType.FLAT
+            assert config.vector_index_config.quantizer.rescore_limit == 50
+        finally:
+            store.client.collections.delete(collection_settings["class"])
+
+    def test_multi_tenancy(self, request):
+        collection_settings = {"class": f"{request.node.name}", "properties": DOCUMENT_COLLECTION_PROPERTIES}
+        store = WeaviateDocumentStore(
+            url="http://localhost:8080", collection_settings=collection_settings, multi_tenancy=True
+        )
+        try:
+            doc_a, doc_b = Document(content="tenant a document"), Document(content="tenant b document")
+            store.write_documents([doc_a], tenant="tenant_a")
+            store.write_documents([doc_b], policy=DuplicatePolicy.SKIP, tenant="tenant_b")
+
+            assert store.count_documents(tenant="tenant_a") == 1
+            assert [doc.id for doc in store.filter_documents(tenant="tenant_b")] == [doc_b.id]
+            assert [doc.id for doc in store._bm25_retrieval("document", tenant="tenant_a")] == [doc_a.id]
+
+            store.delete_documents([doc_a.id], tenant="tenant_a")
+            assert store.count_documents(tenant="tenant_a") == 0
+            assert store.count_documents(tenant="tenant_b") == 1
+        finally:
+            store.client.collections.delete(collection_settings["class"])
+
+    def test_hybrid_retrieval(self, document_store):
+        docs = [
+            Document(content="Python is a programming language", embedding=[0.8, 0.8, 0.8, 1.0]),
+            Document(content="Java is a programming language", embedding=[1.0, 1.0, 1.0, 1.0]),
+            Document(content="Haskell is a functional language", embedding=[0.00001, 0.00001, 0.00001, 0.00002]),
+        ]
+        document_store.write_documents(docs)
+
+        # A pure keyword search
+        result = document_store._hybrid_retrieval("Python", query_embedding=[1.0, 1.0, 1.0, 1.0], alpha=0.0, top_k=1)
+        assert [doc.content for doc in result] == ["Python is a programming language"]
+        assert result[0].score > 0.0
+
+        # A pure vector search
+        result = document_store._hybrid_retrieval("Python", query_embedding=[1.0, 1.0, 1.0, 1.0], alpha=1.0, top_k=1)
+        assert [doc.content for doc in result] == ["Java is a programming language"]
+
+    def test_hybrid_retrieval_with_filters(self, document_store):
+        docs = [
+            Document(content="Python is a programming language", embedding=[0.8, 0.8, 0.8, 1.0]),
+            Document(content="Java is a programming language", embedding=[1.0, 1.0, 1.0, 1.0]),
+        ]
+        document_store.write_documents(docs)
+
+        filters = {"field": "content", "operator": "==", "value": "Python is a programming language"}
+        result = document_store._hybrid_retrieval(
+            "language", query_embedding=[1.0, 1.0, 1.0, 1.0], filters=filters, fusion_type=HybridFusion.RANKED
+        )
+        assert [doc.content for doc in result] == ["Python is a programming language"]
+
     def test_embedding_retrieval_with_distance(self, document_store):
         docs = [
             Document(content="The document", embedding=[1.0, 1.0, 1.0, 1.0]),
@@ -636,13 +982,30 @@ class TestWeaviateDocumentStore(CountDocumentsTest, WriteDocumentsTest, DeleteDo
 
         assert len(result) == 9998
 
-    def test_filter_documents_over_default_limit(self, document_store):
+    def test_filter_documents_over_query_maximum_results(self, document_store):
         docs = []
-        for index in range(10000):
+        for index in range(10001):
             docs.append(Document(content="This is some content", meta={"index": index}))
         document_store.write_documents(docs)
-        with pytest.raises(DocumentStoreError):
-            document_store.filter_documents({"field": "content", "operator": "==", "value": "This is some content"})
+        result = document_store.filter_documents(
+            {"field": "content", "operator": "==", "value": "This is some content"}
+        )
+
+        assert len(result) == 10001
+        assert len({doc.id for doc in result}) == 10001
+
+    def test_filter_documents_iter(self, document_store):
+        docs = [Document(content=f"Document {i}", meta={"number": i}, embedding=[0.1] * 4) for i in range(10)]
+        document_store.write_documents(docs)
+
+        result = list(
+            document_store.filter_documents_iter(
+                {"field": "meta.number", "operator": ">=", "value": 3}, batch_size=3, return_embedding=False
+            )
+        )
+
+        assert sorted(doc.meta["number"] for doc in result) == list(range(3, 10))
+        assert all(doc.embedding is None for doc in result)
 
     def test_schema_class_name_conversion_preserves_pascal_case(self):
         collection_settings = {"class": "CaseDocument"}
@@ -0,0 +1,84 @@
+# SPDX-FileCopyrightText: 2023-present deepset GmbH <info@deepset.ai>
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import pytest
+from haystack.dataclasses.document import Document
+from haystack.document_stores.errors import DuplicateDocumentError
+from haystack.document_stores.types import DuplicatePolicy
+
+from haystack_integrations.document_stores.weaviate.document_store import (
+    DOCUMENT_COLLECTION_PROPERTIES,
+    WeaviateDocumentStore,
+)
+
+
+@pytest.mark.integration
+class TestWeaviateDocumentStoreAsync:
+    @pytest.fixture
+    async def document_store(self, request) -> WeaviateDocumentStore:
+        # Use a different index for each test so we can run them in parallel
+        collection_settings = {
+            "class": f"{request.node.name}",
+            "invertedIndexConfig": {"indexNullState": True},
+            "properties": [*DOCUMENT_COLLECTION_PROPERTIES, {"name": "number", "dataType": ["int"]}],
+        }
+        store = WeaviateDocumentStore(url="http://localhost:8080", collection_settings=collection_settings)
+        yield store
+        store.client.collections.delete(collection_settings["class"])
+        await store.close_async()
+
+    async def test_write_documents_async(self, document_store):
+        docs = [Document(content="test doc 1", meta={"number": 1}), Document(content="test doc 2")]
+        assert await document_store.write_documents_async(docs) == 2
+        assert await document_store.count_documents_async() == 2
+
+        with pytest.raises(DuplicateDocumentError):
+            await document_store.write_documents_async(docs, policy=DuplicatePolicy.FAIL)
+        assert await document_store.write_documents_async(docs, policy=DuplicatePolicy.SKIP) == 0
+
+    async def test_filter_documents_async(self, document_store):
+        docs = [Document(content=f"doc {i}", meta={"number": i}) for i in range(5)]
+        await document_store.write_documents_async(docs)
+
+        result = await document_store.filter_documents_async(
+            filters={"field": "meta.number", "operator": ">=", "value": 3}
+        )
+        assert sorted(doc.id for doc in result) == sorted(doc.id for doc in docs[3:])
+
+        result = [doc async for doc in document_store.filter_documents_iter_async(batch_size=2)]
+        assert sorted(doc.id for doc in result) == sorted(doc.id for doc in docs)
+
+    async def test_delete_documents_async(self, document_store):
+        doc = Document(content="test doc")
+        await document_store.write_documents_async([doc])
+        assert await document_store.count_documents_async() == 1
+
+        await document_store.delete_documents_async([doc.id])
+        assert await document_store.count_documents_async() == 0
+
+    async def test_bm25_retrieval_async(self, document_store):
+        docs = [
+            Document(content="Python is a popular programming language"),
+            Document(content="Java is a popular programming language"),
+            Document(content="Rust is a systems programming language"),
+        ]
+        await document_store.write_documents_async(docs)
+
+        result = await document_store._bm25_retrieval_async("Python", top_k=1)
+        assert len(result) == 1
+        assert result[0].content == "Python is a popular programming language"
+        assert result[0].score > 0.0
+
+    async def test_embedding_retrieval_async(self, document_store):
+        docs = [
+            Document(content="The document", embedding=[1.0, 1.0, 1.0, 1.0]),
+            Document(content="Another document", embedding=[0.8, 0.8, 0.8, 1.0]),
+            Document(content="Yet another document", embedding=[0.00001, 0.00001, 0.00001, 0.00002]),
+        ]
+        await document_store.write_documents_async(docs)
+
+        result = await document_store._embedding_retrieval_async(query_embedding=[1.0, 1.0, 1.0, 1.0], top_k=2)
+        assert len(result) == 2
+        assert result[0].content == "The document"
+        assert result[0].score > result[1].score
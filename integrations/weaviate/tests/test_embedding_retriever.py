@@ -5,6 +5,7 @@
 from unittest.mock import Mock, patch
 
 import pytest
+from haystack.dataclasses import Document
 from haystack.document_stores.types import FilterPolicy
 
 from haystack_integrations.components.retrievers.weaviate import WeaviateEmbeddingRetriever
@@ -54,7 +55,7 @@ def test_to_dict(_mock_weaviate):
                         "class": "Default",
                         "invertedIndexConfig": {"indexNullState": True},
                         "properties": [
-                            {"name": "_original_id", "dataType": ["text"]},
+                            {"name": "_original_id", "dataType": ["text"], "tokenization": "field"},
                             {"name": "content", "dataType": ["text"]},
                             {"name": "blob_data", "dataType": ["blob"]},
                             {"name": "blob_mime_type", "dataType": ["text"]},
@@ -65,6 +66,14 @@ def test_to_dict(_mock_weaviate):
                     "additional_headers": None,
                     "embedded_options": None,
                     "additional_config": None,
+                    "vector_index_type": None,
+                    "quantization": None,
+                    "rescore_limit": None,
+                    "ef": None,
+                    "ef_construction": None,
+                    "multi_tenancy": False,
+                    "auto_tenant_creation": True,
+                    "auto_tenant_activation": True,
                 },
             },
         },
@@ -162,5 +171,25 @@ def test_run(mock_document_store):
     filters = {"field": "content", "operator": "==", "value": "Some text"}
     retriever.run(query_embedding=query_embedding, filters=filters, top_k=5, distance=0.1)
     mock_document_store._embedding_retrieval.assert_called_once_with(
-        query_embedding=query_embedding, filters=filters, top_k=5, distance=0.1, certainty=None
+        query_embedding=query_embedding, filters=filters, top_k=5, distance=0.1, certainty=None, tenant=None
     )
+
+
+@pytest.mark.asyncio
+async def test_run_async():
+    mock_document_store = Mock(spec=WeaviateDocumentStore)
+    mock_document_store._embedding_retrieval_async.return_value = [Document(content="test document")]
+    retriever = WeaviateEmbeddingRetriever(document_store=mock_document_store, certainty=0.8)
+    query_embedding = [0.1, 0.1, 0.1, 0.1]
+    res = await retriever.run_async(query_embedding=query_embedding, top_k=5, tenant="tenant_a")
+    mock_document_store._embedding_retrieval_async.assert_called_once_with(
+        query_embedding=query_embedding, filters={}, top_k=5, distance=None, certainty=0.8, tenant="tenant_a"
+    )
+    assert res["documents"][0].content == "test document"
+
+
+@pytest.mark.asyncio
+async def test_run_async_distance_and_certainty():
+    retriever = WeaviateEmbeddingRetriever(document_store=Mock(spec=WeaviateDocumentStore))
+    with pytest.raises(ValueError):
+        await retriever.run_async(query_embedding=[0.1, 0.1], distance=0.1, certainty=0.8)
@@ -0,0 +1,145 @@
+# SPDX-FileCopyrightText: 2023-present deepset GmbH <info@deepset.ai>
+#
+# SPDX-License-Identifier: Apache-2.0
+
+from unittest.mock import Mock, patch
+
+import pytest
+from haystack.dataclasses import Document
+from haystack.document_stores.types import FilterPolicy
+from weaviate.collections.classes.grpc import HybridFusion
+
+from haystack_integrations.components.retrievers.weaviate import WeaviateHybridRetriever
+from haystack_integrations.document_stores.weaviate import WeaviateDocumentStore
+
+
+def test_init_default():
+    mock_document_store = Mock(spec=WeaviateDocumentStore)
+    retriever = WeaviateHybridRetriever(document_store=mock_document_store)
+    assert retriever._document_store == mock_document_store
+    assert retriever._filters == {}
+    assert retriever._top_k == 10
+    assert retriever._alpha is None
+    assert retriever._fusion_type is None
+    assert retriever._max_vector_distance is None
+    assert retriever._filter_policy == FilterPolicy.REPLACE
+
+    retriever = WeaviateHybridRetriever(document_store=mock_document_store, fusion_type="FUSION_TYPE_RANKED")
+    assert retriever._fusion_type == HybridFusion.RANKED
+
+    with pytest.raises(ValueError):
+        WeaviateHybridRetriever(document_store=mock_document_store, filter_policy="keep_all")
+
+
+def test_init_with_invalid_parameters():
+    mock_document_store = Mock(spec=WeaviateDocumentStore)
+    with pytest.raises(ValueError):
+        WeaviateHybridRetriever(document_store=mock_document_store, alpha=1.5)
+    with pytest.raises(ValueError):
+        WeaviateHybridRetriever(document_store=mock_document_store, fusion_type="unknown")
+
+
+@pytest.mark.parametrize(
+    "fusion_type, expected",
+    [
+        ("ranked", HybridFusion.RANKED),
+        ("Relative_Score", HybridFusion.RELATIVE_SCORE),
+        ("FUSION_TYPE_RELATIVE_SCORE", HybridFusion.RELATIVE_SCORE),
+        (HybridFusion.RANKED, HybridFusion.RANKED),
+    ],
+)
+def test_init_fusion_type(fusion_type, expected):
+    retriever = WeaviateHybridRetriever(document_store=Mock(spec=WeaviateDocumentStore), fusion_type=fusion_type)
+    assert retriever._fusion_type == expected
+
+
+def test_init_invalid_fusion_type_lists_accepted_values():
+    with pytest.raises(ValueError, match=r"ranked.*relative_score.*FUSION_TYPE_RANKED"):
+        WeaviateHybridRetriever(document_store=Mock(spec=WeaviateDocumentStore), fusion_type="unknown")
+
+
+@patch("haystack_integrations.document_stores.weaviate.document_store.weaviate")
+def test_to_dict(_mock_weaviate):
+    document_store = WeaviateDocumentStore()
+    retriever = WeaviateHybridRetriever(
+        document_store=document_store, alpha=0.3, fusion_type=HybridFusion.RELATIVE_SCORE, max_vector_distance=0.5
+    )
+    assert retriever.to_dict() == {
+        "type": "haystack_integrations.components.retrievers.weaviate.hybrid_retriever.WeaviateHybridRetriever",
+        "init_parameters": {
+            "filters": {},
+            "top_k": 10,
+            "alpha": 0.3,
+            "fusion_type": "FUSION_TYPE_RELATIVE_SCORE",
+            "max_vector_distance": 0.5,
+            "filter_policy": "replace",
+            "document_store": document_store.to_dict(),
+        },
+    }
+
+
+@patch("haystack_integrations.document_stores.weaviate.document_store.weaviate")
+def test_from_dict(_mock_weaviate):
+    retriever = WeaviateHybridRetriever.from_dict(
+        {
+            "type": "haystack_integrations.components.retrievers.weaviate.hybrid_retriever.WeaviateHybridRetriever",
+            "init_parameters": {
+                "filters": {},
+                "top_k": 5,
+                "alpha": 0.3,
+                "fusion_type": "FUSION_TYPE_RELATIVE_SCORE",
+                "max_vector_distance": 0.5,
+                "filter_policy": "merge",
+                "document_store": {
+                    "type": "haystack_integrations.document_stores.weaviate.document_store.WeaviateDocumentStore",
+                    "init_parameters": {"url": None},
+                },
+            },
+        }
+    )
+    assert retriever._document_store
+    assert retriever._top_k == 5
+    assert retriever._alpha == 0.3
+    assert retriever._fusion_type == HybridFusion.RELATIVE_SCORE
+    assert retriever._max_vector_distance == 0.5
+    assert retriever._filter_policy == FilterPolicy.MERGE
+
+
+def test_run():
+    mock_document_store = Mock(spec=WeaviateDocumentStore)
+    mock_document_store._hybrid_retrieval.return_value = [Document(content="test document")]
+    retriever = WeaviateHybridRetriever(document_store=mock_document_store, alpha=0.3)
+    filters = {"field": "content", "operator": "==", "value": "Some text"}
+    res = retriever.run(query="some query", query_embedding=[0.1, 0.1], filters=filters, top_k=5)
+    mock_document_store._hybrid_retrieval.assert_called_once_with(
+        query="some query",
+        query_embedding=[0.1, 0.1],
+        filters=filters,
+        top_k=5,
+        alpha=0.3,
+        fusion_type=None,
+        max_vector_distance=None,
+        tenant=None,
+    )
+    assert res["documents"][0].content == "test document"
+
+
+@pytest.mark.asyncio
+async def test_run_async():
+    mock_document_store = Mock(spec=WeaviateDocumentStore)
+    mock_document_store._hybrid_retrieval_async.return_value = [Document(content="test document")]
+    retriever = WeaviateHybridRetriever(
+        document_store=mock_document_store, filters={"some": "filter"}, fusion_type=HybridFusion.RANKED
+    )
+    res = await retriever.run_async(query="some query", query_embedding=[0.1, 0.1], tenant="tenant_a")
+    mock_document_store._hybrid_retrieval_async.assert_called_once_with(
+        query="some query",
+        query_embedding=[0.1, 0.1],
+        filters={"some": "filter"},
+        top_k=10,
+        alpha=None,
+        fusion_type=HybridFusion.RANKED,
+        max_vector_distance=None,
+        tenant="tenant_a",
+    )
+    assert res["documents"][0].content == "test document"